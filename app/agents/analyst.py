@@ -211,14 +211,11 @@ class AnalystAgent:
                 charts=len(charts)
             )
             
-            # Update progress: Analyst complete (50%)
-            if "db_service" in state["metadata"] and "job_id" in state["metadata"]:
-                try:
-                    await state["metadata"]["db_service"].update_session_status(
-                        state["metadata"]["job_id"], "processing", 50
-                    )
-                except Exception as e:
-                    logger.warning("progress_update_failed", error=str(e))
+            # Update progress: Analyst complete (50%), off the critical path
+            if "job_id" in state["metadata"]:
+                self.db.update_session_progress_background(
+                    state["metadata"]["job_id"], 50
+                )
             
             return state
             
@@ -426,403 +426,6 @@ Your task is to conduct **investment-grade geopolitical risk analysis** with qua
 **OUTPUT MUST BE**: Investment committee-ready country risk analysis suitable for capital allocation decisions.
 """
 
-REGULATORY_RISK_MATRIX_PROMPT = """
-You are a **Risk Management Partner at Deloitte** creating comprehensive regulatory risk matrices.
-
-Your task is to build **investment-grade risk matrices** with probability-impact scoring, heat maps, and mitigation strategies.
-
-===== STRATEGY =====
-{strategy}
-
-===== REGULATORY FINDINGS =====
-
-**FDI Analysis:**
-{fdi}
-
-**Tax Analysis:**
-{tax}
-
-**Trade Barriers:**
-{trade}
-
-**Labor Regulations:**
-{labor}
-
-**Geopolitical Assessment:**
-{geopolitical}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## RISK SCORING METHODOLOGY
-
-### PROBABILITY SCALE (1-5)
-- **1 (Very Low)**: <10% chance in next 3 years
-- **2 (Low)**: 10-30% chance
-- **3 (Medium)**: 30-50% chance
-- **4 (High)**: 50-70% chance
-- **5 (Very High)**: >70% chance
-
-### IMPACT SCALE (1-5)
-- **1 (Minimal)**: <$1M impact or <1 month delay
-- **2 (Low)**: $1-5M impact or 1-3 month delay
-- **3 (Medium)**: $5-20M impact or 3-6 month delay
-- **4 (High)**: $20-50M impact or 6-12 month delay
-- **5 (Critical)**: >$50M impact or >12 month delay / strategy blocker
-
-### RISK SCORE = Probability * Impact (1-25)
-- **1-6**: Low Risk (monitor)
-- **7-12**: Medium Risk (manage actively)
-- **13-20**: High Risk (mitigation required)
-- **21-25**: Critical Risk (may block strategy)
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## REQUIRED OUTPUT
-
-**OUTPUT FORMAT**: Return ONLY valid JSON:
-
-{{
-  "risk_matrix": {{
-    "risks": [
-      {{
-        "risk_id": "R001",
-        "risk": "Specific risk description",
-        "category": "fdi/tax/trade/labor/geopolitical/operational/legal",
-        "probability": {{
-          "score": int (1-5),
-          "rating": "very_low/low/medium/high/very_high",
-          "rationale": "Why this probability",
-          "indicators": ["Leading indicator 1", "Leading indicator 2"]
-        }},
-        "impact": {{
-          "score": int (1-5),
-          "rating": "minimal/low/medium/high/critical",
-          "financial_impact_usd": "Range or 'Unknown'",
-          "timeline_impact_months": int,
-          "strategic_impact": "Description"
-        }},
-        "risk_score": int (1-25),
-        "risk_level": "low/medium/high/critical",
-        "velocity": "slow/moderate/fast",
-        "detectability": "easy/moderate/hard",
-        "mitigation_strategy": {{
-          "approach": "avoid/transfer/mitigate/accept",
-          "specific_actions": [
-            {{
-              "action": "Specific mitigation action",
-              "owner": "Who is responsible",
-              "timeline": "When to implement",
-              "cost_usd": "Range or 'Unknown'",
-              "effectiveness": "high/medium/low"
-            }}
-          ],
-          "residual_risk_score": int (1-25),
-          "risk_reduction_pct": float
-        }},
-        "contingency_plan": "What to do if risk materializes",
-        "monitoring_kpis": ["KPI 1", "KPI 2"]
-      }}
-    ],
-    "risk_summary": {{
-      "total_risks_identified": int,
-      "critical_risks_count": int,
-      "high_risks_count": int,
-      "medium_risks_count": int,
-      "low_risks_count": int
-    }}
-  }},
-  
-  "risk_heatmap_data": {{
-    "matrix": [
-      {{
-        "probability": int (1-5),
-        "impact": int (1-5),
-        "risk_ids": ["R001", "R002"],
-        "count": int
-      }}
-    ],
-    "concentration_analysis": "Where risks are concentrated"
-  }},
-  
-  "aggregate_risk_assessment": {{
-    "overall_risk_score": int (1-100),
-    "overall_risk_level": "low/medium/high/critical",
-    "risk_appetite_alignment": "within/exceeds/significantly_exceeds",
-    "key_risk_drivers": ["Driver 1", "Driver 2", "Driver 3"],
-    "risk_correlation": "Are risks independent or correlated?",
-    "compound_risk_scenarios": [
-      {{
-        "scenario": "If multiple risks materialize",
-        "combined_impact": "Description",
-        "probability": 0.0-1.0
-      }}
-    ]
-  }},
-  
-  "mitigation_roadmap": {{
-    "immediate_actions": [
-      {{
-        "action": "Action description",
-        "target_risks": ["R001", "R002"],
-        "timeline": "0-3 months",
-        "priority": "critical/high/medium",
-        "estimated_cost_usd": "Range"
-      }}
-    ],
-    "near_term_actions": [...],
-    "long_term_actions": [...],
-    "total_mitigation_cost_usd": "Range",
-    "expected_risk_reduction": "X% reduction in overall risk score"
-  }},
-  
-  "risk_monitoring_framework": {{
-    "review_frequency": "monthly/quarterly/semi_annually",
-    "escalation_triggers": [
-      {{
-        "trigger": "Condition that requires escalation",
-        "action": "What to do",
-        "escalation_level": "management/board/crisis_committee"
-      }}
-    ],
-    "reporting_requirements": ["Requirement 1", "Requirement 2"]
-  }},
-  
-  "executive_summary": {{
-    "key_insight": "One-sentence risk summary",
-    "top_3_risks": ["Risk 1", "Risk 2", "Risk 3"],
-    "overall_feasibility": "high/medium/low",
-    "go_no_go_recommendation": "proceed/proceed_with_conditions/reconsider/decline",
-    "conditions_for_proceed": ["Condition 1 if conditional"],
-    "estimated_total_risk_cost_usd": "Range (mitigation + potential losses)"
-  }}
-}}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## QUALITY STANDARDS
-
-✓ **COMPREHENSIVE**: Cover all regulatory risk dimensions
-✓ **QUANTIFIED**: Score probability and impact numerically
-✓ **PRIORITIZED**: Rank risks by severity
-✓ **MITIGATED**: Provide specific mitigation strategies
-✓ **MONITORED**: Define KPIs and escalation triggers
-✓ **ACTIONABLE**: Clear roadmap for risk management
-
-**OUTPUT MUST BE**: Board-ready risk matrix suitable for investment committee decisions.
-"""
-
-LEGAL_STRUCTURE_PROMPT = """
-You are a **Corporate Structuring Partner at Clifford Chance** advising on optimal legal entity selection.
-
-Your task is to recommend **investment-grade legal structures** with tax optimization, liability protection, and operational flexibility analysis.
-
-===== COMPANY & STRATEGY =====
-Company: {company}
-Strategy: {strategy}
-
-===== REGULATORY ANALYSIS =====
-{regulatory_summary}
-
-===== BUSINESS REQUIREMENTS =====
-{business_requirements}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## STRUCTURING FRAMEWORK
-
-### ENTITY OPTIONS
-
-**1. Wholly-Owned Subsidiary (WOS)**
-- Full control, full liability protection
-- Higher setup cost, full compliance burden
-- Best for: Long-term commitment, full control needed
-
-**2. Joint Venture (JV)**
-- Shared control, local expertise
-- Partner risk, profit sharing
-- Best for: Restricted sectors, local knowledge critical
-
-**3. Branch Office**
-- Direct extension, no separate entity
-- Lower setup cost, unlimited liability
-- Best for: Testing market, temporary operations
-
-**4. Representative Office**
-- Limited activities, no revenue generation
-- Lowest cost, restricted operations
-- Best for: Market research, liaison activities
-
-**5. Licensing/Franchising**
-- Minimal investment, royalty income
-- Limited control, brand risk
-- Best for: Asset-light expansion, proven model
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## REQUIRED OUTPUT
-
-**OUTPUT FORMAT**: Return ONLY valid JSON:
-
-{{
-  "recommended_structure": {{
-    "entity_type": "wholly_owned_subsidiary/joint_venture/branch/representative_office/licensing",
-    "rationale": "2-3 sentence explanation of why this is optimal",
-    "confidence": 0.0-1.0,
-    "key_decision_factors": ["Factor 1", "Factor 2", "Factor 3"]
-  }},
-  
-  "structure_analysis": {{
-    "control": {{
-      "level": "full/majority/shared/limited/none",
-      "decision_making": "autonomous/requires_approval/shared",
-      "operational_flexibility": "high/medium/low",
-      "strategic_alignment": "excellent/good/moderate/poor"
-    }},
-    "liability_protection": {{
-      "parent_company_exposure": "none/limited/full",
-      "asset_protection": "strong/moderate/weak",
-      "legal_separation": "complete/partial/none",
-      "risk_assessment": "low/medium/high"
-    }},
-    "tax_efficiency": {{
-      "effective_tax_rate_pct": float,
-      "withholding_tax_on_dividends_pct": float,
-      "withholding_tax_on_royalties_pct": float,
-      "tax_treaty_benefits": ["Benefit 1", "Benefit 2"],
-      "transfer_pricing_complexity": "low/medium/high",
-      "repatriation_efficiency": "easy/moderate/difficult",
-      "tax_optimization_score": int (1-10)
-    }},
-    "operational_considerations": {{
-      "ease_of_setup": "easy/moderate/complex",
-      "setup_timeline_months": "Range",
-      "ongoing_compliance_burden": "low/medium/high",
-      "local_hiring_requirements": "Description",
-      "operational_restrictions": ["Restriction 1 if any"]
-    }},
-    "exit_strategy": {{
-      "ease_of_exit": "easy/moderate/difficult",
-      "asset_liquidation": "straightforward/complex/restricted",
-      "timeline_to_exit_months": "Range",
-      "exit_costs_usd": "Range or 'Unknown'",
-      "restrictions": ["Restriction 1 if any"]
-    }}
-  }},
-  
-  "financial_analysis": {{
-    "setup_costs": {{
-      "legal_fees_usd": "Range",
-      "registration_fees_usd": "Range",
-      "capital_requirements_usd": "Minimum required",
-      "professional_fees_usd": "Range",
-      "total_setup_cost_usd": "Range",
-      "timeline_to_operational": "X-Y months"
-    }},
-    "ongoing_costs_annual": {{
-      "compliance_costs_usd": "Range",
-      "audit_fees_usd": "Range",
-      "legal_fees_usd": "Range",
-      "tax_filing_fees_usd": "Range",
-      "total_annual_cost_usd": "Range"
-    }},
-    "cost_benefit_analysis": {{
-      "npv_of_structure_usd": float,
-      "payback_period_years": float,
-      "vs_alternative_structures": "X% more/less expensive than JV"
-    }}
-  }},
-  
-  "alternative_structures": [
-    {{
-      "structure": "Alternative entity type",
-      "pros": ["Pro 1", "Pro 2", "Pro 3"],
-      "cons": ["Con 1", "Con 2"],
-      "when_to_consider": "Scenario where this is better",
-      "cost_comparison": "X% more/less expensive",
-      "suitability_score": int (1-10)
-    }}
-  ],
-  
-  "hybrid_structures": [
-    {{
-      "structure": "Combination approach (e.g., 'WOS + Licensing')",
-      "description": "How this works",
-      "advantages": ["Advantage 1", "Advantage 2"],
-      "complexity": "low/medium/high",
-      "when_optimal": "Scenario"
-    }}
-  ],
-  
-  "implementation_roadmap": {{
-    "phase_1_preparation": {{
-      "duration_months": float,
-      "key_activities": ["Activity 1", "Activity 2"],
-      "deliverables": ["Deliverable 1", "Deliverable 2"],
-      "estimated_cost_usd": "Range"
-    }},
-    "phase_2_registration": {{
-      "duration_months": float,
-      "key_activities": [...],
-      "deliverables": [...],
-      "estimated_cost_usd": "Range"
-    }},
-    "phase_3_operationalization": {{
-      "duration_months": float,
-      "key_activities": [...],
-      "deliverables": [...],
-      "estimated_cost_usd": "Range"
-    }},
-    "total_timeline_months": "Range",
-    "critical_path_items": ["Item 1", "Item 2"]
-  }},
-  
-  "ongoing_compliance_requirements": [
-    {{
-      "requirement": "Specific obligation",
-      "frequency": "annual/quarterly/monthly/one-time",
-      "responsible_party": "Who handles this",
-      "cost_usd": "Range or 'Included in annual costs'",
-      "penalty_for_non_compliance": "Description",
-      "complexity": "low/medium/high"
-    }}
-  ],
-  
-  "risk_factors": [
-    {{
-      "risk": "Specific risk with this structure",
-      "probability": "high/medium/low",
-      "impact": "high/medium/low",
-      "mitigation": "How to address",
-      "residual_risk": "high/medium/low"
-    }}
-  ],
-  
-  "executive_summary": {{
-    "recommended_structure": "Entity type",
-    "key_advantages": ["Advantage 1", "Advantage 2", "Advantage 3"],
-    "key_trade_offs": ["Trade-off 1", "Trade-off 2"],
-    "total_setup_cost_usd": "Range",
-    "total_timeline_months": "Range",
-    "suitability_score": int (1-10),
-    "confidence_level": 0.0-1.0,
-    "next_steps": ["Step 1", "Step 2", "Step 3"]
-  }}
-}}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## QUALITY STANDARDS
-
-✓ **MULTI-DIMENSIONAL**: Analyze control, liability, tax, operations, exit
-✓ **COST-MODELED**: Provide detailed cost estimates
-✓ **COMPARATIVE**: Evaluate multiple structure options
-✓ **TAX-OPTIMIZED**: Consider tax efficiency and treaty benefits
-✓ **IMPLEMENTATION-READY**: Provide detailed roadmap
-✓ **RISK-AWARE**: Identify and mitigate structural risks
-
-**OUTPUT MUST BE**: Legal opinion-ready entity structuring analysis suitable for board approval.
-"""
-
 SECTOR_REGULATIONS_PROMPT = """
 You are a **Sector Specialist at PwC** analyzing industry-specific regulations and compliance requirements.
 
@@ -1109,160 +712,6 @@ Provide risk assessment with overall risk level and key factors.
 }}
 """
 
-REGULATORY_RISK_MATRIX_PROMPT = """
-You are a risk management consultant creating a comprehensive risk matrix.
-
-===== STRATEGY =====
-{strategy}
-
-===== REGULATORY FINDINGS =====
-
-**FDI Analysis:**
-{fdi}
-
-**Tax Analysis:**
-{tax}
-
-**Trade Barriers:**
-{trade}
-
-**Labor Regulations:**
-{labor}
-
-**Geopolitical Assessment:**
-{geopolitical}
-
-===== TASK =====
-Create a comprehensive regulatory risk matrix.
-
-For EACH significant risk:
-
-1. **Risk Description**: Clear, specific description
-2. **Probability** (1-5):
-   - 1 = Very Low (<10%)
-   - 2 = Low (10-30%)
-   - 3 = Medium (30-50%)
-   - 4 = High (50-70%)
-   - 5 = Very High (>70%)
-
-3. **Impact** (1-5):
-   - 1 = Minimal (minor delay/cost)
-   - 2 = Low (manageable)
-   - 3 = Medium (significant but not critical)
-   - 4 = High (major impact)
-   - 5 = Critical (strategy blocker)
-
-4. **Risk Score** = Probability * Impact
-
-5. **Mitigation Strategy**: How to reduce or manage the risk
-
-**Risk Classification**:
-- 1-6: Low risk
-- 7-12: Medium risk
-- 13-20: High risk
-- 21-25: Critical risk
-
-**Overall Assessment**: Classify total regulatory risk as Low / Medium / High / Critical
-
-**OUTPUT FORMAT**: Return ONLY valid JSON:
-
-{{
-  "risks": [
-    {{
-      "risk": "Risk description",
-      "category": "fdi/tax/trade/labor/geopolitical",
-      "probability": int (1-5),
-      "impact": int (1-5),
-      "score": int,
-      "mitigation": "Mitigation strategy"
-    }}
-  ],
-  "total_risk_score": int,
-  "risk_level": "low/medium/high/critical",
-  "critical_risks": ["risk1", "risk2"]
-}}
-"""
-
-LEGAL_STRUCTURE_PROMPT = """
-You are a corporate structuring advisor recommending optimal legal entity.
-
-===== COMPANY & STRATEGY =====
-Company: {company}
-Strategy: {strategy}
-
-===== REGULATORY ANALYSIS =====
-{regulatory_summary}
-
-===== BUSINESS REQUIREMENTS =====
-{business_requirements}
-
-===== TASK =====
-Recommend the optimal legal structure considering:
-
-**1. Control Requirements**
-- Need for full operational control
-- Decision-making autonomy
-
-**2. Liability Protection**
-- Limited liability vs unlimited
-- Asset protection
-
-**3. Tax Efficiency**
-- Effective tax rate
-- Repatriation ease
-- Treaty benefits
-
-**4. Operational Flexibility**
-- Ease of operations
-- Regulatory compliance burden
-
-**5. Exit Strategy**
-- Ease of exit
-- Asset liquidation
-
-**STRUCTURE OPTIONS**:
-
-1. **Wholly-Owned Subsidiary**
-   - Full control, full liability protection
-   - Higher setup cost, full compliance burden
-
-2. **Joint Venture (Local Partner)**
-   - Shared control, local expertise
-   - Partner risk, profit sharing
-
-3. **Branch Office**
-   - Direct extension, no separate entity
-   - Lower setup cost, unlimited liability
-
-4. **Representative Office**
-   - Limited activities, no revenue generation
-   - Lowest cost, restricted operations
-
-5. **Licensing/Franchising**
-   - Minimal investment, royalty income
-   - Limited control, brand risk
-
-Recommend structure with clear rationale, pros/cons, timeline, and costs.
-
-**OUTPUT FORMAT**: Return ONLY valid JSON:
-
-{{
-  "recommended_structure": "structure name",
-  "rationale": "2-3 sentence explanation",
-  "pros": ["pro1", "pro2", "pro3"],
-  "cons": ["con1", "con2"],
-  "alternatives": [
-    {{
-      "structure": "alternative name",
-      "when_to_consider": "scenario"
-    }}
-  ],
-  "setup_timeline": "X-Y months",
-  "estimated_cost": "$X-$Y",
-  "ongoing_compliance": ["requirement1", "requirement2"]
-}}
-"""
-
 SECTOR_REGULATIONS_PROMPT = """
 Analyze sector-specific regulations for {industry} in {country}.
 
@@ -1307,3 +756,85 @@ Identify:
   "time_to_obtain_licenses": "X months"
 }}
 """
+
+RISK_AND_STRUCTURE_PROMPT = """
+You are a risk management consultant and corporate structuring advisor.
+Produce a regulatory risk matrix AND a legal structure recommendation in one response.
+
+===== COMPANY & STRATEGY =====
+Company: {company}
+Strategy: {strategy}
+
+===== REGULATORY FINDINGS =====
+
+**FDI Analysis:**
+{fdi}
+
+**Tax Analysis:**
+{tax}
+
+**Trade Barriers:**
+{trade}
+
+**Labor Regulations:**
+{labor}
+
+**Geopolitical Assessment:**
+{geopolitical}
+
+===== BUSINESS REQUIREMENTS =====
+{business_requirements}
+
+===== TASK 1: RISK MATRIX =====
+For EACH significant risk provide:
+
+1. **Risk Description**: Clear, specific description
+2. **Probability** (1-5): 1 = Very Low (<10%) ... 5 = Very High (>70%)
+3. **Impact** (1-5): 1 = Minimal ... 5 = Critical (strategy blocker)
+4. **Risk Score** = Probability * Impact
+5. **Mitigation Strategy**: How to reduce or manage the risk
+
+**Risk Classification**: 1-6 Low, 7-12 Medium, 13-20 High, 21-25 Critical
+
+===== TASK 2: LEGAL STRUCTURE =====
+Recommend the optimal legal structure considering control requirements,
+liability protection, tax efficiency, operational flexibility and exit strategy.
+
+**STRUCTURE OPTIONS**: Wholly-Owned Subsidiary, Joint Venture (Local Partner),
+Branch Office, Representative Office, Licensing/Franchising.
+
+**OUTPUT FORMAT**: Return ONLY valid JSON:
+
+{{
+  "risk_matrix": {{
+    "risks": [
+      {{
+        "risk": "Risk description",
+        "category": "fdi/tax/trade/labor/geopolitical",
+        "probability": int (1-5),
+        "impact": int (1-5),
+        "score": int,
+        "mitigation": "Mitigation strategy"
+      }}
+    ],
+    "total_risk_score": int,
+    "risk_level": "low/medium/high/critical",
+    "critical_risks": ["risk1", "risk2"]
+  }},
+  "legal_structure": {{
+    "recommended_structure": "structure name",
+    "rationale": "2-3 sentence explanation",
+    "pros": ["pro1", "pro2", "pro3"],
+    "cons": ["con1", "con2"],
+    "alternatives": [
+      {{
+        "structure": "alternative name",
+        "when_to_consider": "scenario"
+      }}
+    ],
+    "setup_timeline": "X-Y months",
+    "estimated_cost": "$X-$Y",
+    "ongoing_compliance": ["requirement1", "requirement2"]
+  }}
+}}
+"""
@@ -4,6 +4,8 @@ Designed to match McKinsey, BCG, and Bain & Company standards.
 Incorporates source validation, confidence intervals, and MECE principles.
 """
 
+from app.utils.doc_utils import compile_prompt
+
 CONSOLIDATE_RESEARCH_PROMPT = """
 You are a **Senior Research Analyst at McKinsey & Company** with 15+ years of experience in strategic research and due diligence.
 
@@ -254,6 +256,52 @@ Apply **rigorous analytical standards**:
 **QUALITY STANDARD**: This research must be **client-ready** and **board-presentable**.
 """
 
+# JSON schema for the consolidated research report. Nested fields are
+# spelled out in the prompt above; the schema pins the top-level contract.
+CONSOLIDATE_RESEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "executive_summary": {
+            "type": "object",
+            "properties": {
+                "key_insight": {"type": "string"},
+                "confidence_level": {"type": "number", "minimum": 0, "maximum": 1},
+                "data_quality_score": {"type": "number", "minimum": 0, "maximum": 1},
+                "critical_gaps": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["key_insight", "confidence_level"]
+        },
+        "key_findings": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "finding": {"type": "string"},
+                    "category": {"type": "string"},
+                    "sources": {"type": "array", "items": {"type": "string"}},
+                    "strategic_implication": {"type": "string"}
+                },
+                "required": ["finding"]
+            }
+        },
+        "market_context": {"type": "object"},
+        "competitive_landscape": {"type": "object"},
+        "regulatory_environment": {"type": "object"},
+        "data_quality_assessment": {"type": "object"},
+        "critical_data_gaps": {"type": "array", "items": {"type": "object"}},
+        "research_limitations": {"type": "array", "items": {"type": "string"}},
+        "recommended_next_steps": {"type": "array", "items": {"type": "object"}}
+    },
+    "required": [
+        "executive_summary",
+        "key_findings",
+        "market_context",
+        "competitive_landscape",
+        "regulatory_environment",
+        "data_quality_assessment"
+    ]
+}
+
 IDENTIFY_COMPETITORS_PROMPT = """
 You are a **Competitive Intelligence Analyst at McKinsey & Company** specializing in market mapping and competitive dynamics.
 
@@ -614,3 +662,8 @@ Prioritize news by potential impact:
 
 **OUTPUT MUST BE**: Investment committee-ready news synthesis with actionable insights.
 """
+
+
+# Pre-parsed render functions for the templates formatted on every request
+CONSOLIDATE_RESEARCH_FN = compile_prompt(CONSOLIDATE_RESEARCH_PROMPT)
+IDENTIFY_COMPETITORS_FN = compile_prompt(IDENTIFY_COMPETITORS_PROMPT)
@@ -4,6 +4,13 @@ Designed to match McKinsey, BCG, and Bain & Company standards.
 Incorporates MECE principles, pyramid structure, and strategic storytelling.
 """
 
+from typing import Any
+
+from pydantic import ConfigDict, TypeAdapter, with_config
+from typing_extensions import NotRequired, TypedDict
+
+from app.utils.doc_utils import compile_prompt
+
 EXECUTIVE_SUMMARY_PROMPT = """
 You are a **Senior Partner at McKinsey & Company** synthesizing strategic recommendations for C-suite executives.
 
@@ -253,3 +260,178 @@ For each alternative:
   ]
 }}
 """
+
+COMBINED_SYNTHESIS_PROMPT = """
+You are a **Senior Partner at McKinsey & Company** synthesizing strategic recommendations for C-suite executives.
+Produce the executive summary, the implementation roadmap AND (only if declining) alternative strategies in one response.
+
+===== STRATEGIC QUESTION =====
+{question}
+
+===== RESEARCH FINDINGS =====
+{research_summary}
+
+===== MARKET ANALYSIS =====
+• TAM: ${tam}M
+• SAM: ${sam}M
+• SOM (Year 5): ${som}M
+• Competitive Landscape: {competitive_summary}
+
+===== FINANCIAL MODEL =====
+• Expected Revenue (Year 5): ${revenue_y5}M
+• LTV/CAC Ratio: {ltv_cac_ratio}x
+• Unit Economics: {unit_econ_assessment}
+• Valuation (DCF): ${valuation}M
+
+===== REGULATORY ASSESSMENT =====
+• Overall Risk Level: {regulatory_risk}
+• Key Blockers: {blockers}
+• Recommended Structure: {legal_structure}
+• Compliance Requirements: {requirements}
+
+<<<SECTION:EXECUTIVE_SUMMARY>>>
+**1. FINAL RECOMMENDATION**: Choose ONE:
+   - "proceed" = Strong positive case, manageable risks, clear path forward
+   - "decline" = Risks outweigh benefits, better alternatives exist
+   - "conditional" = Viable if specific conditions are met
+**2. CONFIDENCE LEVEL**: 0.0 to 1.0
+**3. FIVE DETAILED SUPPORTING POINTS**: 20-30 words each, data-backed, explaining WHY it matters
+**4. FIVE KEY RISKS**: 20-30 words each with threat, likelihood, impact and mitigation
+**5. EXPECTED IMPACT**: 3-4 sentences with specific outcomes
+**6. TIMELINE**: When will results be realized? (detailed milestones)
+**7. CONDITIONS**: If "conditional", what must be true? (empty list otherwise)
+
+<<<SECTION:IMPLEMENTATION_ROADMAP>>>
+Create a 6-12 month phased plan for the recommendation above:
+Phase 1 Preparation (Months 1-3), Phase 2 Launch (Months 4-6), Phase 3 Scale (Months 7-12).
+For EACH phase give milestones, key activities, resources required, success metrics and risks.
+
+<<<SECTION:ALTERNATIVES>>>
+ONLY if the recommendation is "decline": propose 2-3 alternative strategies that achieve similar
+objectives with better risk/reward (strategy, rationale, 3-4 pros, 2-3 cons, timeline, resources).
+Otherwise return an empty list.
+
+Use clear, executive-friendly language. Be decisive and data-driven.
+
+**OUTPUT FORMAT**: Return ONLY valid JSON:
+
+{{
+  "executive_summary": {{
+    "recommendation": "proceed/decline/conditional",
+    "confidence": float (0.0-1.0),
+    "supporting_points": ["detailed_point1", "detailed_point2", "detailed_point3", "detailed_point4", "detailed_point5"],
+    "key_risks": ["detailed_risk1", "detailed_risk2", "detailed_risk3", "detailed_risk4", "detailed_risk5"],
+    "expected_impact": "string",
+    "timeline": "string",
+    "conditions": ["condition1", "condition2"] or []
+  }},
+  "implementation_roadmap": {{
+    "phases": [
+      {{
+        "phase": "Preparation (Months 1-3)",
+        "duration": "3 months",
+        "milestones": ["milestone1", "milestone2"],
+        "key_activities": ["activity1", "activity2"],
+        "resources_required": ["resource1", "resource2"],
+        "success_metrics": ["metric1", "metric2"],
+        "risks": ["risk1", "risk2"]
+      }}
+    ]
+  }},
+  "alternatives": [
+    {{
+      "strategy": "string",
+      "rationale": "string",
+      "pros": ["pro1", "pro2", "pro3"],
+      "cons": ["con1", "con2"],
+      "timeline": "string",
+      "resources": "string"
+    }}
+  ]
+}}
+"""
+
+# JSON schema for the combined synthesis response; all three sections are
+# required (alternatives is an empty list unless the recommendation is "decline")
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+COMBINED_SYNTHESIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "executive_summary": {
+            "type": "object",
+            "properties": {
+                "recommendation": {"type": "string", "enum": ["proceed", "decline", "conditional"]},
+                "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                "supporting_points": _STRING_LIST,
+                "key_risks": _STRING_LIST,
+                "expected_impact": {"type": "string"},
+                "timeline": {"type": "string"},
+                "conditions": _STRING_LIST
+            },
+            "required": ["recommendation", "confidence", "supporting_points", "key_risks"]
+        },
+        "implementation_roadmap": {
+            "type": "object",
+            "properties": {
+                "phases": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "phase": {"type": "string"},
+                            "duration": {"type": "string"},
+                            "milestones": _STRING_LIST,
+                            "key_activities": _STRING_LIST,
+                            "resources_required": _STRING_LIST,
+                            "success_metrics": _STRING_LIST,
+                            "risks": _STRING_LIST
+                        },
+                        "required": ["phase", "duration", "milestones", "key_activities"]
+                    }
+                }
+            },
+            "required": ["phases"]
+        },
+        "alternatives": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "strategy": {"type": "string"},
+                    "rationale": {"type": "string"},
+                    "pros": _STRING_LIST,
+                    "cons": _STRING_LIST,
+                    "timeline": {"type": "string"},
+                    "resources": {"type": "string"}
+                },
+                "required": ["strategy", "rationale"]
+            }
+        }
+    },
+    "required": ["executive_summary", "implementation_roadmap", "alternatives"]
+}
+
+# Pre-parsed render functions for the templates formatted on every synthesis
+EXECUTIVE_SUMMARY_FN = compile_prompt(EXECUTIVE_SUMMARY_PROMPT)
+IMPLEMENTATION_ROADMAP_FN = compile_prompt(IMPLEMENTATION_ROADMAP_PROMPT)
+ALTERNATIVES_FN = compile_prompt(ALTERNATIVES_PROMPT)
+COMBINED_SYNTHESIS_FN = compile_prompt(COMBINED_SYNTHESIS_PROMPT)
+
+
+# Response shapes checked after parsing. Only the fields the synthesizer
+# depends on are typed; anything else the model returns is kept as-is.
+@with_config(ConfigDict(extra="allow"))
+class ExecutiveSummaryOutput(TypedDict):
+    recommendation: str
+
+
+@with_config(ConfigDict(extra="allow"))
+class CombinedSynthesisOutput(TypedDict):
+    executive_summary: ExecutiveSummaryOutput
+    implementation_roadmap: NotRequired[Any]
+    alternatives: NotRequired[Any]
+
+
+# Validators compiled once at import rather than per call
+EXECUTIVE_SUMMARY_VALIDATOR = TypeAdapter(ExecutiveSummaryOutput).validate_python
+COMBINED_SYNTHESIS_VALIDATOR = TypeAdapter(CombinedSynthesisOutput).validate_python
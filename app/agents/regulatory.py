@@ -1,10 +1,11 @@
 """Regulatory & Geopolitical Agent - Compliance and risk analysis."""
 
 import asyncio
+import copy
 import time
-import json
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 from app.services.llm_service import LLMService
 from app.services.rag_service import RAGService
@@ -14,14 +15,162 @@ from app.models.state import AgentState
 from app.agents.prompts.regulatory_prompts import (
     FDI_ANALYSIS_PROMPT,
     GEOPOLITICAL_RISK_PROMPT,
-    REGULATORY_RISK_MATRIX_PROMPT,
-    LEGAL_STRUCTURE_PROMPT,
+    RISK_AND_STRUCTURE_PROMPT,
     SECTOR_REGULATIONS_PROMPT
 )
+from app.utils.doc_utils import prune_for_prompt, to_prompt_json
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Common country x industry pairs pre-fetched at startup
+WARMUP_COUNTRIES = ("India", "Saudi Arabia", "UAE", "USA")
+WARMUP_INDUSTRIES = ("Technology", "Food Delivery", "E-commerce", "Fintech", "Healthcare")
+
+# Internal finding key -> key exposed in state["regulatory_findings"]
+FINDING_STATE_KEYS = {
+    "fdi": "fdi_analysis",
+    "sector_regulations": "sector_regulations",
+    "tax": "tax_analysis",
+    "geopolitical": "geopolitical_assessment",
+    "trade": "trade_barriers",
+    "labor": "labor_regulations"
+}
+
+# Hard blocker: no legal structure can proceed, so the risk/structure LLM call is skipped
+FDI_PROHIBITED_BLOCKER = "FDI not permitted in this sector"
+
+# Finding sections fed to the risk/structure prompt, and the per-section budget
+RISK_PROMPT_SECTIONS = ("fdi", "tax", "trade", "labor", "geopolitical")
+RISK_PROMPT_SECTION_CHARS = 500
+
+# Most informative fields per section, kept first when pruning to the budget
+RISK_PROMPT_FIELD_PRIORITY = {
+    "fdi": (
+        "permitted", "fdi_permissibility", "ownership_cap", "ownership_structure",
+        "allowed", "ownership_limit", "approvals_needed", "conditions",
+        "timeline_months", "key_risks", "compliance_complexity"
+    ),
+    "tax": ("countries", "structure", "key_considerations"),
+    "trade": (
+        "tariff_rate", "free_trade_agreement", "agreement_name",
+        "import_restrictions", "quotas", "route"
+    ),
+    "labor": (
+        "local_hiring_requirement", "min_wage_usd_monthly", "standard_hours_per_week",
+        "mandatory_benefits", "union_presence"
+    ),
+    "geopolitical": (
+        "overall_risk_level", "stability_score", "key_risks", "economic_outlook",
+        "currency_volatility", "political_trends", "bilateral_relations"
+    )
+}
+
+# Standard compliance roadmap phases (template; each run gets a deep copy)
+COMPLIANCE_ROADMAP = (
+    {
+        "phase": "Pre-Entry (Months 1-3)",
+        "tasks": [
+            "Conduct regulatory due diligence",
+            "Obtain FDI approval (if required)",
+            "Register legal entity",
+            "Apply for sector-specific licenses"
+        ],
+        "estimated_duration": "3 months"
+    },
+    {
+        "phase": "Setup (Months 4-6)",
+        "tasks": [
+            "Establish bank accounts",
+            "Register for tax and VAT",
+            "Hire local team (comply with local hiring quotas)",
+            "Setup compliance systems"
+        ],
+        "estimated_duration": "3 months"
+    },
+    {
+        "phase": "Operations (Month 7+)",
+        "tasks": [
+            "Ongoing compliance reporting",
+            "Annual audits and tax filings",
+            "Regulatory relationship management",
+            "Monitor policy changes"
+        ],
+        "estimated_duration": "Ongoing"
+    }
+)
+
+# Known company names -> source country
+INDIA_COMPANIES = frozenset({"zomato", "swiggy", "ola", "flipkart", "paytm", "tata"})
+USA_COMPANIES = frozenset({"uber", "amazon"})
+WORD_PATTERN = re.compile(r"[a-z]+")
+
+# Keyword -> canonical target country, in priority order (questions often
+# name the source market too, e.g. "Should Zomato (India) enter Saudi Arabia?"),
+# compiled into a single alternation
+TARGET_COUNTRY_KEYWORDS = {
+    "saudi arabia": "Saudi Arabia",
+    "saudi": "Saudi Arabia",
+    "uae": "UAE",
+    "dubai": "UAE",
+    "singapore": "Singapore",
+    "usa": "USA",
+    "united states": "USA",
+    "uk": "UK",
+    "united kingdom": "UK",
+    "india": "India"
+}
+TARGET_COUNTRY_PATTERN = re.compile(
+    r"\b(" + "|".join(
+        re.escape(k) for k in sorted(TARGET_COUNTRY_KEYWORDS, key=len, reverse=True)
+    ) + r")\b"
+)
+TARGET_COUNTRY_PRIORITY = {keyword: rank for rank, keyword in enumerate(TARGET_COUNTRY_KEYWORDS)}
+
+
+def find_target_country(question: str) -> Optional[str]:
+    """
+    Find the target country named in a strategic question.
+    
+    Args:
+        question: Strategic question
+        
+    Returns:
+        Canonical country name for the highest-priority keyword, or None
+    """
+    keywords = TARGET_COUNTRY_PATTERN.findall(question.lower())
+    if not keywords:
+        return None
+    return TARGET_COUNTRY_KEYWORDS[min(keywords, key=TARGET_COUNTRY_PRIORITY.__getitem__)]
+
+
+@lru_cache(maxsize=1024)
+def _format_prompt(template: str, **fields: str) -> str:
+    """Format a prompt template, memoized on the (hashable) string inputs."""
+    return template.format(**fields)
+
+
+def _section_payload(section: str, finding: Any) -> str:
+    """Serialize a finding for the risk/structure prompt as valid JSON within budget."""
+    if not isinstance(finding, dict):
+        return to_prompt_json(finding, RISK_PROMPT_SECTION_CHARS)
+    
+    pruned = prune_for_prompt(
+        finding,
+        RISK_PROMPT_SECTION_CHARS,
+        RISK_PROMPT_FIELD_PRIORITY.get(section, ())
+    )
+    return to_prompt_json(pruned)
+
+
+async def _guarded(name: str, coro: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Await an analysis, returning {} on failure so TaskGroup siblings keep running."""
+    try:
+        return await coro
+    except Exception as e:
+        logger.error("regulatory_analysis_failed", analysis=name, error=str(e))
+        return {}
+
 
 class RegulatoryAgent:
     """
@@ -32,11 +181,16 @@ class RegulatoryAgent:
     - Geopolitical risk assessment
     - Trade barriers
     - Labor regulations
-    - Risk matrix generation
-    - Legal structure recommendations
+    - Risk matrix generation and legal structure recommendation (fused call)
     """
     
-    def __init__(self, llm: LLMService, rag: RAGService, db: DatabaseService):
+    def __init__(
+        self,
+        llm: LLMService,
+        rag: RAGService,
+        db: DatabaseService,
+        regulatory_data: Optional[RegulatoryDataService] = None
+    ):
         """
         Initialize Regulatory Agent.
         
@@ -44,15 +198,29 @@ class RegulatoryAgent:
             llm: LLM service for analysis
             rag: RAG service for regulatory knowledge
             db: Database service for logging
+            regulatory_data: Optional regulatory data service (created if omitted)
         """
         self.llm = llm
         self.rag = rag
         self.db = db
-        self.regulatory_data = RegulatoryDataService()
+        self.regulatory_data = regulatory_data or RegulatoryDataService()
         self.name = "regulatory_agent"
         
         logger.info("regulatory_agent_initialized")
     
+    async def warmup(self) -> None:
+        """Pre-populate the regulatory data cache for common markets."""
+        tasks = []
+        for country in WARMUP_COUNTRIES:
+            tasks.append(self.regulatory_data.get_tax_rates(country))
+            tasks.append(self.regulatory_data.get_political_risk_score(country))
+            tasks.append(self.regulatory_data.get_labor_laws(country))
+            for industry in WARMUP_INDUSTRIES:
+                tasks.append(self.regulatory_data.get_fdi_policy(country, industry))
+        
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("regulatory_cache_warmed", entries=len(tasks))
+    
     async def execute(self, state: AgentState) -> AgentState:
         """
         Main execution: performs all regulatory and geopolitical analysis.
@@ -63,15 +231,14 @@ class RegulatoryAgent:
         Returns:
             Updated state with regulatory_findings
         """
+        log = logger.bind(agent=self.name)
         try:
             request = state["request"]
             research_data = state.get("research_data", {})
             
-            logger.info(
-                "regulatory_agent_starting",
-                company=request["company_name"],
-                industry=request["industry"]
-            )
+            # Bind request context once instead of re-passing it on every event
+            log = log.bind(company=request["company_name"], industry=request["industry"])
+            log.info("regulatory_agent_starting")
             
             start_time = time.time()
             
@@ -79,70 +246,60 @@ class RegulatoryAgent:
             source_country = self._extract_source_country(request)
             target_country = self._extract_target_country(request["strategic_question"])
             
-            logger.info(
+            log.info(
                 "countries_identified",
                 source=source_country,
                 target=target_country
             )
             
-            # Sequential execution to avoid rate limiting on free tier
-            logger.info("running_sequential_regulatory_analysis")
-            
-            # Execute each analysis sequentially
-            logger.info("assessing_fdi_regulations")
-            fdi = await self.assess_fdi_regulations(
-                source_country, target_country,
-                request["industry"], json.dumps(research_data)[:1000]
-            )
-            
-            logger.info("evaluating_sector_regulations")
-            sector_reg = await self.evaluate_sector_regulations(
-                request["industry"], target_country, "B2C"
-            )
-            
-            logger.info("analyzing_tax_implications")
-            tax = await self.analyze_tax_implications(
-                "subsidiary", [source_country, target_country]
-            )
-            
-            logger.info("assessing_geopolitical_risk")
-            geopolitical = await self.assess_geopolitical_risk(
-                target_country, request["industry"],
-                json.dumps(research_data)[:1000]
-            )
-            
-            logger.info("evaluating_trade_barriers")
-            trade = await self.evaluate_trade_barriers(
-                source_country, target_country, request["industry"]
-            )
+            # Run analyses concurrently; LLM calls are still paced by the
+            # LLM service rate limiter to stay within free tier limits
+            log.info("running_concurrent_regulatory_analysis")
+            
+            # Serialize research data once; both prompts only use the first 1000 chars
+            research_context = to_prompt_json(research_data, 1000)
+            
+            analyses = {
+                "fdi": self.assess_fdi_regulations(
+                    source_country, target_country,
+                    request["industry"], research_context
+                ),
+                "sector_regulations": self.evaluate_sector_regulations(
+                    request["industry"], target_country, "B2C"
+                ),
+                "tax": self.analyze_tax_implications(
+                    "subsidiary", [source_country, target_country]
+                ),
+                "geopolitical": self.assess_geopolitical_risk(
+                    target_country, request["industry"],
+                    research_context
+                ),
+                "trade": self.evaluate_trade_barriers(
+                    source_country, target_country, request["industry"]
+                ),
+                "labor": self.assess_labor_regulations(target_country, request["industry"])
+            }
             
-            logger.info("assessing_labor_regulations")
-            labor = await self.assess_labor_regulations(target_country, request["industry"])
+            # Each analysis is guarded so one failure doesn't cancel its siblings
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    key: tg.create_task(_guarded(key, coro))
+                    for key, coro in analyses.items()
+                }
+                
+                # Risk matrix + legal structure only need these findings, so the
+                # fused LLM call starts as soon as they resolve (sector regulations
+                # may still be in flight)
+                structure_task = tg.create_task(self._assess_risk_and_structure_when_ready(
+                    request["company_name"],
+                    request["strategic_question"],
+                    {key: tasks[key] for key in RISK_PROMPT_SECTIONS}
+                ))
             
             # Create consolidated findings
-            all_findings = {
-                "fdi": fdi if not isinstance(fdi, Exception) else {},
-                "sector_regulations": sector_reg if not isinstance(sector_reg, Exception) else {},
-                "tax": tax if not isinstance(tax, Exception) else {},
-                "geopolitical": geopolitical if not isinstance(geopolitical, Exception) else {},
-                "trade": trade if not isinstance(trade, Exception) else {},
-                "labor": labor if not isinstance(labor, Exception) else {}
-            }
+            all_findings = {key: task.result() for key, task in tasks.items()}
             
-            # Create risk matrix
-            logger.info("creating_risk_matrix")
-            risk_matrix = await self.create_risk_matrix(
-                request["strategic_question"],
-                all_findings
-            )
-            
-            # Recommend legal structure
-            logger.info("recommending_legal_structure")
-            legal_structure = await self.recommend_legal_structure(
-                request["company_name"],
-                request["strategic_question"],
-                all_findings
-            )
+            risk_matrix, legal_structure = structure_task.result()
             
             # Identify blockers
             key_blockers = self._identify_blockers(all_findings)
@@ -152,12 +309,7 @@ class RegulatoryAgent:
             
             # Consolidate all findings
             state["regulatory_findings"] = {
-                "fdi_analysis": fdi if not isinstance(fdi, Exception) else {},
-                "sector_regulations": sector_reg if not isinstance(sector_reg, Exception) else {},
-                "tax_analysis": tax if not isinstance(tax, Exception) else {},
-                "geopolitical_assessment": geopolitical if not isinstance(geopolitical, Exception) else {},
-                "trade_barriers": trade if not isinstance(trade, Exception) else {},
-                "labor_regulations": labor if not isinstance(labor, Exception) else {},
+                **{FINDING_STATE_KEYS[key]: value for key, value in all_findings.items()},
                 "risk_matrix": risk_matrix,
                 "recommended_structure": legal_structure,
                 "overall_risk_level": risk_matrix.get("risk_level", "unknown"),
@@ -169,8 +321,8 @@ class RegulatoryAgent:
             
             state["metadata"]["regulatory_time"] = time.time() - start_time
             
-            # Log execution
-            await self.db.save_agent_log(
+            # Log execution (fire-and-forget; nothing downstream reads it)
+            self.db.save_agent_log_background(
                 agent_name=self.name,
                 execution_time=state["metadata"]["regulatory_time"],
                 success=True,
@@ -180,21 +332,18 @@ class RegulatoryAgent:
                 }
             )
             
-            logger.info(
+            log.info(
                 "regulatory_agent_complete",
                 execution_time=state["metadata"]["regulatory_time"],
                 risk_level=risk_matrix.get("risk_level", "unknown"),
                 blockers=len(key_blockers)
             )
             
-            # Update progress: Regulatory complete (75%)
-            if "db_service" in state["metadata"] and "job_id" in state["metadata"]:
-                try:
-                    await state["metadata"]["db_service"].update_session_status(
-                        state["metadata"]["job_id"], "processing", 75
-                    )
-                except Exception as e:
-                    logger.warning("progress_update_failed", error=str(e))
+            # Update progress: Regulatory complete (75%), off the critical path
+            if "job_id" in state["metadata"]:
+                self.db.update_session_progress_background(
+                    state["metadata"]["job_id"], 75
+                )
             
             return state
             
@@ -204,7 +353,7 @@ class RegulatoryAgent:
             if "errors" not in state:
                 state["errors"] = []
             state["errors"].append(error_msg)
-            logger.error("regulatory_agent_failed", error=str(e), exc_info=True)
+            log.error("regulatory_agent_failed", error=str(e), exc_info=True)
             return state
     
     async def assess_fdi_regulations(
@@ -230,12 +379,13 @@ class RegulatoryAgent:
             # Fetch FDI policy data
             fdi_policy = await self.regulatory_data.get_fdi_policy(target_country, industry)
             
-            prompt = FDI_ANALYSIS_PROMPT.format(
+            prompt = _format_prompt(
+                FDI_ANALYSIS_PROMPT,
                 company=f"{source_country} company",
                 source_country=source_country,
                 target_country=target_country,
                 industry=industry,
-                fdi_policy=json.dumps(fdi_policy, indent=2),
+                fdi_policy=to_prompt_json(fdi_policy),
                 context=context
             )
             
@@ -278,7 +428,8 @@ class RegulatoryAgent:
             Sector regulations dictionary
         """
         try:
-            prompt = SECTOR_REGULATIONS_PROMPT.format(
+            prompt = _format_prompt(
+                SECTOR_REGULATIONS_PROMPT,
                 industry=industry,
                 country=country,
                 context=f"Business model: {business_model}"
@@ -365,11 +516,12 @@ class RegulatoryAgent:
             # Fetch political risk data
             political_data = await self.regulatory_data.get_political_risk_score(country)
             
-            prompt = GEOPOLITICAL_RISK_PROMPT.format(
+            prompt = _format_prompt(
+                GEOPOLITICAL_RISK_PROMPT,
                 company=f"Company in {industry}",
                 country=country,
                 industry=industry,
-                political_data=json.dumps(political_data, indent=2),
+                political_data=to_prompt_json(political_data),
                 economic_data="GDP growth: 3-5%, Inflation: 2-3%",
                 news=context[:500]
             )
@@ -461,97 +613,139 @@ class RegulatoryAgent:
                 "union_presence": "unknown"
             }
     
-    async def create_risk_matrix(
+    async def _assess_risk_and_structure_when_ready(
         self,
+        company: str,
         strategy: str,
-        all_findings: Dict
-    ) -> Dict[str, Any]:
-        """
-        Consolidate all risks into matrix.
+        finding_tasks: Dict[str, asyncio.Task]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Await only the findings the risk/structure prompt needs, then run it."""
+        # No-go path: answer immediately without waiting on the other findings
+        fdi = await finding_tasks["fdi"]
+        if FDI_PROHIBITED_BLOCKER in self._identify_blockers({"fdi": fdi}):
+            logger.info("hard_blocker_found_skipping_llm", blocker=FDI_PROHIBITED_BLOCKER)
+            return self._infeasible_risk_and_structure(FDI_PROHIBITED_BLOCKER)
         
-        Args:
-            strategy: Strategic question
-            all_findings: All regulatory findings
-            
-        Returns:
-            Risk matrix dictionary
-        """
-        try:
-            prompt = REGULATORY_RISK_MATRIX_PROMPT.format(
-                strategy=strategy,
-                fdi=json.dumps(all_findings.get("fdi", {}), indent=2)[:500],
-                tax=json.dumps(all_findings.get("tax", {}), indent=2)[:500],
-                trade=json.dumps(all_findings.get("trade", {}), indent=2)[:500],
-                labor=json.dumps(all_findings.get("labor", {}), indent=2)[:500],
-                geopolitical=json.dumps(all_findings.get("geopolitical", {}), indent=2)[:500]
-            )
-            
-            result = await self.llm.generate_structured_output(
-                prompt=prompt,
-                system_prompt="You are a risk management consultant.",
-                response_schema={}
-            )
-            
-            return result if isinstance(result, dict) else {
-                "risks": [],
-                "total_risk_score": 0,
-                "risk_level": "unknown",
-                "critical_risks": []
-            }
-            
-        except Exception as e:
-            logger.error("risk_matrix_failed", error=str(e))
-            return {
-                "risks": [],
-                "total_risk_score": 0,
-                "risk_level": "unknown",
-                "critical_risks": []
-            }
+        # Serialize each finding once, as soon as it resolves
+        findings = {}
+        payloads = {}
+        for key, task in finding_tasks.items():
+            findings[key] = await task
+            payloads[key] = _section_payload(key, findings[key])
+        
+        logger.info("creating_risk_matrix_and_legal_structure")
+        return await self.assess_risk_and_structure(
+            company, strategy, findings, preserialized=payloads
+        )
+    
+    def _infeasible_risk_and_structure(
+        self,
+        blocker: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the risk matrix and structure recommendation for a hard blocker."""
+        risk_matrix = {
+            "risks": [
+                {
+                    "risk": blocker,
+                    "category": "fdi",
+                    "probability": 5,
+                    "impact": 5,
+                    "score": 25,
+                    "mitigation": "Re-scope entry via a permitted sector or a non-equity model"
+                }
+            ],
+            "total_risk_score": 25,
+            "risk_level": "critical",
+            "critical_risks": [blocker]
+        }
+        legal_structure = {
+            "recommended_structure": "Not feasible",
+            "rationale": blocker,
+            "pros": [],
+            "cons": [],
+            "alternatives": [
+                {
+                    "structure": "Licensing/Franchising",
+                    "when_to_consider": "If non-equity market entry is permitted"
+                }
+            ],
+            "setup_timeline": "N/A",
+            "estimated_cost": "N/A"
+        }
+        return risk_matrix, legal_structure
     
-    async def recommend_legal_structure(
+    async def assess_risk_and_structure(
         self,
         company: str,
         strategy: str,
-        analysis: Dict
-    ) -> Dict[str, Any]:
+        all_findings: Dict,
+        preserialized: Optional[Dict[str, str]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
-        Recommend optimal legal structure.
+        Consolidate all risks into a matrix and recommend the optimal legal
+        structure in one LLM round-trip.
         
         Args:
             company: Company name
             strategy: Strategic question
-            analysis: Regulatory analysis
+            all_findings: All regulatory findings
+            preserialized: Optional prompt payloads per finding section, already
+                serialized by the caller (skips re-encoding all_findings)
             
         Returns:
-            Legal structure recommendation
+            Tuple of (risk matrix, legal structure recommendation)
         """
+        default_risk_matrix = {
+            "risks": [],
+            "total_risk_score": 0,
+            "risk_level": "unknown",
+            "critical_risks": []
+        }
+        
         try:
-            prompt = LEGAL_STRUCTURE_PROMPT.format(
+            payloads = preserialized or {
+                key: _section_payload(key, all_findings.get(key, {}))
+                for key in RISK_PROMPT_SECTIONS
+            }
+            
+            prompt = _format_prompt(
+                RISK_AND_STRUCTURE_PROMPT,
                 company=company,
                 strategy=strategy,
-                regulatory_summary=json.dumps(analysis, indent=2)[:1000],
-                business_requirements="Full operational control, tax efficiency"
+                business_requirements="Full operational control, tax efficiency",
+                **payloads
             )
             
             result = await self.llm.generate_structured_output(
                 prompt=prompt,
-                system_prompt="You are a corporate structuring advisor.",
-                response_schema={}
+                system_prompt="You are a risk management consultant and corporate structuring advisor.",
+                response_schema={"risk_matrix": {}, "legal_structure": {}}
             )
             
-            return result if isinstance(result, dict) else {
-                "recommended_structure": "Wholly-owned subsidiary",
-                "rationale": "Full control and liability protection",
-                "pros": [],
-                "cons": [],
-                "alternatives": [],
-                "setup_timeline": "6-9 months",
-                "estimated_cost": "$50K-$100K"
-            }
+            if not isinstance(result, dict):
+                result = {}
+            
+            risk_matrix = result.get("risk_matrix")
+            legal_structure = result.get("legal_structure")
+            
+            if not isinstance(risk_matrix, dict):
+                risk_matrix = default_risk_matrix
+            if not isinstance(legal_structure, dict):
+                legal_structure = {
+                    "recommended_structure": "Wholly-owned subsidiary",
+                    "rationale": "Full control and liability protection",
+                    "pros": [],
+                    "cons": [],
+                    "alternatives": [],
+                    "setup_timeline": "6-9 months",
+                    "estimated_cost": "$50K-$100K"
+                }
+            
+            return risk_matrix, legal_structure
             
         except Exception as e:
-            logger.error("legal_structure_failed", error=str(e))
-            return {
+            logger.error("risk_and_structure_failed", error=str(e))
+            return default_risk_matrix, {
                 "recommended_structure": "Unknown",
                 "rationale": str(e),
                 "pros": [],
@@ -563,38 +757,19 @@ class RegulatoryAgent:
     
     def _extract_source_country(self, request: Dict) -> str:
         """Extract source country from request."""
-        # Simple heuristic: check company name
-        company = request.get("company_name", "").lower()
+        # Simple heuristic: check company name tokens
+        tokens = set(WORD_PATTERN.findall(request.get("company_name", "").lower()))
         
-        if any(name in company for name in ["zomato", "swiggy", "ola", "flipkart", "paytm", "tata"]):
+        if tokens & INDIA_COMPANIES:
             return "India"
-        elif "uber" in company or "amazon" in company:
+        elif tokens & USA_COMPANIES:
             return "USA"
         else:
             return "India"  # Default
     
     def _extract_target_country(self, question: str) -> str:
         """Extract target country from strategic question."""
-        question_lower = question.lower()
-        
-        countries = {
-            "saudi arabia": "Saudi Arabia",
-            "saudi": "Saudi Arabia",
-            "uae": "UAE",
-            "dubai": "UAE",
-            "singapore": "Singapore",
-            "usa": "USA",
-            "united states": "USA",
-            "uk": "UK",
-            "united kingdom": "UK",
-            "india": "India"
-        }
-        
-        for keyword, country in countries.items():
-            if keyword in question_lower:
-                return country
-        
-        return "Saudi Arabia"  # Default
+        return find_target_country(question) or "Saudi Arabia"  # Default
     
     def _identify_blockers(self, findings: Dict) -> List[str]:
         """Identify regulatory blockers."""
@@ -602,7 +777,7 @@ class RegulatoryAgent:
         
         fdi = findings.get("fdi", {})
         if not fdi.get("permitted", True):
-            blockers.append("FDI not permitted in this sector")
+            blockers.append(FDI_PROHIBITED_BLOCKER)
         
         if fdi.get("ownership_cap", 100) < 51:
             blockers.append(f"Ownership limited to {fdi.get('ownership_cap')}% - majority control not possible")
@@ -615,37 +790,6 @@ class RegulatoryAgent:
     
     def _create_compliance_roadmap(self, findings: Dict) -> List[Dict]:
         """Create step-by-step compliance roadmap."""
-        roadmap = [
-            {
-                "phase": "Pre-Entry (Months 1-3)",
-                "tasks": [
-                    "Conduct regulatory due diligence",
-                    "Obtain FDI approval (if required)",
-                    "Register legal entity",
-                    "Apply for sector-specific licenses"
-                ],
-                "estimated_duration": "3 months"
-            },
-            {
-                "phase": "Setup (Months 4-6)",
-                "tasks": [
-                    "Establish bank accounts",
-                    "Register for tax and VAT",
-                    "Hire local team (comply with local hiring quotas)",
-                    "Setup compliance systems"
-                ],
-                "estimated_duration": "3 months"
-            },
-            {
-                "phase": "Operations (Month 7+)",
-                "tasks": [
-                    "Ongoing compliance reporting",
-                    "Annual audits and tax filings",
-                    "Regulatory relationship management",
-                    "Monitor policy changes"
-                ],
-                "estimated_duration": "Ongoing"
-            }
-        ]
-        
-        return roadmap
+        # Roadmap is currently static; callers (e.g. the synthesizer's fallback
+        # roadmap) may edit the phases in place, so never hand out the constant
+        return copy.deepcopy(list(COMPLIANCE_ROADMAP))
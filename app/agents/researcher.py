@@ -1,26 +1,65 @@
 """Research Agent - Gathers comprehensive data for strategic analysis."""
 
 import asyncio
+import re
 import time
-import json
-import hashlib
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import copy
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+import xxhash
 
 from app.services.rag_service import RAGService
 from app.services.llm_service import LLMService
 from app.services.db_service import DatabaseService
 from app.services.external_apis import ExternalDataService
+from app.services.semantic_cache import SemanticCache
 from app.models.state import AgentState
+from app.agents.regulatory import find_target_country
+from app.utils.cache import cache_key as make_cache_key, rag_cache, research_cache
 from app.agents.prompts.research_prompts import (
-    CONSOLIDATE_RESEARCH_PROMPT,
-    IDENTIFY_COMPETITORS_PROMPT,
+    CONSOLIDATE_RESEARCH_FN,
+    CONSOLIDATE_RESEARCH_SCHEMA,
+    IDENTIFY_COMPETITORS_FN,
     EXTRACT_KEY_FACTS_PROMPT
 )
+from app.utils.doc_utils import to_prompt_json
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Competitor lists and regulatory context change slowly per (company, industry)
+LOOKUP_CACHE_TTL = 86400
+
+# RAG matches below this similarity are left out of the consolidation prompt
+MIN_RAG_SCORE = 0.25
+
+# Company name alias -> stock ticker (common Indian and US companies)
+TICKER_MAP = {
+    'zomato': 'ZOMATO.NS',
+    'swiggy': 'SWIGGY.NS',
+    'flipkart': 'FLIPKART.NS',
+    'paytm': 'PAYTM.NS',
+    'ola': 'OLA.NS',
+    'tesla': 'TSLA',
+    'apple': 'AAPL',
+    'google': 'GOOGL',
+    'microsoft': 'MSFT',
+    'amazon': 'AMZN'
+}
+
+# All aliases matched in a single scan (longest first, whole words only)
+TICKER_PATTERN = re.compile(
+    r"\b(" + "|".join(
+        re.escape(alias) for alias in sorted(TICKER_MAP, key=len, reverse=True)
+    ) + r")\b"
+)
+
+
+def _rag_doc_key(doc: Dict[str, Any]) -> str:
+    """In-memory cache key for a RAG document (or reference) by namespace and ID."""
+    return f"rag_doc:{doc.get('namespace', '')}:{doc['id']}"
+
 
 class ResearchAgent:
     """
@@ -53,6 +92,12 @@ class ResearchAgent:
         self.db = db
         self.external = external
         self.name = "research_agent"
+        # Reuses results for paraphrased questions about the same company/industry
+        self.semantic_cache = SemanticCache(threshold=0.92, ttl=86400)
+        # Local mirror of RAG results keyed by query vector (skips the Pinecone round trip)
+        self.rag_vector_cache = SemanticCache(threshold=0.92, ttl=7200)
+        # Single-flight registry: cache key -> result of the run in progress
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         logger.info("research_agent_initialized")
     
@@ -61,7 +106,8 @@ class ResearchAgent:
         Main execution method called by LangGraph.
         
         Full research pipeline:
-        1. Check cache first
+        1. Check cache first (exact key, then semantic similarity), or join
+           an identical run already in progress
         2. Query RAG for relevant context
         3. Fetch live data in parallel
         4. Consolidate using LLM
@@ -97,51 +143,56 @@ class ResearchAgent:
             )
             
             # Step 1: Check cache
-            cache_key = f"research:{company}:{industry}:{hashlib.md5(question.encode()).hexdigest()}"
+            cache_key = f"research:{company}:{industry}:{xxhash.xxh3_64_hexdigest(question.encode())}"
             cached = await self.db.get_cached_data(cache_key)
             
             if cached:
                 logger.info("cache_hit", cache_key=cache_key)
                 state["research_data"] = cached
-                state["rag_context"] = cached.get("rag_context", [])
+                state["rag_context"] = await self._rehydrate_rag_context(cached)
                 return state
             
-            # Step 2: Parallel data gathering
-            start_time = time.time()
-            
-            logger.info("starting_parallel_data_fetch")
-            
-            tasks = [
-                self.gather_rag_context(question, company, industry),
-                self.fetch_live_news(company, industry),
-                self.fetch_financial_data(company),
-                self.fetch_regulatory_info(industry, "global"),
-                self.identify_competitors(company, industry)
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            rag_context, news, financials, regulatory, competitors = results
-            
-            # Handle any exceptions
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    error_msg = f"Research task {i} failed: {str(result)}"
-                    state["errors"].append(error_msg)
-                    logger.error("research_task_failed", task_index=i, error=str(result))
-                    # Provide empty defaults
-                    if i in [2, 3]:  # financials, regulatory
-                        results[i] = {}
-                    else:  # lists
-                        results[i] = []
+            # Step 1b: Check semantic cache (paraphrased questions)
+            # Scoped by target market too: "expand to UAE" and "expand to
+            # Saudi Arabia" embed almost identically but need different research
+            cache_scope = (company.lower(), industry.lower(), find_target_country(question))
+            question_embedding = await self._embed_question(question)
+            if question_embedding is not None:
+                similar = self.semantic_cache.check(question_embedding, cache_scope)
+                if similar:
+                    state["research_data"] = similar
+                    state["rag_context"] = await self._rehydrate_rag_context(similar)
+                    return state
+            
+            # Step 1c: Coalesce with an identical run already in flight
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                logger.info("research_coalesced", cache_key=cache_key)
+                shared = copy.deepcopy(await asyncio.shield(inflight))
+                state["research_data"] = shared
+                state["rag_context"] = await self._rehydrate_rag_context(shared)
+                return state
             
-            rag_context, news, financials, regulatory, competitors = results
+            future = asyncio.get_running_loop().create_future()
+            # Retrieve the outcome so a failed run without waiters doesn't warn
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._inflight[cache_key] = future
             
-            # Step 3: Consolidate using LLM
-            logger.info("consolidating_research")
-            consolidated = await self.consolidate_research(
-                rag_context, news, financials, regulatory, competitors, question
-            )
+            # Steps 2-3: Parallel data gathering and LLM consolidation
+            start_time = time.time()
+            try:
+                consolidated, rag_context, news = await self._gather_and_consolidate(
+                    state, company, industry, question
+                )
+                future.set_result(copy.deepcopy(consolidated))
+            except BaseException as exc:
+                # Waiters re-raise this; keep the leader's error as the cause
+                error = RuntimeError(f"Coalesced research run failed: {exc!r}")
+                error.__cause__ = exc
+                future.set_exception(error)
+                raise
+            finally:
+                self._inflight.pop(cache_key, None)
             
             # Step 4: Update state
             state["research_data"] = consolidated
@@ -154,6 +205,8 @@ class ResearchAgent:
             
             # Step 5: Cache results (24 hours)
             await self.db.cache_research_data(cache_key, consolidated, ttl=86400)
+            if question_embedding is not None:
+                self.semantic_cache.store(question_embedding, consolidated, cache_scope)
             
             # Step 6: Log execution
             await self.db.save_agent_log(
@@ -173,14 +226,11 @@ class ResearchAgent:
                 data_points=len(rag_context) + len(news)
             )
             
-            # Update progress: Research complete (25%)
-            if "db_service" in state["metadata"] and "job_id" in state["metadata"]:
-                try:
-                    await state["metadata"]["db_service"].update_session_status(
-                        state["metadata"]["job_id"], "processing", 25
-                    )
-                except Exception as e:
-                    logger.warning("progress_update_failed", error=str(e))
+            # Update progress: Research complete (25%), off the critical path
+            if "job_id" in state["metadata"]:
+                self.db.update_session_progress_background(
+                    state["metadata"]["job_id"], 25
+                )
             
             return state
             
@@ -193,6 +243,146 @@ class ResearchAgent:
             logger.error("research_agent_failed", error=str(e), exc_info=True)
             return state
     
+    async def _gather_and_consolidate(
+        self,
+        state: AgentState,
+        company: str,
+        industry: str,
+        question: str
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch all research sources in parallel and consolidate them with the LLM.
+        
+        Args:
+            state: Current agent state (failed sources are recorded in errors)
+            company: Company name
+            industry: Industry name
+            question: Strategic question
+            
+        Returns:
+            Tuple of (consolidated research, RAG context, news)
+        """
+        logger.info("starting_parallel_data_fetch")
+        
+        tasks = [
+            self.gather_rag_context(question, company, industry),
+            self.fetch_live_news(company, industry),
+            self.fetch_financial_data(company),
+            self.fetch_regulatory_info(industry, "global"),
+            self.identify_competitors(company, industry)
+        ]
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Replace failed tasks with empty defaults (financials, regulatory are dicts)
+        defaults = ([], [], {}, {}, [])
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                state["errors"].append(f"Research task {i} failed: {str(result)}")
+                logger.error("research_task_failed", task_index=i, error=str(result))
+        
+        rag_context, news, financials, regulatory, competitors = (
+            default if isinstance(result, Exception) else result
+            for result, default in zip(results, defaults)
+        )
+        
+        # Consolidate using LLM
+        logger.info("consolidating_research")
+        consolidated = await self.consolidate_research(
+            rag_context, news, financials, regulatory, competitors, question
+        )
+        
+        return consolidated, rag_context, news
+    
+    async def _embed_question(self, question: str) -> Optional[List[float]]:
+        """Embed the question for the semantic cache (None if RAG is unavailable)."""
+        if not self.rag:
+            return None
+        
+        try:
+            return await asyncio.to_thread(self.rag.embed, question)
+        except Exception as e:
+            logger.warning("question_embedding_failed", error=str(e))
+            return None
+    
+    async def _rehydrate_rag_context(self, research: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Rebuild the RAG documents referenced by cached research.
+        
+        Documents seen recently are served from memory; the rest are fetched
+        from the index by ID.
+        
+        Args:
+            research: Cached consolidated research
+            
+        Returns:
+            RAG documents (best effort - missing documents are skipped)
+        """
+        refs = research.get("rag_context_refs")
+        if refs is None:
+            # Entries cached before documents were stored by reference
+            return research.get("rag_context", [])
+        
+        docs = {}
+        missing = []
+        for ref in refs:
+            doc = rag_cache.get(_rag_doc_key(ref))
+            if doc is not None:
+                docs[_rag_doc_key(ref)] = {**doc, 'score': ref.get('score', 0.0)}
+            else:
+                missing.append(ref)
+        
+        if missing and self.rag:
+            try:
+                for doc in await self.rag.fetch_documents(missing):
+                    rag_cache[_rag_doc_key(doc)] = doc
+                    docs[_rag_doc_key(doc)] = doc
+            except Exception as e:
+                logger.warning("rag_context_rehydration_failed", error=str(e))
+        
+        return [copy.deepcopy(docs[key]) for key in map(_rag_doc_key, refs) if key in docs]
+    
+    async def _get_cached_lookup(self, key: str) -> Optional[Any]:
+        """
+        Read a lookup result from the in-memory cache, falling back to the DB.
+        
+        Args:
+            key: Normalized cache key
+            
+        Returns:
+            Copy of the cached value, or None on miss
+        """
+        if key in research_cache:
+            return copy.deepcopy(research_cache[key])
+        
+        try:
+            cached = await self.db.get_cached_data(key)
+        except Exception as e:
+            logger.warning("lookup_cache_read_failed", cache_key=key, error=str(e))
+            return None
+        
+        if cached:
+            research_cache[key] = cached
+            return copy.deepcopy(cached)
+        return None
+    
+    async def _set_cached_lookup(self, key: str, value: Any) -> None:
+        """
+        Store a lookup result in memory and in the DB so it survives restarts.
+        
+        Args:
+            key: Normalized cache key
+            value: Result to cache (empty results are not cached)
+        """
+        if not value:
+            return
+        
+        research_cache[key] = copy.deepcopy(value)
+        try:
+            await self.db.cache_research_data(key, value, ttl=LOOKUP_CACHE_TTL)
+        except Exception as e:
+            logger.warning("lookup_cache_write_failed", cache_key=key, error=str(e))
+    
     async def gather_rag_context(
         self,
         query: str,
@@ -223,36 +413,68 @@ class ResearchAgent:
             
             logger.info("gathering_rag_context", query=query[:50])
             
-            # Sequential RAG searches to avoid rate limiting on free tier
-            # Search case studies
-            case_studies = await self.rag.semantic_search(
-                query=f"{query} {company} {industry}",
-                namespace="case_studies",
-                top_k=5
-            )
-            
-            # Search industry reports
-            industry_reports = await self.rag.semantic_search(
-                query=f"{industry} market analysis",
-                namespace="industry_reports",
-                top_k=3
-            )
+            sub_queries = [
+                (f"{query} {company} {industry}", "case_studies", 5),
+                (f"{industry} market analysis", "industry_reports", 3),
+                ("financial analysis framework", "financial_templates", 2)
+            ]
             
-            # Search financial templates
-            financial_templates = await self.rag.semantic_search(
-                query="financial analysis framework",
-                namespace="financial_templates",
-                top_k=2
-            )
+            # Serve repeated sub-queries from cache; only misses hit the index
+            keys = [
+                make_cache_key(" ".join(text.lower().split()), namespace, top_k)
+                for text, namespace, top_k in sub_queries
+            ]
+            results = [rag_cache.get(key) for key in keys]
+            misses = [i for i, result in enumerate(results) if result is None]
             
-            # Combine all results
+            if misses:
+                # One batched embedding pass, then similar queries are served locally
+                vectors = await asyncio.to_thread(
+                    self.rag.embed_batch, [sub_queries[i][0] for i in misses]
+                )
+                remote = []
+                for i, vector in zip(misses, vectors):
+                    _, namespace, top_k = sub_queries[i]
+                    local = self.rag_vector_cache.check(vector, (namespace, top_k))
+                    if local is not None:
+                        results[i] = local
+                    else:
+                        remote.append((i, vector))
+                
+                if remote:
+                    # Concurrent namespace queries for the rest
+                    fetched = await self.rag.multi_namespace_search(
+                        [sub_queries[i] for i, _ in remote],
+                        embeddings=[vector for _, vector in remote]
+                    )
+                    for (i, vector), result in zip(remote, fetched):
+                        results[i] = result
+                        if isinstance(result, list) and result:
+                            rag_cache[keys[i]] = result
+                            _, namespace, top_k = sub_queries[i]
+                            self.rag_vector_cache.store(vector, result, (namespace, top_k))
+            
+            # Combine all results, skipping documents already seen in another namespace
             all_docs = []
-            for result in [case_studies, industry_reports, financial_templates]:
+            seen = set()
+            for result in results:
                 if isinstance(result, list):
-                    all_docs.extend(result)
+                    for doc in result:
+                        digest = xxhash.xxh64_hexdigest(doc.get('text', '')[:256].encode())
+                        if digest not in seen:
+                            seen.add(digest)
+                            all_docs.append(copy.deepcopy(doc))
                 elif isinstance(result, Exception):
                     logger.warning("rag_search_failed", error=str(result))
             
+            # Most relevant first so prompt truncation keeps the best matches
+            all_docs.sort(key=lambda doc: doc.get('score', 0), reverse=True)
+            
+            # Keep documents addressable by ID for re-hydrating cached research
+            for doc in all_docs:
+                if 'id' in doc:
+                    rag_cache[_rag_doc_key(doc)] = copy.deepcopy(doc)
+            
             logger.info("rag_context_gathered", doc_count=len(all_docs))
             return all_docs
             
@@ -278,21 +500,22 @@ class ResearchAgent:
             List of news articles
         """
         try:
-            logger.info("fetching_live_news", company=company)
+            now = datetime.now()
+            from_date = (now - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+            to_date = now.strftime('%Y-%m-%d')
             
-            from_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
-            to_date = datetime.now().strftime('%Y-%m-%d')
+            # Date ranges have day granularity, so news is reused for the rest of the day
+            key = f"news:{company.lower().strip()}:{industry.lower().strip()}:{from_date}:{to_date}"
+            cached = await self._get_cached_lookup(key)
+            if cached:
+                logger.info("news_cache_hit", company=company)
+                return cached
             
-            # Fetch news for company and industry
-            company_news = await self.external.fetch_news_articles(
-                query=company,
-                from_date=from_date,
-                to_date=to_date,
-                max_results=5
-            )
+            logger.info("fetching_live_news", company=company)
             
-            industry_news = await self.external.fetch_news_articles(
-                query=industry,
+            # Fetch news for company and industry in one batched request
+            company_news, industry_news = await self.external.fetch_news_articles_batch(
+                queries=[company, industry],
                 from_date=from_date,
                 to_date=to_date,
                 max_results=5
@@ -301,6 +524,7 @@ class ResearchAgent:
             all_news = company_news + industry_news
             
             logger.info("news_fetched", count=len(all_news))
+            await self._set_cached_lookup(key, all_news)
             return all_news
             
         except Exception as e:
@@ -322,7 +546,7 @@ class ResearchAgent:
             
             # Try to get ticker (you may need a mapping service)
             # For now, try common patterns
-            ticker = await self._company_to_ticker(company)
+            ticker = self._company_to_ticker(company)
             
             if ticker:
                 data = await self.external.fetch_company_financials(ticker)
@@ -336,31 +560,18 @@ class ResearchAgent:
             logger.error("financial_data_failed", error=str(e))
             return {}
     
-    async def _company_to_ticker(self, company: str) -> Optional[str]:
+    def _company_to_ticker(self, company: str) -> Optional[str]:
         """
         Convert company name to stock ticker.
         
-        Common mappings for Indian companies:
+        Args:
+            company: Company name
+            
+        Returns:
+            Ticker symbol, or None if no alias matches
         """
-        ticker_map = {
-            'zomato': 'ZOMATO.NS',
-            'swiggy': 'SWIGGY.NS',
-            'flipkart': 'FLIPKART.NS',
-            'paytm': 'PAYTM.NS',
-            'ola': 'OLA.NS',
-            'tesla': 'TSLA',
-            'apple': 'AAPL',
-            'google': 'GOOGL',
-            'microsoft': 'MSFT',
-            'amazon': 'AMZN'
-        }
-        
-        company_lower = company.lower()
-        for key, ticker in ticker_map.items():
-            if key in company_lower:
-                return ticker
-        
-        return None
+        match = TICKER_PATTERN.search(company.lower())
+        return TICKER_MAP[match.group(1)] if match else None
     
     async def fetch_regulatory_info(
         self,
@@ -383,6 +594,12 @@ class ResearchAgent:
                 logger.warning("rag_not_available_skipping_regulatory")
                 return {'regulations': [], 'requirements': [], 'restrictions': []}
             
+            key = f"regulatory_info:{industry.lower().strip()}:{target_region.lower().strip()}"
+            cached = await self._get_cached_lookup(key)
+            if cached:
+                logger.info("regulatory_info_cache_hit", industry=industry)
+                return cached
+            
             logger.info("fetching_regulatory_info", industry=industry)
             
             # Query RAG for regulatory information
@@ -405,11 +622,13 @@ class ResearchAgent:
                         'excerpt': text[:200]
                     })
             
-            return {
+            regulatory_info = {
                 'regulations': regulations,
                 'requirements': requirements,
                 'restrictions': []
             }
+            await self._set_cached_lookup(key, regulatory_info)
+            return regulatory_info
             
         except Exception as e:
             logger.error("regulatory_info_failed", error=str(e))
@@ -431,6 +650,12 @@ class ResearchAgent:
             List of competitors with details
         """
         try:
+            key = f"competitors:{company.lower().strip()}:{industry.lower().strip()}"
+            cached = await self._get_cached_lookup(key)
+            if cached:
+                logger.info("competitors_cache_hit", company=company)
+                return cached
+            
             logger.info("identifying_competitors", company=company)
             
             # Skip RAG if not available
@@ -451,7 +676,7 @@ class ResearchAgent:
                 logger.warning("rag_not_available_using_llm_only")
             
             # Use LLM to extract competitors
-            prompt = IDENTIFY_COMPETITORS_PROMPT.format(
+            prompt = IDENTIFY_COMPETITORS_FN(
                 company=company,
                 industry=industry,
                 context=context_text or "No additional context available"
@@ -464,8 +689,10 @@ class ResearchAgent:
                 model=self.llm.groq_fast_model
             )
             
-            logger.info("competitors_identified", count=len(response) if isinstance(response, list) else 0)
-            return response if isinstance(response, list) else []
+            competitors = response if isinstance(response, list) else []
+            logger.info("competitors_identified", count=len(competitors))
+            await self._set_cached_lookup(key, competitors)
+            return competitors
             
         except Exception as e:
             logger.error("competitor_identification_failed", error=str(e))
@@ -498,22 +725,27 @@ class ResearchAgent:
             logger.info("consolidating_research_data")
             
             # Format inputs for LLM - Pruned for token efficiency
-            rag_text = "\n\n".join([
+            relevant_docs = [
+                doc for doc in rag_context
+                if doc.get('score', MIN_RAG_SCORE) >= MIN_RAG_SCORE
+            ]
+            rag_text = "\n\n".join(
                 f"[{doc.get('metadata', {}).get('source', 'Unknown')}]: {doc.get('text', '')[:200]}"
-                for doc in rag_context[:5]
-            ])
+                for doc in relevant_docs[:5]
+            )
             
-            news_text = "\n\n".join([
+            news_text = "\n\n".join(
                 f"[{article.get('source', 'Unknown')}]: {article.get('title', '')} - {article.get('summary', '')[:150]}"
                 for article in news[:5]
-            ])
+            )
             
-            financials_text = json.dumps(financials, indent=2)
-            regulatory_text = json.dumps(regulatory, indent=2)
-            competitors_text = json.dumps(competitors, indent=2)
+            # Compact JSON - pretty-printing only adds prompt tokens
+            financials_text = to_prompt_json(financials)
+            regulatory_text = to_prompt_json(regulatory)
+            competitors_text = to_prompt_json(competitors)
             
             # Generate consolidation prompt
-            prompt = CONSOLIDATE_RESEARCH_PROMPT.format(
+            prompt = CONSOLIDATE_RESEARCH_FN(
                 rag_context=rag_text or "No specific RAG context found.",
                 news=news_text or "No recent news found.",
                 financials=financials_text,
@@ -522,16 +754,29 @@ class ResearchAgent:
                 strategic_question=question
             )
             
-            # Call LLM
+            # Call LLM - thin research inputs don't need the flagship model
+            input_chars = (
+                len(rag_text) + len(news_text) + len(financials_text)
+                + len(regulatory_text) + len(competitors_text)
+            )
+            model = self.llm.route_model(input_chars)
+            logger.info("consolidation_model_selected", model=model, input_chars=input_chars)
+            
             consolidated = await self.llm.generate_structured_output(
                 prompt=prompt,
                 system_prompt="You are a senior research analyst at McKinsey & Company.",
-                response_schema={}
+                response_schema=CONSOLIDATE_RESEARCH_SCHEMA,
+                model=model
             )
             
             # Add metadata
-            consolidated['timestamp'] = datetime.utcnow().isoformat()
-            consolidated['rag_context'] = rag_context
+            consolidated['timestamp'] = datetime.now(timezone.utc).isoformat()
+            # Reference RAG documents by ID instead of embedding them in every cache entry
+            consolidated['rag_context_refs'] = [
+                {'id': doc['id'], 'namespace': doc.get('namespace', ''), 'score': doc.get('score', 0.0)}
+                for doc in rag_context
+                if 'id' in doc
+            ]
             consolidated['news_highlights'] = news
             consolidated['financial_snapshot'] = financials
             consolidated['citations'] = [
@@ -560,7 +805,7 @@ class ResearchAgent:
                 },
                 'data_gaps': ['LLM consolidation failed'],
                 'citations': [],
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.now(timezone.utc).isoformat()
             }
             
         except Exception as e:
@@ -1,23 +1,151 @@
 """Synthesizer Agent - Final recommendations and slide generation."""
 
+import asyncio
+import heapq
 import time
-import json
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from app.services.llm_service import LLMService
 from app.services.db_service import DatabaseService
-from app.services.slide_builder import SlideBuilder
+from app.services.llm_cache import LLMCache
 from app.models.state import AgentState
 from app.agents.prompts.synthesis_prompts import (
-    EXECUTIVE_SUMMARY_PROMPT,
-    RECOMMENDATION_SYNTHESIS_PROMPT,
-    IMPLEMENTATION_ROADMAP_PROMPT,
-    ALTERNATIVES_PROMPT
+    ALTERNATIVES_FN,
+    COMBINED_SYNTHESIS_FN,
+    COMBINED_SYNTHESIS_SCHEMA,
+    COMBINED_SYNTHESIS_VALIDATOR,
+    EXECUTIVE_SUMMARY_FN,
+    EXECUTIVE_SUMMARY_VALIDATOR,
+    IMPLEMENTATION_ROADMAP_FN
 )
+from app.utils.doc_utils import to_prompt_snippet
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Executive summary fields the implementation roadmap depends on
+ROADMAP_INPUT_FIELDS = frozenset({"recommendation", "timeline"})
+
+# Precompiled templates rendered through the generative cache, by template id
+SYNTHESIS_TEMPLATES = {
+    "combined_synthesis": COMBINED_SYNTHESIS_FN,
+    "executive_summary": EXECUTIVE_SUMMARY_FN,
+    "implementation_roadmap": IMPLEMENTATION_ROADMAP_FN,
+    "alternatives": ALTERNATIVES_FN
+}
+
+# Success metrics that do not depend on the analysis (CAC sits between them)
+SUCCESS_METRICS_HEAD = MappingProxyType({
+    "metric": "Market Share",
+    "type": "lagging",
+    "target": "10% by Year 5",
+    "frequency": "quarterly"
+})
+SUCCESS_METRICS_TAIL = tuple(MappingProxyType(metric) for metric in (
+    {
+        "metric": "LTV/CAC Ratio",
+        "type": "leading",
+        "target": ">3.0x",
+        "frequency": "monthly"
+    },
+    {
+        "metric": "Revenue Growth",
+        "type": "lagging",
+        "target": "50% YoY",
+        "frequency": "quarterly"
+    },
+    {
+        "metric": "Customer Retention Rate",
+        "type": "leading",
+        "target": ">85%",
+        "frequency": "monthly"
+    }
+))
+
+# Precompiled response validators, by template id (others are shape-checked inline)
+SYNTHESIS_VALIDATORS = {
+    "combined_synthesis": COMBINED_SYNTHESIS_VALIDATOR,
+    "executive_summary": EXECUTIVE_SUMMARY_VALIDATOR
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SynthesisInputs:
+    """
+    Analysis figures the synthesis steps read, extracted once per run.
+    
+    Attributes:
+        tam: Total addressable market (USD millions)
+        sam: Serviceable addressable market (USD millions)
+        som: Serviceable obtainable market at year 5 (USD millions)
+        revenue_y5: Base-case revenue in the final projected year
+        ltv_cac: LTV/CAC ratio
+        cac: Customer acquisition cost
+        unit_econ_assessment: Analyst assessment of the unit economics
+        valuation: DCF enterprise value
+        competitive_positioning: Competitive positioning summary
+        overall_risk: Regulatory risk level, None if not assessed
+        blockers: Key regulatory blockers
+        legal_structure: Recommended legal structure
+    """
+    tam: float
+    sam: float
+    som: float
+    revenue_y5: float
+    ltv_cac: float
+    cac: float
+    unit_econ_assessment: str
+    valuation: float
+    competitive_positioning: str
+    overall_risk: Optional[str]
+    blockers: Tuple[str, ...]
+    legal_structure: str
+    
+    @classmethod
+    def from_state(
+        cls,
+        market_analysis: Dict,
+        financial_model: Dict,
+        regulatory: Dict
+    ) -> "SynthesisInputs":
+        """
+        Extract synthesis inputs from the upstream agents' outputs.
+        
+        Args:
+            market_analysis: Analyst market sizing
+            financial_model: Analyst financial model
+            regulatory: Regulatory findings
+            
+        Returns:
+            SynthesisInputs instance
+        """
+        base = financial_model.get('scenarios', {}).get('base')
+        unit_econ = financial_model.get('unit_economics', {})
+        
+        return cls(
+            tam=market_analysis.get('TAM', {}).get('value_usd_millions', 0),
+            sam=market_analysis.get('SAM', {}).get('value_usd_millions', 0),
+            som=market_analysis.get('SOM', {}).get('year_5_usd_millions', 0),
+            revenue_y5=base[-1] if base else 0,
+            ltv_cac=unit_econ.get('LTV_CAC_ratio', 0),
+            cac=unit_econ.get('CAC', 200),
+            unit_econ_assessment=unit_econ.get('assessment', 'unknown'),
+            valuation=financial_model.get('valuation', {}).get('enterprise_value', 0),
+            competitive_positioning=financial_model.get('competitive_position', {}).get('positioning', 'Unknown'),
+            overall_risk=regulatory.get('overall_risk_level'),
+            blockers=tuple(regulatory.get('key_blockers', [])),
+            legal_structure=regulatory.get('recommended_structure', {}).get('recommended_structure', 'Unknown')
+        )
+    
+    @property
+    def is_degenerate(self) -> bool:
+        """True when there is no market/financial signal and no blockers."""
+        return not self.blockers and not any(
+            (self.tam, self.sam, self.som, self.revenue_y5, self.valuation)
+        )
+
 
 class SynthesizerAgent:
     """
@@ -40,6 +168,8 @@ class SynthesizerAgent:
         self.llm = llm
         self.db = db
         self.name = "synthesizer_agent"
+        # Reuses outputs for repeated or structurally similar syntheses
+        self.llm_cache = LLMCache(db=db)
         
         logger.info("synthesizer_agent_initialized")
     
@@ -63,39 +193,65 @@ class SynthesizerAgent:
             market_analysis = state.get("market_analysis", {})
             financial_model = state.get("financial_model", {})
             regulatory = state.get("regulatory_findings", {})
+            inputs = SynthesisInputs.from_state(market_analysis, financial_model, regulatory)
             
-            # 1. Generate Executive Summary
-            logger.info("generating_executive_summary")
-            exec_summary = await self.generate_executive_summary(
-                request, research, market_analysis, financial_model, regulatory
-            )
-            
-            # 2. Synthesize narratives
+            # 1-2. Executive Summary, roadmap and alternatives in one LLM call,
+            # alongside the narratives (independent of each other)
+            logger.info("generating_combined_synthesis")
             logger.info("synthesizing_narratives")
-            market_narrative = await self.synthesize_market_opportunity(market_analysis)
-            financial_narrative = await self.synthesize_financial_case(financial_model)
-            risk_assessment = await self.synthesize_risk_assessment(regulatory, market_analysis)
-            
-            # 3. Create Implementation Roadmap
-            logger.info("creating_implementation_roadmap")
-            implementation = await self.create_implementation_roadmap(
-                exec_summary, regulatory, financial_model
-            )
-            
-            # 4. Identify Success Metrics
-            logger.info("identifying_success_metrics")
-            metrics = await self.identify_success_metrics(
-                exec_summary, financial_model
-            )
-            
-            # 5. Generate Alternatives (if declined)
-            alternatives = []
-            if exec_summary.get("recommendation") == "decline":
-                logger.info("generating_alternatives")
-                alternatives = await self.generate_alternative_scenarios(state)
-            
-            # 6. Build Complete Slide Deck
+            combined_task = asyncio.create_task(self._combined_synthesis(
+                request, research, inputs, regulatory
+            ))
+            market_narrative = self.synthesize_market_opportunity(inputs)
+            financial_narrative = self.synthesize_financial_case(inputs)
+            risk_assessment = self.synthesize_risk_assessment(regulatory, inputs)
+            combined = await combined_task
+            
+            if combined is not None:
+                exec_summary, implementation, alternatives = combined
+                logger.info("identifying_success_metrics")
+                metrics = self.identify_success_metrics(exec_summary, inputs)
+            else:
+                # Fall back to one call per section. The roadmap only needs the
+                # recommendation and timeline, so it starts as soon as those
+                # stream in rather than after the whole summary.
+                logger.info("generating_executive_summary")
+                early_fields: Dict[str, str] = {}
+                recommendation_ready = asyncio.Event()
+                
+                def on_fields(fields: Dict[str, str]) -> None:
+                    early_fields.update(fields)
+                    if ROADMAP_INPUT_FIELDS <= early_fields.keys():
+                        recommendation_ready.set()
+                
+                exec_task = asyncio.create_task(self.generate_executive_summary(
+                    request, research, inputs, on_fields=on_fields
+                ))
+                exec_task.add_done_callback(lambda _: recommendation_ready.set())
+                
+                logger.info("creating_implementation_roadmap")
+                roadmap_task = asyncio.create_task(self._roadmap_when_ready(
+                    recommendation_ready, early_fields, exec_task, regulatory, financial_model
+                ))
+                
+                exec_summary = await exec_task
+                
+                # 4-5. Metrics and alternatives (if declined) need the full summary
+                logger.info("identifying_success_metrics")
+                metrics = self.identify_success_metrics(exec_summary, inputs)
+                follow_ups = [roadmap_task]
+                if exec_summary.get("recommendation") == "decline":
+                    logger.info("generating_alternatives")
+                    follow_ups.append(self.generate_alternative_scenarios(state))
+                
+                implementation, *alternatives = await asyncio.gather(*follow_ups)
+                alternatives = alternatives[0] if alternatives else []
+            
+            # 6. Build Complete Slide Deck (pure dict assembly, tens of
+            # microseconds - cheaper inline than a thread hand-off; the
+            # builder is imported on first use)
             logger.info("building_slide_deck")
+            from app.services.slide_builder import SlideBuilder
             slides = SlideBuilder.build_complete_deck(
                 request,
                 exec_summary,
@@ -120,8 +276,8 @@ class SynthesizerAgent:
             state["slides"] = slides
             state["metadata"]["synthesis_time"] = time.time() - start_time
             
-            # Log execution
-            await self.db.save_agent_log(
+            # Log execution (fire-and-forget; nothing downstream reads it)
+            self.db.save_agent_log_background(
                 agent_name=self.name,
                 execution_time=state["metadata"]["synthesis_time"],
                 success=True,
@@ -138,14 +294,11 @@ class SynthesizerAgent:
                 recommendation=exec_summary.get("recommendation", "unknown")
             )
             
-            # Update progress: Synthesizer complete (90%)
-            if "db_service" in state["metadata"] and "job_id" in state["metadata"]:
-                try:
-                    await state["metadata"]["db_service"].update_session_status(
-                        state["metadata"]["job_id"], "processing", 90
-                    )
-                except Exception as e:
-                    logger.warning("progress_update_failed", error=str(e))
+            # Update progress: Synthesizer complete (90%), off the critical path
+            if "job_id" in state["metadata"]:
+                self.db.update_session_progress_background(
+                    state["metadata"]["job_id"], 90
+                )
             
             return state
             
@@ -158,68 +311,162 @@ class SynthesizerAgent:
             logger.error("synthesizer_agent_failed", error=str(e), exc_info=True)
             return state
     
-    async def generate_executive_summary(
+    async def _cached_generate(
+        self,
+        template_id: str,
+        slots: Dict[str, Any],
+        system_prompt: str,
+        response_schema: Optional[Dict[str, Any]] = None,
+        on_fields: Optional[Callable[[Dict[str, str]], None]] = None
+    ) -> Any:
+        """
+        Render a synthesis template and generate structured output, via the cache.
+        
+        Args:
+            template_id: Key into SYNTHESIS_TEMPLATES
+            slots: Template field values
+            system_prompt: System prompt for the call
+            response_schema: Optional expected JSON shape
+            on_fields: Optional callback for early ROADMAP_INPUT_FIELDS (streams the call)
+            
+        Returns:
+            Parsed LLM output
+        """
+        key = self.llm_cache.make_key(template_id, slots, system_prompt)
+        cached = await self.llm_cache.get(key)
+        if cached is not None:
+            logger.info("synthesis_cache_hit", template_id=template_id)
+            return cached
+        
+        result = await self.llm.generate_structured_output(
+            prompt=SYNTHESIS_TEMPLATES[template_id](**slots),
+            system_prompt=system_prompt,
+            response_schema=response_schema or {},
+            watch_fields=tuple(ROADMAP_INPUT_FIELDS) if on_fields else (),
+            on_fields=on_fields,
+            validator=SYNTHESIS_VALIDATORS.get(template_id)
+        )
+        await self.llm_cache.update(key, result)
+        return result
+    
+    def _executive_summary_slots(
         self,
         request: Dict,
         research: Dict,
-        market_analysis: Dict,
-        financial_model: Dict,
+        inputs: SynthesisInputs
+    ) -> Dict[str, Any]:
+        """
+        Build the executive summary template slots.
+        
+        Figures are exact so the summary quotes the same numbers as the
+        slides; LLMCache rounds them only when building the cache key.
+        
+        Returns:
+            Slot values for EXECUTIVE_SUMMARY_PROMPT
+        """
+        return dict(
+            question=request.get('strategic_question', ''),
+            research_summary=to_prompt_snippet(research.get('key_findings', [])[:3], 500),
+            tam=inputs.tam,
+            sam=inputs.sam,
+            som=inputs.som,
+            competitive_summary=inputs.competitive_positioning,
+            revenue_y5=inputs.revenue_y5,
+            ltv_cac_ratio=inputs.ltv_cac,
+            unit_econ_assessment=inputs.unit_econ_assessment,
+            valuation=inputs.valuation,
+            regulatory_risk=inputs.overall_risk or 'unknown',
+            blockers=', '.join(inputs.blockers[:2]) or 'None',
+            legal_structure=inputs.legal_structure
+        )
+    
+    async def _combined_synthesis(
+        self,
+        request: Dict,
+        research: Dict,
+        inputs: SynthesisInputs,
         regulatory: Dict
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Generate executive summary, roadmap and alternatives in one LLM round-trip.
+        
+        The shared analysis context is sent once instead of three times.
+        Alternatives are kept only when the recommendation is "decline".
+        
+        Returns:
+            Tuple of (executive summary, roadmap phases, alternatives), or None
+            if the combined call failed and the per-section path should run
+        """
+        try:
+            if inputs.is_degenerate:
+                logger.info("exec_summary_short_circuited")
+                return self._default_executive_summary(), self._fallback_roadmap(regulatory), []
+            
+            slots = self._executive_summary_slots(request, research, inputs)
+            slots["requirements"] = to_prompt_snippet(regulatory.get('compliance_roadmap', []), 500)
+            
+            result = await self._cached_generate(
+                "combined_synthesis",
+                slots,
+                system_prompt="You are a McKinsey Partner creating an executive summary and implementation plan.",
+                response_schema=COMBINED_SYNTHESIS_SCHEMA
+            )
+            
+            exec_summary = result.get("executive_summary") if isinstance(result, dict) else None
+            if not isinstance(exec_summary, dict) or "recommendation" not in exec_summary:
+                logger.warning("combined_synthesis_incomplete")
+                return None
+            
+            roadmap = result.get("implementation_roadmap")
+            phases = roadmap.get("phases") if isinstance(roadmap, dict) else None
+            if not isinstance(phases, list):
+                phases = self._fallback_roadmap(regulatory)
+            
+            alternatives = []
+            if exec_summary.get("recommendation") == "decline":
+                alternatives = result.get("alternatives")
+                if not isinstance(alternatives, list):
+                    alternatives = []
+            
+            return exec_summary, phases, alternatives
+            
+        except Exception as e:
+            logger.error("combined_synthesis_failed", error=str(e))
+            return None
+    
+    async def generate_executive_summary(
+        self,
+        request: Dict,
+        research: Dict,
+        inputs: SynthesisInputs,
+        on_fields: Optional[Callable[[Dict[str, str]], None]] = None
     ) -> Dict[str, Any]:
         """
         Create executive summary with final recommendation.
         
+        Args:
+            on_fields: Optional callback receiving recommendation/timeline as
+                soon as they are generated
+        
         Returns:
             Executive summary dictionary
         """
         try:
-            # Extract key data
-            tam = market_analysis.get('TAM', {}).get('value_usd_millions', 0)
-            sam = market_analysis.get('SAM', {}).get('value_usd_millions', 0)
-            som = market_analysis.get('SOM', {}).get('year_5_usd_millions', 0)
-            
-            scenarios = financial_model.get('scenarios', {})
-            revenue_y5 = scenarios.get('base', [0])[-1] if scenarios.get('base') else 0
-            
-            unit_econ = financial_model.get('unit_economics', {})
-            ltv_cac = unit_econ.get('LTV_CAC_ratio', 0)
-            
-            valuation = financial_model.get('valuation', {}).get('enterprise_value', 0)
-            
-            comp_pos = financial_model.get('competitive_position', {})
-            
-            # Build prompt
-            prompt = EXECUTIVE_SUMMARY_PROMPT.format(
-                question=request.get('strategic_question', ''),
-                research_summary=json.dumps(research.get('key_findings', [])[:3])[:500],
-                tam=tam,
-                sam=sam,
-                som=som,
-                competitive_summary=comp_pos.get('positioning', 'Unknown'),
-                revenue_y5=revenue_y5,
-                ltv_cac_ratio=ltv_cac,
-                unit_econ_assessment=unit_econ.get('assessment', 'unknown'),
-                valuation=valuation,
-                regulatory_risk=regulatory.get('overall_risk_level', 'unknown'),
-                blockers=', '.join(regulatory.get('key_blockers', [])[:2]) or 'None',
-                legal_structure=regulatory.get('recommended_structure', {}).get('recommended_structure', 'Unknown')
-            )
+            if inputs.is_degenerate:
+                logger.info("exec_summary_short_circuited")
+                return self._default_executive_summary()
             
-            result = await self.llm.generate_structured_output(
-                prompt=prompt,
+            # Template slots (the cache keys on these, not the rendered text)
+            slots = self._executive_summary_slots(request, research, inputs)
+            
+            result = await self._cached_generate(
+                "executive_summary",
+                slots,
                 system_prompt="You are a McKinsey Partner creating an executive summary.",
-                response_schema={}
+                on_fields=on_fields
             )
             
-            return result if isinstance(result, dict) else {
-                "recommendation": "conditional",
-                "confidence": 0.7,
-                "supporting_points": ["Market opportunity exists", "Financial model viable", "Risks manageable"],
-                "key_risks": ["Execution risk", "Market competition", "Regulatory complexity"],
-                "expected_impact": "Significant market presence",
-                "timeline": "5 years",
-                "conditions": []
-            }
+            return result if isinstance(result, dict) else self._default_executive_summary()
             
         except Exception as e:
             logger.error("executive_summary_failed", error=str(e))
@@ -233,9 +480,22 @@ class SynthesizerAgent:
                 "conditions": []
             }
     
-    async def synthesize_market_opportunity(
+    @staticmethod
+    def _default_executive_summary() -> Dict[str, Any]:
+        """Executive summary used when the LLM output is unusable or unnecessary."""
+        return {
+            "recommendation": "conditional",
+            "confidence": 0.7,
+            "supporting_points": ["Market opportunity exists", "Financial model viable", "Risks manageable"],
+            "key_risks": ["Execution risk", "Market competition", "Regulatory complexity"],
+            "expected_impact": "Significant market presence",
+            "timeline": "5 years",
+            "conditions": []
+        }
+    
+    def synthesize_market_opportunity(
         self,
-        market_analysis: Dict
+        inputs: SynthesisInputs
     ) -> str:
         """
         Create narrative summary of market opportunity.
@@ -244,25 +504,21 @@ class SynthesizerAgent:
             3-4 sentence narrative
         """
         try:
-            tam = market_analysis.get('TAM', {}).get('value_usd_millions', 0)
-            sam = market_analysis.get('SAM', {}).get('value_usd_millions', 0)
-            som = market_analysis.get('SOM', {}).get('year_5_usd_millions', 0)
-            
-            narrative = f"The market opportunity represents a Total Addressable Market of ${tam:,.0f}M, "
-            narrative += f"with a Serviceable Addressable Market of ${sam:,.0f}M. "
-            narrative += f"Based on competitive dynamics and realistic penetration assumptions, "
-            narrative += f"the Serviceable Obtainable Market is estimated at ${som:,.0f}M by Year 5. "
-            narrative += "This represents a significant and achievable market opportunity."
-            
-            return narrative
+            return (
+                f"The market opportunity represents a Total Addressable Market of ${inputs.tam:,.0f}M, "
+                f"with a Serviceable Addressable Market of ${inputs.sam:,.0f}M. "
+                "Based on competitive dynamics and realistic penetration assumptions, "
+                f"the Serviceable Obtainable Market is estimated at ${inputs.som:,.0f}M by Year 5. "
+                "This represents a significant and achievable market opportunity."
+            )
             
         except Exception as e:
             logger.error("market_narrative_failed", error=str(e))
             return "Market opportunity analysis completed."
     
-    async def synthesize_financial_case(
+    def synthesize_financial_case(
         self,
-        financial_model: Dict
+        inputs: SynthesisInputs
     ) -> str:
         """
         Create financial case summary.
@@ -271,30 +527,22 @@ class SynthesizerAgent:
             Financial narrative
         """
         try:
-            unit_econ = financial_model.get('unit_economics', {})
-            ltv_cac = unit_econ.get('LTV_CAC_ratio', 0)
-            
-            valuation = financial_model.get('valuation', {}).get('enterprise_value', 0)
-            
-            scenarios = financial_model.get('scenarios', {})
-            base_y5 = scenarios.get('base', [0])[-1] if scenarios.get('base') else 0
-            
-            narrative = f"The financial model demonstrates strong unit economics with an LTV/CAC ratio of {ltv_cac:.1f}x, "
-            narrative += "well above the 3:1 benchmark for sustainable growth. "
-            narrative += f"Base case projections show revenue reaching ${base_y5:,.0f}M by Year 5. "
-            narrative += f"DCF valuation yields an enterprise value of ${valuation:,.0f}M, "
-            narrative += "indicating attractive returns for investors."
-            
-            return narrative
+            return (
+                f"The financial model demonstrates strong unit economics with an LTV/CAC ratio of {inputs.ltv_cac:.1f}x, "
+                "well above the 3:1 benchmark for sustainable growth. "
+                f"Base case projections show revenue reaching ${inputs.revenue_y5:,.0f}M by Year 5. "
+                f"DCF valuation yields an enterprise value of ${inputs.valuation:,.0f}M, "
+                "indicating attractive returns for investors."
+            )
             
         except Exception as e:
             logger.error("financial_narrative_failed", error=str(e))
             return "Financial analysis completed."
     
-    async def synthesize_risk_assessment(
+    def synthesize_risk_assessment(
         self,
         regulatory: Dict,
-        market_analysis: Dict
+        inputs: SynthesisInputs
     ) -> Dict[str, Any]:
         """
         Consolidated risk assessment.
@@ -306,8 +554,8 @@ class SynthesizerAgent:
             risk_matrix = regulatory.get('risk_matrix', {})
             risks = risk_matrix.get('risks', [])
             
-            # Get top 5 risks
-            top_risks = sorted(risks, key=lambda x: x.get('score', 0), reverse=True)[:5]
+            # Get top 5 risks (partial selection, no full sort)
+            top_risks = heapq.nlargest(5, risks, key=lambda x: x.get('score', 0))
             
             # Format for output
             formatted_risks = []
@@ -319,7 +567,7 @@ class SynthesizerAgent:
                     "mitigation": risk.get('mitigation', 'Under review')
                 })
             
-            overall_risk = regulatory.get('overall_risk_level', 'medium')
+            overall_risk = inputs.overall_risk or 'medium'
             
             # Determine risk appetite
             if overall_risk == 'low':
@@ -343,6 +591,27 @@ class SynthesizerAgent:
                 "risk_appetite": "unknown"
             }
     
+    async def _roadmap_when_ready(
+        self,
+        recommendation_ready: asyncio.Event,
+        early_fields: Dict[str, str],
+        exec_task: asyncio.Task,
+        regulatory: Dict,
+        financial_model: Dict
+    ) -> List[Dict[str, Any]]:
+        """
+        Create the roadmap once the recommendation and timeline are known.
+        
+        Uses the streamed fields if they arrived first, otherwise the
+        completed executive summary.
+        
+        Returns:
+            List of phase dictionaries
+        """
+        await recommendation_ready.wait()
+        recommendation = exec_task.result() if exec_task.done() else dict(early_fields)
+        return await self.create_implementation_roadmap(recommendation, regulatory, financial_model)
+    
     async def create_implementation_roadmap(
         self,
         recommendation: Dict,
@@ -356,43 +625,50 @@ class SynthesizerAgent:
             List of phase dictionaries
         """
         try:
-            prompt = IMPLEMENTATION_ROADMAP_PROMPT.format(
+            if recommendation.get('recommendation') == 'unknown':
+                logger.info("implementation_roadmap_short_circuited")
+                return self._fallback_roadmap(regulatory)
+            
+            slots = dict(
                 strategy=recommendation.get('recommendation', 'proceed'),
                 recommendation=recommendation.get('recommendation', 'proceed'),
                 timeline=recommendation.get('timeline', '12 months'),
-                requirements=json.dumps(regulatory.get('compliance_roadmap', []))[:500]
+                requirements=to_prompt_snippet(regulatory.get('compliance_roadmap', []), 500)
             )
             
-            result = await self.llm.generate_structured_output(
-                prompt=prompt,
-                system_prompt="You are a strategy consultant creating an implementation roadmap.",
-                response_schema={}
+            result = await self._cached_generate(
+                "implementation_roadmap",
+                slots,
+                system_prompt="You are a strategy consultant creating an implementation roadmap."
             )
             
             if isinstance(result, dict) and 'phases' in result:
                 return result['phases']
             
-            # Fallback roadmap
-            return regulatory.get('compliance_roadmap', [
-                {
-                    "phase": "Preparation (Months 1-3)",
-                    "duration": "3 months",
-                    "milestones": ["Regulatory approval", "Entity setup"],
-                    "key_activities": ["File applications", "Hire team"],
-                    "resources_required": ["Legal counsel", "Initial capital"],
-                    "success_metrics": ["Approvals obtained", "Team in place"],
-                    "risks": ["Approval delays"]
-                }
-            ])
+            return self._fallback_roadmap(regulatory)
             
         except Exception as e:
             logger.error("implementation_roadmap_failed", error=str(e))
             return []
     
-    async def identify_success_metrics(
+    def _fallback_roadmap(self, regulatory: Dict) -> List[Dict[str, Any]]:
+        """Roadmap used when the LLM returns no phases."""
+        return regulatory.get('compliance_roadmap', [
+            {
+                "phase": "Preparation (Months 1-3)",
+                "duration": "3 months",
+                "milestones": ["Regulatory approval", "Entity setup"],
+                "key_activities": ["File applications", "Hire team"],
+                "resources_required": ["Legal counsel", "Initial capital"],
+                "success_metrics": ["Approvals obtained", "Team in place"],
+                "risks": ["Approval delays"]
+            }
+        ])
+    
+    def identify_success_metrics(
         self,
         recommendation: Dict,
-        financial_model: Dict
+        inputs: SynthesisInputs
     ) -> List[Dict[str, Any]]:
         """
         Define KPIs to track success.
@@ -401,40 +677,19 @@ class SynthesizerAgent:
             List of metric dictionaries
         """
         try:
-            metrics = [
-                {
-                    "metric": "Market Share",
-                    "type": "lagging",
-                    "target": "10% by Year 5",
-                    "frequency": "quarterly"
-                },
-                {
-                    "metric": "Customer Acquisition Cost (CAC)",
-                    "type": "leading",
-                    "target": f"${financial_model.get('unit_economics', {}).get('CAC', 200):.0f}",
-                    "frequency": "monthly"
-                },
-                {
-                    "metric": "LTV/CAC Ratio",
-                    "type": "leading",
-                    "target": ">3.0x",
-                    "frequency": "monthly"
-                },
-                {
-                    "metric": "Revenue Growth",
-                    "type": "lagging",
-                    "target": "50% YoY",
-                    "frequency": "quarterly"
-                },
-                {
-                    "metric": "Customer Retention Rate",
-                    "type": "leading",
-                    "target": ">85%",
-                    "frequency": "monthly"
-                }
-            ]
+            cac_metric = {
+                "metric": "Customer Acquisition Cost (CAC)",
+                "type": "leading",
+                "target": f"${inputs.cac:.0f}",
+                "frequency": "monthly"
+            }
             
-            return metrics
+            # Fresh copies of the fixed metrics; the result ends up in mutable state
+            return [
+                dict(SUCCESS_METRICS_HEAD),
+                cac_metric,
+                *(dict(metric) for metric in SUCCESS_METRICS_TAIL)
+            ]
             
         except Exception as e:
             logger.error("success_metrics_failed", error=str(e))
@@ -453,15 +708,15 @@ class SynthesizerAgent:
         try:
             request = state["request"]
             
-            prompt = ALTERNATIVES_PROMPT.format(
+            slots = dict(
                 declined_strategy=request.get('strategic_question', ''),
                 decline_reason="Risk/reward profile unfavorable"
             )
             
-            result = await self.llm.generate_structured_output(
-                prompt=prompt,
-                system_prompt="You are a strategy consultant proposing alternatives.",
-                response_schema={}
+            result = await self._cached_generate(
+                "alternatives",
+                slots,
+                system_prompt="You are a strategy consultant proposing alternatives."
             )
             
             if isinstance(result, dict) and 'alternatives' in result:
@@ -4,9 +4,12 @@ import os
 from functools import lru_cache
 from typing import Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Publicly known placeholder from earlier releases; tokens signed with it can be forged
+PLACEHOLDER_JWT_SECRET = "your-secret-key-change-this-in-production"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -25,6 +28,10 @@ class Settings(BaseSettings):
         default="llama-3-8b-8192",
         description="Fast Groq model for lightweight tasks"
     )
+    llm_fast_model_max_input_tokens: int = Field(
+        default=2000,
+        description="Routable calls with smaller variable inputs use the fast model"
+    )
     openrouter_model: str = Field(
         default="google/gemini-2.0-flash-exp:free",
         description="OpenRouter model to use as fallback"
@@ -49,6 +56,14 @@ class Settings(BaseSettings):
         default=2.0,
         description="Delay between LLM requests to prevent rate limiting"
     )
+    llm_clarify_timeout: float = Field(
+        default=10.0,
+        description="Seconds to wait for the optional clarifying question before using a fallback"
+    )
+    llm_max_concurrency: int = Field(
+        default=10,
+        description="Maximum LLM requests in flight at once across all agents"
+    )
     
     # MongoDB Configuration
     mongodb_uri: str = Field(
@@ -59,6 +74,18 @@ class Settings(BaseSettings):
         default="stratagem_ai",
         description="MongoDB database name"
     )
+    mongodb_max_pool_size: int = Field(
+        default=50,
+        description="Maximum sockets in the MongoDB connection pool"
+    )
+    mongodb_min_pool_size: int = Field(
+        default=10,
+        description="Sockets kept open so requests skip TCP/TLS handshakes"
+    )
+    mongodb_wait_queue_timeout_ms: int = Field(
+        default=2000,
+        description="Fail a query after waiting this long for a free pooled socket"
+    )
     
     # Pinecone Configuration
     pinecone_api_key: str = Field(..., description="Pinecone API key for vector DB")
@@ -70,12 +97,12 @@ class Settings(BaseSettings):
     
     # Embedding Configuration
     embedding_model: str = Field(
-        default="sentence-transformers/all-mpnet-base-v2",
-        description="Embedding model (upgraded for better quality)"
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        description="Embedding model (must match the model the Pinecone index was built with)"
     )
     embedding_dimension: int = Field(
-        default=768,
-        description="Embedding dimension (768 for all-mpnet-base-v2)"
+        default=384,
+        description="Embedding dimension (384 for all-MiniLM-L6-v2)"
     )
     
     # RAG Configuration
@@ -101,11 +128,37 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
+    debug_memory: bool = Field(
+        default=False,
+        description="Log process RSS at startup milestones"
+    )
+    max_concurrent_analyses: int = Field(
+        default=4,
+        description="Maximum analysis jobs running at once (others wait as queued)"
+    )
     max_concurrent_agents: int = Field(
         default=8,
         description="Maximum number of concurrent agent executions (increased for speed)"
     )
     
+    # Outbound HTTP Configuration (shared connection pool)
+    http_max_connections: int = Field(
+        default=64,
+        description="Maximum connections in the shared outbound HTTP pool"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=32,
+        description="Maximum idle keep-alive connections in the shared HTTP pool"
+    )
+    http_timeout: float = Field(
+        default=30.0,
+        description="Default timeout in seconds for outbound HTTP requests"
+    )
+    http2_enabled: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 so concurrent requests to one host share a connection"
+    )
+    
     # API Configuration - Render Compatible
     api_host: str = Field(
         default="0.0.0.0", 
@@ -115,30 +168,56 @@ class Settings(BaseSettings):
         default=8080,
         description="API port (Pydantic reads from PORT env var automatically)"
     )
+    reload: bool = Field(
+        default=False,
+        description="Restart on code changes (development only; runs a single worker)"
+    )
+    workers: int = Field(
+        default=1,
+        description="Number of worker processes when started via python -m app.main"
+    )
     cors_origins: list[str] = Field(
         default=["*"],
         description="Allowed CORS origins"
     )
 
+    # Auth Configuration
+    jwt_secret: str = Field(
+        ...,
+        min_length=32,
+        description="HS256 signing key for access tokens (JWT_SECRET)"
+    )
+
     # Feature Flags
     enable_rag: bool = Field(
         default=False,
         description="Enable RAG service (requires Pinecone & Sentence Transformers)"
     )
     
+    @field_validator("jwt_secret")
+    @classmethod
+    def _reject_placeholder_jwt_secret(cls, value: str) -> str:
+        """Refuse to start with the placeholder signing key."""
+        if value == PLACEHOLDER_JWT_SECRET:
+            raise ValueError("JWT_SECRET is the public placeholder; set a random secret")
+        return value
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
     
+    Settings are validated once per process and frozen afterwards.
+    
     Returns:
         Settings: Cached application settings
     """
@@ -0,0 +1,28 @@
+"""FastAPI dependencies for services created by the application lifespan."""
+
+from fastapi import Request
+
+from app.services.db_service import DatabaseService
+from app.services.deck_service import DeckGenerationService
+from app.services.llm_service import LLMService
+from app.workflows.orchestrator import StratagemOrchestrator
+
+
+def get_db_service(request: Request) -> DatabaseService:
+    """Get the database service stored on app.state."""
+    return request.app.state.db_service
+
+
+def get_llm_service(request: Request) -> LLMService:
+    """Get the LLM service stored on app.state."""
+    return request.app.state.llm_service
+
+
+def get_orchestrator(request: Request) -> StratagemOrchestrator:
+    """Get the workflow orchestrator stored on app.state."""
+    return request.app.state.orchestrator
+
+
+def get_deck_service(request: Request) -> DeckGenerationService:
+    """Get the deck generation service stored on app.state."""
+    return request.app.state.deck_service
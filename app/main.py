@@ -1,25 +1,26 @@
 """Stratagem AI - FastAPI Application Entry Point."""
 
+import asyncio
 import psutil
 import os
+import httpx
+import orjson
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
-from app.routers import analysis
-from app.routers import auth
 from app.routers.analysis import router as analysis_router
 from app.routers.auth import router as auth_router
 from app.services.db_service import DatabaseService
-from app.services.rag_service import RAGService
 from app.services.llm_service import LLMService
 from app.services.external_apis import ExternalDataService
 from app.services.deck_service import DeckGenerationService
+from app.services.regulatory_data import RegulatoryDataService
 from app.agents.researcher import ResearchAgent
 from app.agents.analyst import AnalystAgent
 from app.agents.regulatory import RegulatoryAgent
@@ -27,24 +28,54 @@ from app.agents.synthesizer import SynthesizerAgent
 from app.workflows.orchestrator import StratagemOrchestrator
 from app.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from app.services.rag_service import RAGService
+
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Resolved once; memory_info() is a /proc read, so sampling is opt-in
+_PROCESS = psutil.Process(os.getpid())
+
+
 # Memory logging helper
-def log_memory(stage: str):
-    process = psutil.Process(os.getpid())
-    mem_info = process.memory_info()
-    mem_mb = mem_info.rss / 1024 / 1024
-    logger.info(f"💾 MEMORY [{stage}]: {mem_mb:.2f} MB")
-    print(f"💾 MEMORY [{stage}]: {mem_mb:.2f} MB")
-
-# Global services
-db_service: DatabaseService = None
-orchestrator: StratagemOrchestrator = None
-rag_service: RAGService = None # Added to make it accessible for set_services
-llm_service: LLMService = None # Added to make it accessible for set_services
-external_service: ExternalDataService = None # Added to make it accessible for set_services
-deck_service: DeckGenerationService = None # Added to make it accessible for set_services
+def log_memory(stage: str) -> None:
+    if not settings.debug_memory:
+        return
+    logger.info("memory_usage", stage=stage, rss_mb=_PROCESS.memory_info().rss >> 20)
+
+
+async def _init_rag_service() -> Optional["RAGService"]:
+    """
+    Load the embedding model and connect to Pinecone, if RAG is enabled.
+    
+    Returns:
+        Connected RAG service, or None if disabled or unavailable
+    """
+    if not settings.enable_rag:
+        logger.info("rag_service_disabled_by_config")
+        return None
+    
+    try:
+        logger.info("initializing_rag_service")
+        from app.services.rag_service import RAGService
+        
+        # Model loading is CPU/disk-bound; run it off the event loop
+        service = await asyncio.to_thread(
+            RAGService,
+            api_key=settings.pinecone_api_key,
+            environment=settings.pinecone_environment,
+            index_name=settings.pinecone_index_name,
+            embedding_model=settings.embedding_model
+        )
+        await service.connect()
+        log_memory("AFTER_RAG")
+        logger.info("rag_service_initialized")
+        return service
+    except Exception as rag_error:
+        logger.warning("rag_service_initialization_failed", error=str(rag_error))
+        logger.info("continuing_without_rag_service")
+        return None
 
 
 @asynccontextmanager
@@ -52,11 +83,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     Application lifespan manager.
     
-    Handles startup and shutdown events.
+    Handles startup and shutdown events. Services are stored on app.state
+    and reach the routers through the dependencies in app.dependencies.
     """
     # Startup
-    global db_service, orchestrator, rag_service, llm_service, external_service, deck_service
-    
     log_memory("APP_START")
     logger.info("application_starting", version="1.0.0")
     
@@ -66,44 +96,51 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         
         db_service = DatabaseService(
             mongodb_uri=settings.mongodb_uri,
-            db_name=settings.mongodb_db_name
+            db_name=settings.mongodb_db_name,
+            max_pool_size=settings.mongodb_max_pool_size,
+            min_pool_size=settings.mongodb_min_pool_size,
+            wait_queue_timeout_ms=settings.mongodb_wait_queue_timeout_ms
+        )
+        
+        # MongoDB and RAG (may fail if PyTorch not available) are independent;
+        # connect them concurrently. A DB failure still aborts startup.
+        _, rag_service = await asyncio.gather(
+            db_service.connect(),
+            _init_rag_service()
         )
-        await db_service.connect()
         log_memory("AFTER_DB")
         
-        # Initialize RAG service (lazy - may fail if PyTorch not available)
-        rag_service = None
-        if settings.enable_rag:
-            try:
-                logger.info("initializing_rag_service")
-                rag_service = RAGService(
-                    api_key=settings.pinecone_api_key,
-                    environment=settings.pinecone_environment,
-                    index_name=settings.pinecone_index_name
-                )
-                await rag_service.connect()
-                log_memory("AFTER_RAG")
-                logger.info("rag_service_initialized")
-            except Exception as rag_error:
-                logger.warning("rag_service_initialization_failed", error=str(rag_error))
-                logger.info("continuing_without_rag_service")
-        else:
-            logger.info("rag_service_disabled_by_config")
+        # One keep-alive connection pool shared by all outbound HTTP clients
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections
+            ),
+            timeout=settings.http_timeout,
+            http2=settings.http2_enabled
+        )
         
         llm_service = LLMService(
             groq_api_key=settings.groq_api_key,
             groq_model=settings.groq_model,
             groq_fast_model=settings.groq_fast_model,
+            fast_model_max_input_tokens=settings.llm_fast_model_max_input_tokens,
             openrouter_api_key=settings.openrouter_api_key,
             openrouter_model=settings.openrouter_model,
             openrouter_site_url=settings.openrouter_site_url,
             openrouter_site_name=settings.openrouter_site_name,
             max_retries=settings.llm_max_retries,
             retry_delay=settings.llm_retry_delay,
-            rate_limit_delay=settings.llm_rate_limit_delay
+            rate_limit_delay=settings.llm_rate_limit_delay,
+            max_concurrency=settings.llm_max_concurrency,
+            http_client=http_client
         )
         
-        external_service = ExternalDataService(newsapi_key=settings.newsapi_key)
+        external_service = ExternalDataService(
+            newsapi_key=settings.newsapi_key,
+            http_client=http_client
+        )
+        regulatory_data_service = RegulatoryDataService()
         
         deck_service = DeckGenerationService(output_dir="outputs")
         
@@ -112,9 +149,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         
         research_agent = ResearchAgent(rag_service, llm_service, db_service, external_service)
         analyst_agent = AnalystAgent(llm_service, db_service)
-        regulatory_agent = RegulatoryAgent(llm_service, rag_service, db_service)
+        regulatory_agent = RegulatoryAgent(
+            llm_service, rag_service, db_service, regulatory_data_service
+        )
         synthesizer_agent = SynthesizerAgent(llm_service, db_service)
         
+        await regulatory_agent.warmup()
+        
         # Initialize orchestrator
         logger.info("initializing_orchestrator")
         
@@ -125,9 +166,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             synthesizer_agent
         )
         
-        # Set services for routers (db, orchestrator, deck_service, llm_service)
-        analysis.set_services(db_service, orchestrator, deck_service, llm_service)
-        auth.set_services(db_service)
+        # Expose services to routers
+        app.state.db_service = db_service
+        app.state.llm_service = llm_service
+        app.state.deck_service = deck_service
+        app.state.orchestrator = orchestrator
         
         log_memory("AFTER_ALL_AGENTS")
         logger.info("application_started")
@@ -141,8 +184,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Shutdown
     logger.info("application_shutting_down")
     
-    if db_service:
-        await db_service.disconnect()
+    await db_service.disconnect()
+    await http_client.aclose()
     
     logger.info("application_shutdown_complete")
 
@@ -178,6 +221,12 @@ if not os.path.exists(static_dir):
 
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+# Frontend pages ship with the app; resolve them once instead of per request
+INDEX_PATH = os.path.join(static_dir, "index.html")
+LOGIN_PATH = os.path.join(static_dir, "login.html")
+INDEX_EXISTS = os.path.isfile(INDEX_PATH)
+LOGIN_EXISTS = os.path.isfile(LOGIN_PATH)
+
 
 @app.api_route(
     "/health",
@@ -186,13 +235,19 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
     summary="Health check endpoint",
     description="Check if the API is running and database is connected"
 )
-async def health_check() -> JSONResponse:
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint.
     
+    HEAD probes (load balancer / Render) get an empty 200 without building
+    the body, matching GET, which also answers 200 when degraded.
+    
     Returns:
         JSON response with health status
     """
+    if request.method == "HEAD":
+        return Response(status_code=200)
+    
     health_status = {
         "status": "healthy",
         "version": "1.0.0",
@@ -200,6 +255,7 @@ async def health_check() -> JSONResponse:
     }
     
     # Check database connection
+    db_service = getattr(request.app.state, "db_service", None)
     if db_service and db_service._initialized:
         health_status["database"] = "connected"
     else:
@@ -208,15 +264,16 @@ async def health_check() -> JSONResponse:
     
     logger.debug("health_check", status=health_status["status"])
     
-    return JSONResponse(content=health_status)
+    return Response(content=orjson.dumps(health_status), media_type="application/json")
 
 
 @app.api_route("/", methods=["GET", "HEAD"])
-async def root():
-    """Serve main application page."""
-    index_path = os.path.join(os.path.dirname(__file__), "static", "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+async def root(request: Request):
+    """Serve main application page (HEAD probes get an empty 200)."""
+    if request.method == "HEAD":
+        return Response(status_code=200)
+    if INDEX_EXISTS:
+        return FileResponse(INDEX_PATH)
     return {
         "name": "Stratagem AI",
         "version": "1.0.0",
@@ -229,9 +286,8 @@ async def root():
 @app.get("/login")
 async def login_page():
     """Serve login page."""
-    login_path = os.path.join(os.path.dirname(__file__), "static", "login.html")
-    if os.path.exists(login_path):
-        return FileResponse(login_path)
+    if LOGIN_EXISTS:
+        return FileResponse(LOGIN_PATH)
     return {"error": "Login page not found"}
 
 
@@ -242,6 +298,10 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.api_host,
         port=settings.port,
-        reload=True,
+        # "auto" picks uvloop/httptools when installed (uvloop is skipped on Windows)
+        loop="auto",
+        http="auto",
+        reload=settings.reload,
+        workers=1 if settings.reload else settings.workers,
         log_level=settings.log_level.lower()
     )
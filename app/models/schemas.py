@@ -1,10 +1,10 @@
 """Pydantic schemas for API requests and responses."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter
 
 
 class AnalysisType(str, Enum):
@@ -110,7 +110,7 @@ class ResearchData(BaseModel):
         description="Citations for all research sources"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Timestamp when research was conducted"
     )
 
@@ -171,3 +171,9 @@ class AnalysisResponse(BaseModel):
             }
         }
     }
+
+
+# Serializer for stored analysis session documents, built once. Dumps
+# straight to JSON bytes in pydantic-core instead of walking the (large)
+# document with jsonable_encoder on every request.
+SESSION_DOCUMENT_ADAPTER = TypeAdapter(Dict[str, Any])
@@ -1,6 +1,6 @@
 """User model for authentication."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
 
@@ -9,7 +9,7 @@ class User(BaseModel):
     """User model for MongoDB storage."""
     email: EmailStr
     password_hash: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     last_login: Optional[datetime] = None
     
     class Config:
@@ -1,44 +1,74 @@
 """Analysis API endpoints."""
 
 import os
+import stat
 import asyncio
-from datetime import datetime
-from typing import Dict, Optional
+import time
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Annotated, Dict, Optional
 
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Depends, Path, Request
+from fastapi.responses import JSONResponse, FileResponse, Response
 
-from app.models.schemas import AnalysisRequest, AnalysisResponse, AnalysisStatus
+from app.models.schemas import (
+    SESSION_DOCUMENT_ADAPTER,
+    AnalysisRequest,
+    AnalysisResponse,
+    AnalysisStatus
+)
+from app.dependencies import get_db_service, get_deck_service, get_llm_service, get_orchestrator
 from app.services.db_service import DatabaseService
+from app.services.deck_service import DeckGenerationService
+from app.services.llm_service import LLMService
+from app.workflows.orchestrator import StratagemOrchestrator
 from app.config import get_settings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["analysis"])
 
-# Global service instances (will be initialized in main.py)
-db_service: Optional[DatabaseService] = None
-orchestrator = None
-deck_service = None
-llm_service = None
+# Clarification is optional: bound its latency and stop calling the LLM
+# for a while after repeated failures
+CLARIFY_FALLBACK_QUESTION = "Could you provide more specific details about your primary goal for this analysis?"
+CLARIFY_BREAKER_THRESHOLD = 3
+CLARIFY_BREAKER_COOLDOWN = 30.0
+_clarify_breaker = {"failures": 0, "open_until": 0.0}
+
+# Process-wide cap on analyses running at once
+_analysis_slots = asyncio.Semaphore(get_settings().max_concurrent_analyses)
 
+# Job ids are str(uuid4()); malformed ids are rejected with 422 before any
+# cache or DB lookup. Path patterns run on pydantic-core's linear-time
+# regex engine, so the check cannot backtrack.
+JobId = Annotated[
+    str,
+    Path(pattern=r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+]
 
-def set_services(db: DatabaseService, orch, deck, llm) -> None:
-    """Set service instances."""
-    global db_service, orchestrator, deck_service, llm_service
-    db_service = db
-    orchestrator = orch
-    deck_service = deck
-    llm_service = llm
+# Stored status string -> enum member (plain dict get instead of the enum constructor)
+STATUS_BY_VALUE = MappingProxyType({member.value: member for member in AnalysisStatus})
 
+# Downloadable formats and their content types
+MEDIA_TYPES = MappingProxyType({
+    "pdf": "application/pdf",
+    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "json": "application/json"
+})
 
 @router.post(
     "/clarify",
     summary="Get clarification question",
     description="Get a single clarifying question from LLM before starting analysis"
 )
-async def get_clarification(request: AnalysisRequest):
+async def get_clarification(
+    request: AnalysisRequest,
+    llm_service: LLMService = Depends(get_llm_service)
+):
     """Get a clarifying question from LLM."""
+    if time.monotonic() < _clarify_breaker["open_until"]:
+        return {"question": CLARIFY_FALLBACK_QUESTION}
+    
     try:
         prompt = f"""
         You are a management consulting assistant. User wants an analysis for:
@@ -49,22 +79,52 @@ async def get_clarification(request: AnalysisRequest):
         Based on this, ask exactly ONE clarifying question if needed that would help make the analysis more targeted and valuable.
         Keep it professional.
         """
-        response = await llm_service.generate(
-            prompt=prompt
+        response = await asyncio.wait_for(
+            llm_service.generate(prompt=prompt),
+            timeout=get_settings().llm_clarify_timeout
         )
         
         # If llm_service.generate_json returns a string or dict, adjust accordingly
         # Assuming it returns a string if response_model is None
         question = response if isinstance(response, str) else str(response)
         
+        _clarify_breaker["failures"] = 0
         return {"question": question.strip()}
     except Exception as e:
-        logger.error("clarification_failed", error=str(e))
-        return {"question": "Could you provide more specific details about your primary goal for this analysis?"}
+        logger.error("clarification_failed", error=str(e) or type(e).__name__)
+        _clarify_breaker["failures"] += 1
+        if _clarify_breaker["failures"] >= CLARIFY_BREAKER_THRESHOLD:
+            _clarify_breaker["failures"] = 0
+            _clarify_breaker["open_until"] = time.monotonic() + CLARIFY_BREAKER_COOLDOWN
+            logger.warning("clarification_breaker_opened", cooldown=CLARIFY_BREAKER_COOLDOWN)
+        return {"question": CLARIFY_FALLBACK_QUESTION}
+
+
+async def run_analysis_background(
+    job_id: str,
+    request_data: Dict,
+    db_service: DatabaseService,
+    orchestrator: StratagemOrchestrator,
+    deck_service: DeckGenerationService
+):
+    """
+    Background task to run complete analysis.
+    
+    Jobs beyond max_concurrent_analyses stay "queued" until a slot frees
+    up, bounding DB connections and LLM load under bursts.
+    """
+    async with _analysis_slots:
+        await _run_analysis(job_id, request_data, db_service, orchestrator, deck_service)
 
 
-async def run_analysis_background(job_id: str, request_data: Dict):
-    """Background task to run complete analysis."""
+async def _run_analysis(
+    job_id: str,
+    request_data: Dict,
+    db_service: DatabaseService,
+    orchestrator: StratagemOrchestrator,
+    deck_service: DeckGenerationService
+) -> None:
+    """Run the workflow and output generation for one job."""
     try:
         logger.info("background_analysis_starting", job_id=job_id)
         
@@ -84,7 +144,7 @@ async def run_analysis_background(job_id: str, request_data: Dict):
             "errors": [],
             "metadata": {
                 "job_id": job_id,
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": datetime.now(timezone.utc).isoformat()
             }
         }
         
@@ -93,24 +153,23 @@ async def run_analysis_background(job_id: str, request_data: Dict):
         
         # We'll manually track progress since LangGraph doesn't expose per-node callbacks easily
         # Progress: 10% (started) → 25% (research) → 50% (analyst) → 75% (regulatory) → 90% (synthesizer) → 100% (files ready)
-        
-        # Store job_id in state metadata for progress updates
-        initial_state["metadata"]["job_id"] = job_id
-        initial_state["metadata"]["db_service"] = db_service
-        
+        # Agents report progress through their own db service, keyed by metadata["job_id"]
         final_state = await orchestrator.execute(initial_state)
         
         # Check if orchestrator had errors
-        if final_state.get("errors"):
-            error_msg = "; ".join(final_state["errors"])
-            logger.error("orchestrator_had_errors", job_id=job_id, errors=error_msg)
+        errors = final_state.get("errors")
+        if errors:
+            logger.error("orchestrator_had_errors", job_id=job_id, errors=errors)
             await db_service.update_session_status(
-                job_id, "failed", 0, 
-                error_message=f"Analysis failed: {error_msg}"
+                job_id, "failed", 0,
+                error_message=f"Analysis failed: {errors[0]}",
+                errors=errors
             )
             return
         
-        # Generate outputs (PDF, PPT, JSON) ONLY if orchestrator succeeded
+        # Generate outputs (PDF, PPT, JSON) ONLY if orchestrator succeeded.
+        # Files are published atomically, so the returned paths are complete
+        # (a failed write raises and marks the job failed below).
         logger.info("generating_outputs", job_id=job_id)
         output_paths = await deck_service.generate_all_outputs(
             job_id=job_id,
@@ -119,44 +178,13 @@ async def run_analysis_background(job_id: str, request_data: Dict):
             company_name=request_data.get("company_name", "Company")
         )
         
-        # Verify files exist before marking as completed
-        import os
-        files_ready = all(
-            os.path.exists(path) for path in output_paths.values() if path
-        )
-        
-        if not files_ready:
-            logger.warning("output_files_not_ready", job_id=job_id, paths=output_paths)
-            # Wait a bit for file system to sync
-            import asyncio
-            await asyncio.sleep(1)
-            # Check again
-            files_ready = all(
-                os.path.exists(path) for path in output_paths.values() if path
-            )
-        
-        if not files_ready:
-            logger.error("output_files_missing", job_id=job_id, paths=output_paths)
-            await db_service.update_session_status(
-                job_id, "failed", 0,
-                error_message="Failed to generate output files"
-            )
-            return
-        
-        # Clean up non-serializable objects from state metadata before saving
-        if "db_service" in final_state.get("metadata", {}):
-            del final_state["metadata"]["db_service"]
-        
-        # Update session with results
+        # Store results and mark as completed (single write, after the files exist)
         await db_service.update_session_with_results(
             job_id=job_id,
             final_state=final_state,
             output_paths=output_paths
         )
         
-        # Mark as completed ONLY after files are verified
-        await db_service.update_session_status(job_id, "completed", 100)
-        
         logger.info("background_analysis_complete", job_id=job_id, output_paths=output_paths)
         
     except Exception as e:
@@ -173,12 +201,18 @@ async def run_analysis_background(job_id: str, request_data: Dict):
 )
 async def create_analysis(
     request: AnalysisRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    db_service: DatabaseService = Depends(get_db_service),
+    orchestrator: StratagemOrchestrator = Depends(get_orchestrator),
+    deck_service: DeckGenerationService = Depends(get_deck_service)
 ) -> AnalysisResponse:
     try:
+        # Serialize the request once; the session and the background job share it
+        request_data = request.model_dump()
+        
         # Create session data
         session_data = {
-            "request": request.model_dump(),
+            "request": request_data,
             "metadata": {
                 "created_by": "api",
                 "version": "1.0.0"
@@ -199,7 +233,10 @@ async def create_analysis(
         background_tasks.add_task(
             run_analysis_background,
             job_id,
-            request.model_dump()
+            request_data,
+            db_service,
+            orchestrator,
+            deck_service
         )
         
         # Return response
@@ -207,7 +244,7 @@ async def create_analysis(
             job_id=job_id,
             status=AnalysisStatus.QUEUED,
             progress=0,
-            created_at=datetime.utcnow(),
+            created_at=datetime.now(timezone.utc),
             completed_at=None,
             result_urls=None
         )
@@ -220,28 +257,84 @@ async def create_analysis(
         )
 
 
+async def get_session(
+    job_id: JobId,
+    db_service: DatabaseService = Depends(get_db_service)
+) -> Dict:
+    """
+    Look up the session named in the path, raising 404 if it does not exist.
+    
+    FastAPI caches dependency results per request, so endpoints and other
+    dependencies that need the session share a single lookup.
+    """
+    try:
+        session = await db_service.get_analysis_session(job_id)
+    except Exception as e:
+        logger.error("get_session_failed", job_id=job_id, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve analysis job"
+        )
+    
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Analysis job {job_id} not found"
+        )
+    return session
+
+
+async def get_completed_session(session: Dict = Depends(get_session)) -> Dict:
+    """Require the session to be completed, raising 400 otherwise."""
+    if session["status"] != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Analysis not complete: {session['status']}"
+        )
+    return session
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison: any listed tag (or "*") matches, ignoring W/."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (part.strip() for part in if_none_match.split(","))
+    )
+
+
 @router.get(
     "/status/{job_id}",
     response_model=AnalysisResponse,
     summary="Get analysis job status",
     description="Retrieve the current status and progress of an analysis job"
 )
-async def get_analysis_status(job_id: str) -> AnalysisResponse:
-    """Get analysis job status."""
+async def get_analysis_status(
+    job_id: JobId,
+    request: Request,
+    response: Response,
+    session: Dict = Depends(get_session)
+) -> AnalysisResponse:
+    """
+    Get analysis job status.
+    
+    Responses carry a weak ETag derived from status and progress, so
+    pollers sending If-None-Match get an empty 304 until the job advances.
+    """
     try:
-        # Retrieve session
-        session = await db_service.get_analysis_session(job_id)
+        etag = f'W/"{session["status"]}-{session["progress"]}"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
         
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Analysis job {job_id} not found"
-            )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
         
         # Convert to response model
         return AnalysisResponse(
             job_id=session["job_id"],
-            status=AnalysisStatus(session["status"]),
+            status=STATUS_BY_VALUE[session["status"]],
             progress=session["progress"],
             created_at=session["created_at"],
             completed_at=session.get("completed_at"),
@@ -264,24 +357,16 @@ async def get_analysis_status(job_id: str) -> AnalysisResponse:
     summary="Get analysis results",
     description="Get complete analysis results (JSON)"
 )
-async def get_analysis_results(job_id: str) -> Dict:
+async def get_analysis_results(
+    job_id: JobId,
+    session: Dict = Depends(get_completed_session)
+) -> Response:
     """Get complete analysis results."""
     try:
-        session = await db_service.get_analysis_session(job_id)
-        
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Analysis job {job_id} not found"
-            )
-        
-        if session["status"] != "completed":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Analysis not complete: {session['status']}"
-            )
-        
-        return session
+        return Response(
+            content=SESSION_DOCUMENT_ADAPTER.dump_json(session, fallback=str),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
@@ -293,53 +378,62 @@ async def get_analysis_results(job_id: str) -> Dict:
         )
 
 
-@router.get(
+class _OutputFileResponse(FileResponse):
+    """FileResponse that reads generated decks in 1 MiB chunks instead of 64 KiB."""
+    
+    # Each read is a worker-thread hop plus an ASGI send
+    chunk_size = 1024 * 1024
+
+
+def _stat_output_file(path: Optional[str]) -> Optional[os.stat_result]:
+    """Stat a generated file, returning None if it is missing or not a regular file."""
+    if not path:
+        return None
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+@router.api_route(
     "/download/{job_id}/{format}",
+    methods=["GET", "HEAD"],
     summary="Download analysis file",
     description="Download PDF, PPTX, or JSON file"
 )
-async def download_file(job_id: str, format: str):
+async def download_file(
+    job_id: JobId,
+    format: str,
+    session: Dict = Depends(get_completed_session)
+):
     """Download generated file."""
-    if format not in ["pdf", "pptx", "json"]:
+    if format not in MEDIA_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Format must be: pdf, pptx, or json"
         )
     
     try:
-        session = await db_service.get_analysis_session(job_id)
-        
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Analysis job {job_id} not found"
-            )
-        
-        if session["status"] != "completed":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Analysis not complete: {session['status']}"
-            )
-        
         output_paths = session.get("output_paths", {})
         file_path = output_paths.get(format)
         
-        if not file_path or not os.path.exists(file_path):
+        # One stat serves both the existence check and the response headers
+        file_stat = _stat_output_file(file_path)
+        if file_stat is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"File not found: {format}"
             )
         
-        media_types = {
-            "pdf": "application/pdf",
-            "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            "json": "application/json"
-        }
+        # Filenames are stored with the results (older sessions lack them)
+        filename = session.get("output_filenames", {}).get(format) or os.path.basename(file_path)
         
-        return FileResponse(
+        return _OutputFileResponse(
             file_path,
-            media_type=media_types.get(format, "application/octet-stream"),
-            filename=os.path.basename(file_path)
+            media_type=MEDIA_TYPES[format],
+            filename=filename,
+            stat_result=file_stat
         )
         
     except HTTPException:
@@ -1,14 +1,19 @@
 """Authentication router for user signup and login."""
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import jwt
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Header, Depends
-from jose import JWTError, jwt
 from pymongo.errors import DuplicateKeyError
 
+from app.config import get_settings
+from app.dependencies import get_db_service
 from app.models.user import UserCreate, UserLogin, UserResponse
-from app.utils.auth import hash_password, verify_password
+from app.services.db_service import DatabaseService
+from app.utils.auth import hash_password_async, verify_password_async
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,34 +21,50 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 # JWT Configuration
-SECRET_KEY = "your-secret-key-change-this-in-production"  # TODO: Move to env
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
+_SIGNING_KEY = get_settings().jwt_secret.encode()
 
-# Global service instances (set by main.py)
-db_service = None
-
-
-def set_services(db):
-    """Set global service instances."""
-    global db_service
-    db_service = db
+# Verified token -> payload, so polling clients skip re-verifying the signature
+_token_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-async def get_current_user(authorization: Optional[str] = Header(None)):
+def _decode_token(token: str) -> dict:
+    """
+    Verify a JWT and return its payload, reusing recent verifications.
+    
+    Cached payloads are still checked against their expiry on every hit.
+    
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or expired
+    """
+    payload = _token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
+        _token_cache[token] = payload
+    elif payload.get("exp", float("inf")) <= time.time():
+        _token_cache.pop(token, None)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+
+async def get_current_user(
+    authorization: Optional[str] = Header(None),
+    db_service: DatabaseService = Depends(get_db_service)
+):
     """Get current user from JWT token."""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -51,11 +72,11 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
     token = authorization.split(" ")[1]
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
     
     user = await db_service.get_user_by_email(email)
@@ -66,7 +87,10 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
 
 
 @router.post("/signup")
-async def signup(user_data: UserCreate):
+async def signup(
+    user_data: UserCreate,
+    db_service: DatabaseService = Depends(get_db_service)
+):
     """
     Create a new user account.
     
@@ -78,7 +102,7 @@ async def signup(user_data: UserCreate):
     """
     try:
         # Hash password
-        password_hash = hash_password(user_data.password)
+        password_hash = await hash_password_async(user_data.password)
         
         # Create user in database
         email = await db_service.create_user(
@@ -113,7 +137,10 @@ async def signup(user_data: UserCreate):
 
 
 @router.post("/login")
-async def login(credentials: UserLogin):
+async def login(
+    credentials: UserLogin,
+    db_service: DatabaseService = Depends(get_db_service)
+):
     """
     Authenticate user and return access token.
     
@@ -134,7 +161,7 @@ async def login(credentials: UserLogin):
             )
         
         # Verify password
-        if not verify_password(credentials.password, user["password_hash"]):
+        if not await verify_password_async(credentials.password, user["password_hash"]):
             raise HTTPException(
                 status_code=401,
                 detail="Invalid email or password"
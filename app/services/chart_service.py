@@ -1,20 +1,87 @@
 """Chart generation service using Plotly."""
 
+import numpy as np
+import orjson
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, List, Optional
+import functools
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 
+# Figure validation dominates chart cost, and cached LLM outputs repeat
+# the same inputs, so the serialized figure is memoized per input tuple
+CHART_CACHE_SIZE = 256
+
+# Shared styling; Plotly copies these into each figure, so they are never mutated
+DEFAULT_FONT = dict(size=12)
+TOP_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+FUNNEL_STAGES = ("TAM<br>(Total Market)", "SAM<br>(Serviceable)", "SOM<br>(Obtainable)")
+FUNNEL_MARKER = dict(color=("#1f77b4", "#ff7f0e", "#2ca02c"))
+FORCE_LABELS = {
+    'new_entrants': 'Threat of<br>New Entrants',
+    'supplier_power': 'Supplier<br>Power',
+    'buyer_power': 'Buyer<br>Power',
+    'substitutes': 'Threat of<br>Substitutes',
+    'rivalry': 'Competitive<br>Rivalry'
+}
+FORCES_POLAR = dict(
+    radialaxis=dict(
+        visible=True,
+        range=(0, 5),
+        tickvals=(1, 2, 3, 4, 5),
+        ticktext=('1<br>Low', '2', '3<br>Medium', '4', '5<br>High')
+    )
+)
+
+
+def _figure_json(fig: go.Figure) -> str:
+    """
+    Serialize a figure built in this module to a JSON string.
+    
+    Figures are validated as they are built, so this skips the extra
+    to_dict() copy and re-validation done by fig.to_json().
+    """
+    return orjson.dumps(
+        fig.to_plotly_json(),
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _figure_dict(fig: go.Figure) -> Dict[str, Any]:
+    """Convert a figure to a plain JSON-compatible dict."""
+    return orjson.loads(_figure_json(fig))
+
+
+def _cached_figure(builder: Callable[..., go.Figure]) -> Callable[..., Dict[str, Any]]:
+    """
+    Memoize a figure builder by its (hashable) arguments.
+    
+    The serialized figure is cached and every caller gets a freshly parsed
+    dict, so results can be embedded in state and mutated without sharing.
+    """
+    @lru_cache(maxsize=CHART_CACHE_SIZE)
+    def cached(*args, **kwargs) -> str:
+        return _figure_json(builder(*args, **kwargs))
+    
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        return orjson.loads(cached(*args, **kwargs))
+    
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
 
 class ChartService:
-    """Service for generating Plotly charts as JSON."""
+    """Service for generating Plotly charts as JSON-compatible figure dicts."""
     
     @staticmethod
+    @_cached_figure
     def create_market_sizing_chart(
         tam: float,
         sam: float,
         som: float
-    ) -> str:
+    ) -> go.Figure:
         """
         Create funnel chart for TAM/SAM/SOM.
         
@@ -24,15 +91,13 @@ class ChartService:
             som: Serviceable Obtainable Market
             
         Returns:
-            Plotly chart as JSON string
+            Plotly figure as a JSON-compatible dict
         """
         fig = go.Figure(go.Funnel(
-            y=["TAM<br>(Total Market)", "SAM<br>(Serviceable)", "SOM<br>(Obtainable)"],
+            y=FUNNEL_STAGES,
             x=[tam, sam, som],
             textinfo="value+percent initial",
-            marker=dict(
-                color=["#1f77b4", "#ff7f0e", "#2ca02c"]
-            )
+            marker=FUNNEL_MARKER
         ))
         
         fig.update_layout(
@@ -41,13 +106,13 @@ class ChartService:
             height=400
         )
         
-        return fig.to_json()
+        return fig
     
     @staticmethod
     def create_revenue_projection_chart(
         scenarios: Dict[str, List[float]],
         years: Optional[List[int]] = None
-    ) -> str:
+    ) -> Dict[str, Any]:
         """
         Create line chart with 3 revenue scenarios.
         
@@ -56,11 +121,26 @@ class ChartService:
             years: Optional list of year labels
             
         Returns:
-            Plotly chart as JSON string
+            Plotly figure as a JSON-compatible dict
         """
         if years is None:
             years = list(range(1, len(scenarios.get('base', [])) + 1))
         
+        series = tuple(
+            (name, tuple(scenarios[name]))
+            for name in ('base', 'upside', 'downside')
+            if name in scenarios
+        )
+        return ChartService._revenue_projection_figure(series, tuple(years))
+    
+    @staticmethod
+    @_cached_figure
+    def _revenue_projection_figure(
+        series: Tuple[Tuple[str, Tuple[float, ...]], ...],
+        years: Tuple[int, ...]
+    ) -> go.Figure:
+        """Build the revenue projection chart from hashable inputs."""
+        scenarios = dict(series)
         fig = go.Figure()
         
         # Base case
@@ -101,23 +181,17 @@ class ChartService:
             xaxis_title="Year",
             yaxis_title="Revenue (USD Millions)",
             hovermode='x unified',
-            font=dict(size=12),
+            font=DEFAULT_FONT,
             height=450,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            legend=TOP_LEGEND
         )
         
-        return fig.to_json()
+        return fig
     
     @staticmethod
     def create_porters_five_forces_chart(
         forces: Dict[str, Dict[str, any]]
-    ) -> str:
+    ) -> Dict[str, Any]:
         """
         Create radar chart for Porter's Five Forces.
         
@@ -125,25 +199,24 @@ class ChartService:
             forces: Dict with force names as keys, each containing 'score'
             
         Returns:
-            Plotly chart as JSON string
+            Plotly figure as a JSON-compatible dict
         """
         # Extract force names and scores
         categories = []
         values = []
         
-        force_labels = {
-            'new_entrants': 'Threat of<br>New Entrants',
-            'supplier_power': 'Supplier<br>Power',
-            'buyer_power': 'Buyer<br>Power',
-            'substitutes': 'Threat of<br>Substitutes',
-            'rivalry': 'Competitive<br>Rivalry'
-        }
-        
-        for key, label in force_labels.items():
+        for key, label in FORCE_LABELS.items():
             if key in forces:
                 categories.append(label)
                 values.append(forces[key].get('score', 0))
         
+        # Only labels and scores reach the chart, so rationale text is not part of the key
+        return ChartService._porters_five_forces_figure(tuple(categories), tuple(values))
+    
+    @staticmethod
+    @_cached_figure
+    def _porters_five_forces_figure(categories: Tuple[str, ...], values: Tuple[float, ...]) -> go.Figure:
+        """Build the Five Forces radar chart from hashable inputs."""
         fig = go.Figure()
         
         fig.add_trace(go.Scatterpolar(
@@ -156,27 +229,20 @@ class ChartService:
         ))
         
         fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 5],
-                    tickvals=[1, 2, 3, 4, 5],
-                    ticktext=['1<br>Low', '2', '3<br>Medium', '4', '5<br>High']
-                )
-            ),
+            polar=FORCES_POLAR,
             title="Porter's Five Forces Analysis",
-            font=dict(size=12),
+            font=DEFAULT_FONT,
             height=500,
             showlegend=False
         )
         
-        return fig.to_json()
+        return fig
     
     @staticmethod
     def create_competitor_comparison(
         data: List[Dict[str, any]],
         metric: str = "revenue"
-    ) -> str:
+    ) -> Dict[str, Any]:
         """
         Create bar chart comparing competitors.
         
@@ -185,7 +251,7 @@ class ChartService:
             metric: Metric to compare (default: 'revenue')
             
         Returns:
-            Plotly chart as JSON string
+            Plotly figure as a JSON-compatible dict
         """
         companies = [d.get('name', 'Unknown') for d in data]
         values = [d.get(metric, 0) for d in data]
@@ -209,18 +275,19 @@ class ChartService:
             title=f"Competitive Comparison - {metric.title()}",
             xaxis_title="Company",
             yaxis_title=f"{metric.title()} (USD Millions)",
-            font=dict(size=12),
+            font=DEFAULT_FONT,
             height=400,
             showlegend=False
         )
         
-        return fig.to_json()
+        return _figure_dict(fig)
     
     @staticmethod
+    @_cached_figure
     def create_unit_economics_chart(
         cac: float,
         ltv: float
-    ) -> str:
+    ) -> go.Figure:
         """
         Create bar chart showing CAC vs LTV.
         
@@ -229,7 +296,7 @@ class ChartService:
             ltv: Lifetime Value
             
         Returns:
-            Plotly chart as JSON string
+            Plotly figure as a JSON-compatible dict
         """
         fig = go.Figure(data=[
             go.Bar(
@@ -246,15 +313,15 @@ class ChartService:
         fig.update_layout(
             title=f"Unit Economics - LTV/CAC Ratio: {ratio:.1f}x",
             yaxis_title="Value (USD)",
-            font=dict(size=12),
+            font=DEFAULT_FONT,
             height=400,
             showlegend=False
         )
         
-        return fig.to_json()
+        return fig
     
     @staticmethod
-    def create_risk_matrix_heatmap(risks: List[Dict]) -> str:
+    def create_risk_matrix_heatmap(risks: List[Dict]) -> Dict[str, Any]:
         """
         Create 5x5 risk matrix heatmap.
         
@@ -262,44 +329,34 @@ class ChartService:
             risks: List of risk dictionaries with probability and impact
             
         Returns:
-            Plotly chart as JSON string
+            Plotly figure as a JSON-compatible dict
         """
-        # Create 5x5 grid
-        matrix = [[0]*5 for _ in range(5)]
-        risk_labels = [[[] for _ in range(5)] for _ in range(5)]
+        # Bucket every risk into the 5x5 grid in one vectorized pass (1-5 scale, clamped)
+        probs = np.clip(np.array([r.get("probability", 3) for r in risks], dtype=int) - 1, 0, 4)
+        impacts = np.clip(np.array([r.get("impact", 3) for r in risks], dtype=int) - 1, 0, 4)
         
-        for risk in risks:
-            prob = risk.get("probability", 3) - 1  # 0-indexed
-            impact = risk.get("impact", 3) - 1
-            
-            # Ensure within bounds
-            prob = max(0, min(4, prob))
-            impact = max(0, min(4, impact))
-            
-            matrix[prob][impact] += 1
-            risk_labels[prob][impact].append(risk.get("risk", "Unknown")[:30])
+        matrix = np.zeros((5, 5), dtype=int)
+        np.add.at(matrix, (probs, impacts), 1)
         
-        # Create annotations
+        # Annotate occupied cells only, naming up to two of their risks
         annotations = []
-        for i in range(5):
-            for j in range(5):
-                if matrix[i][j] > 0:
-                    label = f"{matrix[i][j]} risk(s)"
-                    if risk_labels[i][j]:
-                        label += f"<br>{'<br>'.join(risk_labels[i][j][:2])}"
-                    
-                    annotations.append(
-                        dict(
-                            x=j,
-                            y=i,
-                            text=label,
-                            showarrow=False,
-                            font=dict(size=8, color='white' if matrix[i][j] > 2 else 'black')
-                        )
-                    )
+        for i, j in np.argwhere(matrix > 0):
+            count = int(matrix[i, j])
+            members = np.flatnonzero((probs == i) & (impacts == j))[:2]
+            names = [risks[k].get("risk", "Unknown")[:30] for k in members]
+            
+            annotations.append(
+                dict(
+                    x=int(j),
+                    y=int(i),
+                    text=f"{count} risk(s)<br>{'<br>'.join(names)}",
+                    showarrow=False,
+                    font=dict(size=8, color='white' if count > 2 else 'black')
+                )
+            )
         
         fig = go.Figure(data=go.Heatmap(
-            z=matrix,
+            z=matrix.tolist(),
             x=['Minimal', 'Low', 'Medium', 'High', 'Critical'],
             y=['Very Low', 'Low', 'Medium', 'High', 'Very High'],
             colorscale='Reds',
@@ -311,9 +368,9 @@ class ChartService:
             xaxis_title="Impact",
             yaxis_title="Probability",
             annotations=annotations,
-            font=dict(size=12),
+            font=DEFAULT_FONT,
             height=500
         )
         
-        return fig.to_json()
+        return _figure_dict(fig)
 
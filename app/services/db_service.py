@@ -1,9 +1,13 @@
 """MongoDB database service for persistent storage."""
 
+import asyncio
+import os
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Coroutine, Dict, List, Optional, Set
 
+import orjson
+from cachetools import TTLCache
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo import ASCENDING, DESCENDING, IndexModel
 from pymongo.errors import DuplicateKeyError, PyMongoError
@@ -12,6 +16,18 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Session reads served from memory: active jobs change every few seconds,
+# finished ones never change again
+ACTIVE_SESSION_TTL = 2
+FINISHED_SESSION_TTL = 60
+FINISHED_STATUSES = frozenset({"completed", "failed"})
+
+# Background progress writes wait this long so back-to-back updates coalesce
+PROGRESS_FLUSH_DELAY = 0.5
+
+# User records rarely change; authenticated requests look them up every time
+USER_CACHE_TTL = 60
+
 
 class DatabaseService:
     """
@@ -21,19 +37,37 @@ class DatabaseService:
     research caching, and agent execution logs.
     """
     
-    def __init__(self, mongodb_uri: str, db_name: str) -> None:
+    def __init__(
+        self,
+        mongodb_uri: str,
+        db_name: str,
+        max_pool_size: int = 50,
+        min_pool_size: int = 10,
+        wait_queue_timeout_ms: int = 2000
+    ) -> None:
         """
         Initialize database service.
         
         Args:
             mongodb_uri: MongoDB connection URI
             db_name: Database name
+            max_pool_size: Maximum sockets in the shared connection pool
+            min_pool_size: Sockets kept open between requests
+            wait_queue_timeout_ms: Maximum wait for a free pooled socket
         """
         self.client: Optional[AsyncIOMotorClient] = None
         self.db: Optional[AsyncIOMotorDatabase] = None
         self.mongodb_uri = mongodb_uri
         self.db_name = db_name
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.wait_queue_timeout_ms = wait_queue_timeout_ms
         self._initialized = False
+        self._active_sessions: TTLCache = TTLCache(maxsize=1024, ttl=ACTIVE_SESSION_TTL)
+        self._finished_sessions: TTLCache = TTLCache(maxsize=64, ttl=FINISHED_SESSION_TTL)
+        self._users: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._pending_progress: Dict[str, int] = {}
     
     async def connect(self) -> None:
         """Establish database connection and create indexes."""
@@ -43,7 +77,10 @@ class DatabaseService:
             self.client = AsyncIOMotorClient(
                 self.mongodb_uri,
                 serverSelectionTimeoutMS=5000,
-                maxPoolSize=50
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                waitQueueTimeoutMS=self.wait_queue_timeout_ms,
+                retryWrites=True
             )
             self.db = self.client[self.db_name]
             
@@ -61,7 +98,10 @@ class DatabaseService:
             raise
     
     async def disconnect(self) -> None:
-        """Close database connection."""
+        """Flush pending background writes and close database connection."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        
         if self.client:
             self.client.close()
             logger.info("mongodb_disconnected")
@@ -115,13 +155,14 @@ class DatabaseService:
             raise RuntimeError("Database not connected")
         
         job_id = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
         
         document = {
             "job_id": job_id,
             "status": "queued",
             "progress": 0,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": now,
+            "updated_at": now,
             "completed_at": None,
             "request": session_data.get("request", {}),
             "result_urls": None,
@@ -144,6 +185,10 @@ class DatabaseService:
         """
         Retrieve an analysis session by job_id.
         
+        Sessions are cached briefly (longer once finished) and the cache is
+        invalidated by this service's own writes, so status polling rarely
+        reaches MongoDB. The returned dict is shared; treat it as read-only.
+        
         Args:
             job_id: Job identifier
             
@@ -153,11 +198,19 @@ class DatabaseService:
         if self.db is None:
             raise RuntimeError("Database not connected")
         
+        session = self._finished_sessions.get(job_id) or self._active_sessions.get(job_id)
+        if session is not None:
+            return session
+        
         try:
             session = await self.db.analysis_sessions.find_one({"job_id": job_id})
             if session:
                 # Remove MongoDB _id field
                 session.pop("_id", None)
+                if session.get("status") in FINISHED_STATUSES:
+                    self._finished_sessions[job_id] = session
+                else:
+                    self._active_sessions[job_id] = session
             return session
         except PyMongoError as e:
             logger.error("get_session_failed", job_id=job_id, error=str(e))
@@ -169,7 +222,8 @@ class DatabaseService:
         status: str,
         progress: int,
         result_urls: Optional[Dict[str, str]] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        errors: Optional[List[str]] = None
     ) -> None:
         """
         Update analysis session status and progress.
@@ -180,6 +234,7 @@ class DatabaseService:
             progress: Progress percentage (0-100)
             result_urls: Optional URLs to generated outputs
             error_message: Optional error message if failed
+            errors: Optional list of individual errors, stored as an array
         """
         if self.db is None:
             raise RuntimeError("Database not connected")
@@ -187,11 +242,12 @@ class DatabaseService:
         update_data: Dict[str, Any] = {
             "status": status,
             "progress": progress,
-            "updated_at": datetime.utcnow(),
+            "updated_at": datetime.now(timezone.utc),
         }
         
-        if status in ["completed", "failed"]:
-            update_data["completed_at"] = datetime.utcnow()
+        if status in FINISHED_STATUSES:
+            update_data["completed_at"] = update_data["updated_at"]
+            self._pending_progress.pop(job_id, None)
         
         if result_urls:
             update_data["result_urls"] = result_urls
@@ -199,11 +255,15 @@ class DatabaseService:
         if error_message:
             update_data["error_message"] = error_message
         
+        if errors:
+            update_data["errors"] = errors
+        
         try:
             await self.db.analysis_sessions.update_one(
                 {"job_id": job_id},
                 {"$set": update_data}
             )
+            self._invalidate_session(job_id)
             logger.info(
                 "session_status_updated",
                 job_id=job_id,
@@ -221,7 +281,7 @@ class DatabaseService:
         output_paths: Dict[str, str]
     ) -> None:
         """
-        Update session with final results.
+        Store final results and mark the session completed in one write.
         
         Args:
             job_id: Job identifier
@@ -231,12 +291,20 @@ class DatabaseService:
         if self.db is None:
             raise RuntimeError("Database not connected")
         
+        self._pending_progress.pop(job_id, None)
+        now = datetime.now(timezone.utc)
         update_data = {
             "synthesis": final_state.get("synthesis", {}),
             "slides": final_state.get("slides", []),
             "output_paths": output_paths,
+            "output_filenames": {
+                fmt: os.path.basename(path) for fmt, path in output_paths.items() if path
+            },
             "metadata": final_state.get("metadata", {}),
-            "updated_at": datetime.utcnow()
+            "status": "completed",
+            "progress": 100,
+            "updated_at": now,
+            "completed_at": now
         }
         
         try:
@@ -244,6 +312,7 @@ class DatabaseService:
                 {"job_id": job_id},
                 {"$set": update_data}
             )
+            self._invalidate_session(job_id)
             logger.info("session_results_updated", job_id=job_id)
         except PyMongoError as e:
             logger.error("update_results_failed", job_id=job_id, error=str(e))
@@ -258,6 +327,9 @@ class DatabaseService:
         """
         Cache research data with TTL.
         
+        The data is stored as a single orjson-encoded binary payload rather
+        than a nested BSON document, which is cheaper to encode and decode.
+        
         Args:
             key: Cache key
             data: Data to cache
@@ -266,19 +338,19 @@ class DatabaseService:
         if self.db is None:
             raise RuntimeError("Database not connected")
         
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        now = datetime.now(timezone.utc)
         
         document = {
             "key": key,
-            "data": data,
-            "created_at": datetime.utcnow(),
-            "expires_at": expires_at,
+            "payload": orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS),
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl),
         }
         
         try:
             await self.db.research_cache.update_one(
                 {"key": key},
-                {"$set": document},
+                {"$set": document, "$unset": {"data": ""}},
                 upsert=True
             )
             logger.debug("research_data_cached", key=key, ttl=ttl)
@@ -300,14 +372,16 @@ class DatabaseService:
             raise RuntimeError("Database not connected")
         
         try:
-            cached = await self.db.research_cache.find_one({
-                "key": key,
-                "expires_at": {"$gt": datetime.utcnow()}
-            })
+            cached = await self.db.research_cache.find_one(
+                {"key": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                {"payload": 1, "data": 1}
+            )
             
             if cached:
                 logger.debug("cache_hit", key=key)
-                return cached.get("data")
+                if "payload" in cached:
+                    return orjson.loads(cached["payload"])
+                return cached.get("data")  # Entries written before binary payloads
             
             logger.debug("cache_miss", key=key)
             return None
@@ -338,7 +412,7 @@ class DatabaseService:
             "agent_name": agent_name,
             "execution_time": execution_time,
             "success": success,
-            "timestamp": datetime.utcnow(),
+            "timestamp": datetime.now(timezone.utc),
             "metadata": metadata,
         }
         
@@ -354,6 +428,91 @@ class DatabaseService:
             logger.error("save_agent_log_failed", agent_name=agent_name, error=str(e))
             # Don't raise - logging failures shouldn't break the workflow
     
+    def save_agent_log_background(
+        self,
+        agent_name: str,
+        execution_time: float,
+        success: bool,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """
+        Schedule an agent execution log write without awaiting it.
+        
+        Keeps the DB round-trip off the agent's critical path. Pending
+        writes are flushed on disconnect.
+        
+        Args:
+            agent_name: Name of the agent
+            execution_time: Execution time in seconds
+            success: Whether execution was successful
+            metadata: Additional metadata (job_id, errors, etc.)
+        """
+        self._run_in_background(
+            self.save_agent_log(agent_name, execution_time, success, metadata)
+        )
+    
+    def update_session_progress_background(self, job_id: str, progress: int) -> None:
+        """
+        Schedule an in-progress status update without awaiting it.
+        
+        The write only applies while the session is still active, so a
+        late-landing update cannot overwrite a completed or failed status.
+        Progress only moves forward. Updates for a job are buffered for
+        PROGRESS_FLUSH_DELAY and only the highest value is written.
+        
+        Args:
+            job_id: Job identifier
+            progress: Progress percentage (0-100)
+        """
+        scheduled = job_id in self._pending_progress
+        self._pending_progress[job_id] = max(progress, self._pending_progress.get(job_id, 0))
+        if not scheduled:
+            self._run_in_background(self._flush_session_progress(job_id))
+    
+    async def _flush_session_progress(self, job_id: str) -> None:
+        """Write the latest buffered progress for a job, if still pending."""
+        await asyncio.sleep(PROGRESS_FLUSH_DELAY)
+        progress = self._pending_progress.pop(job_id, None)
+        if progress is not None:
+            await self._update_active_session_progress(job_id, progress)
+    
+    async def _update_active_session_progress(self, job_id: str, progress: int) -> None:
+        """Raise processing progress unless the session finished or is already further along."""
+        if self.db is None:
+            raise RuntimeError("Database not connected")
+        
+        await self.db.analysis_sessions.update_one(
+            {
+                "job_id": job_id,
+                "status": {"$nin": ["completed", "failed"]},
+                "progress": {"$lt": progress}
+            },
+            {"$set": {
+                "status": "processing",
+                "progress": progress,
+                "updated_at": datetime.now(timezone.utc)
+            }}
+        )
+        self._invalidate_session(job_id)
+        logger.info("session_status_updated", job_id=job_id, status="processing", progress=progress)
+    
+    def _invalidate_session(self, job_id: str) -> None:
+        """Drop a session from the read cache after it was written."""
+        self._active_sessions.pop(job_id, None)
+        self._finished_sessions.pop(job_id, None)
+    
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Schedule a DB write, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+    
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        """Release a finished background task and log any failure."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("background_db_write_failed", error=str(task.exception()))
+    
     async def get_agent_logs(
         self,
         agent_name: Optional[str] = None,
@@ -405,7 +564,7 @@ class DatabaseService:
         
         try:
             result = await self.db.research_cache.delete_many({
-                "expires_at": {"$lt": datetime.utcnow()}
+                "expires_at": {"$lt": datetime.now(timezone.utc)}
             })
             deleted_count = result.deleted_count
             
@@ -444,7 +603,7 @@ class DatabaseService:
         document = {
             "email": email,
             "password_hash": password_hash,
-            "created_at": datetime.utcnow(),
+            "created_at": datetime.now(timezone.utc),
             "last_login": None,
         }
         
@@ -463,6 +622,9 @@ class DatabaseService:
         """
         Retrieve a user by email.
         
+        Found users are cached briefly and invalidated by this service's
+        writes to them. The returned dict is shared; treat it as read-only.
+        
         Args:
             email: User email address
             
@@ -472,11 +634,16 @@ class DatabaseService:
         if self.db is None:
             raise RuntimeError("Database not connected")
         
+        user = self._users.get(email)
+        if user is not None:
+            return user
+        
         try:
             user = await self.db.users.find_one({"email": email})
             if user:
                 # Remove MongoDB _id field
                 user.pop("_id", None)
+                self._users[email] = user
             return user
         except PyMongoError as e:
             logger.error("get_user_failed", email=email, error=str(e))
@@ -495,8 +662,9 @@ class DatabaseService:
         try:
             await self.db.users.update_one(
                 {"email": email},
-                {"$set": {"last_login": datetime.utcnow()}}
+                {"$set": {"last_login": datetime.now(timezone.utc)}}
             )
+            self._users.pop(email, None)
             logger.debug("last_login_updated", email=email)
         except PyMongoError as e:
             logger.error("update_last_login_failed", email=email, error=str(e))
@@ -1,14 +1,20 @@
 """Deck generation service - unified PDF/PPT/JSON output."""
 
+import asyncio
 import os
 import json
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List
 from datetime import datetime
 
 from app.services.pdf_generator import PDFGenerator
 from app.services.ppt_generator import PPTGenerator
 
 
+def _staging_path(path: str) -> str:
+    """Temporary name a file is written under before being published."""
+    return f"{path}.part"
+
+
 class DeckGenerationService:
     """Service for generating all output formats (PDF, PPT, JSON)."""
     
@@ -21,7 +27,6 @@ class DeckGenerationService:
         """
         self.output_dir = output_dir
         self.pdf_gen = PDFGenerator()
-        self.ppt_gen = PPTGenerator()
         
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
@@ -43,27 +48,19 @@ class DeckGenerationService:
             company_name: Company name
             
         Returns:
-            Dictionary with file paths for each format
+            Dictionary with file paths for each format. Each file is written
+            under a temporary name and atomically renamed, so every returned
+            path exists and is complete.
         """
         try:
             # Create base filename
             safe_company = company_name.replace(' ', '_').replace('/', '_')
             base_filename = f"{job_id}_{safe_company}"
             
-            output_paths = {}
-            
-            # Generate PDF
             pdf_path = os.path.join(self.output_dir, f"{base_filename}.pdf")
-            await self.pdf_gen.generate_pdf(slides, pdf_path, company_name)
-            output_paths['pdf'] = pdf_path
-            
-            # Generate PPT
             ppt_path = os.path.join(self.output_dir, f"{base_filename}.pptx")
-            await self.ppt_gen.generate_ppt(slides, ppt_path)
-            output_paths['pptx'] = ppt_path
-            
-            # Generate JSON
             json_path = os.path.join(self.output_dir, f"{base_filename}.json")
+            
             json_data = {
                 "job_id": job_id,
                 "company": company_name,
@@ -72,13 +69,43 @@ class DeckGenerationService:
                 "generated_at": datetime.now().isoformat()
             }
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            # The three formats are independent; render them concurrently
+            # (PDF/PPT rendering already runs in worker threads).
+            # PPTGenerator accumulates slides in its Presentation, so each job gets its own
+            output_paths = {'pdf': pdf_path, 'pptx': ppt_path, 'json': json_path}
+            results = await asyncio.gather(
+                self.pdf_gen.generate_pdf(slides, _staging_path(pdf_path), company_name),
+                PPTGenerator().generate_ppt(slides, _staging_path(ppt_path)),
+                asyncio.to_thread(self._write_json, _staging_path(json_path), json_data),
+                return_exceptions=True
+            )
+            
+            # Every render has finished by now, so no staging file is still being written
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                self._remove_staging_files(output_paths.values())
+                raise errors[0]
             
-            output_paths['json'] = json_path
+            for path in output_paths.values():
+                os.replace(_staging_path(path), path)
             
             return output_paths
             
         except Exception as e:
             print(f"Deck generation failed: {e}")
             raise
+    
+    @staticmethod
+    def _remove_staging_files(paths: Iterable[str]) -> None:
+        """Delete the staging files left behind by a failed generation."""
+        for path in paths:
+            try:
+                os.remove(_staging_path(path))
+            except FileNotFoundError:
+                pass
+    
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]) -> None:
+        """Write the JSON output file (blocking)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
@@ -5,8 +5,7 @@ from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 import httpx
 
-# Real data libraries
-import yfinance as yf
+# Real data libraries (yfinance is imported on first use - it pulls in pandas)
 from newsapi import NewsApiClient
 import wikipediaapi
 
@@ -15,6 +14,12 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _yf_ticker(symbol: str) -> Any:
+    """Create a yfinance Ticker, importing yfinance on first call (run in a worker thread)."""
+    import yfinance as yf
+    return yf.Ticker(symbol)
+
+
 class ExternalDataService:
     """
     Fetches real data from free, open-source APIs:
@@ -24,17 +29,23 @@ class ExternalDataService:
     - Market Data: World Bank API (unlimited, free)
     """
     
-    def __init__(self, newsapi_key: Optional[str] = None):
+    def __init__(
+        self,
+        newsapi_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize external data service.
         
         Args:
             newsapi_key: NewsAPI key (optional, get free at newsapi.org)
+            http_client: Optional shared HTTP client (connection pool)
         """
         self.newsapi_key = newsapi_key
         self.newsapi_client = NewsApiClient(api_key=newsapi_key) if newsapi_key else None
         self.wiki = wikipediaapi.Wikipedia('Stratagem-AI/1.0', 'en')
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
         
         logger.info("external_data_service_initialized", has_newsapi=bool(newsapi_key))
     
@@ -65,10 +76,11 @@ class ExternalDataService:
         
         try:
             # Default date range: last 30 days
+            now = datetime.now()
             if not from_date:
-                from_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+                from_date = (now - timedelta(days=30)).strftime('%Y-%m-%d')
             if not to_date:
-                to_date = datetime.now().strftime('%Y-%m-%d')
+                to_date = now.strftime('%Y-%m-%d')
             
             logger.info("fetching_news", query=query, from_date=from_date, to_date=to_date)
             
@@ -86,17 +98,10 @@ class ExternalDataService:
                 )
             )
             
-            articles = []
-            for article in response.get('articles', [])[:max_results]:
-                articles.append({
-                    'title': article.get('title', ''),
-                    'summary': article.get('description', ''),
-                    'content': article.get('content', ''),
-                    'url': article.get('url', ''),
-                    'published_at': article.get('publishedAt', ''),
-                    'source': article.get('source', {}).get('name', 'Unknown'),
-                    'relevance_score': 0.8  # NewsAPI doesn't provide this
-                })
+            articles = [
+                self._format_newsapi_article(article)
+                for article in response.get('articles', [])[:max_results]
+            ]
             
             logger.info("news_fetched", count=len(articles))
             return articles
@@ -105,6 +110,112 @@ class ExternalDataService:
             logger.error("news_fetch_failed", error=str(e))
             return await self._fetch_news_fallback(query, max_results)
     
+    async def fetch_news_articles_batch(
+        self,
+        queries: List[str],
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        language: str = "en",
+        max_results: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch news for several queries with a single NewsAPI request.
+        
+        The queries are combined with NewsAPI's OR syntax and the articles
+        are split back by which query they mention. Without NewsAPI the
+        fallback feed is queried for each term concurrently.
+        
+        Args:
+            queries: Search queries (e.g. company name and industry)
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
+            language: Language code
+            max_results: Maximum articles per query
+            
+        Returns:
+            List of article lists, aligned with queries
+        """
+        if not queries:
+            return []
+        
+        if not self.newsapi_client:
+            logger.warning("newsapi_not_configured", queries=queries)
+            return await self._fetch_news_fallback_batch(queries, max_results)
+        
+        try:
+            now = datetime.now()
+            if not from_date:
+                from_date = (now - timedelta(days=30)).strftime('%Y-%m-%d')
+            if not to_date:
+                to_date = now.strftime('%Y-%m-%d')
+            
+            combined_query = " OR ".join(f"({query})" for query in queries)
+            logger.info("fetching_news_batch", query=combined_query, from_date=from_date, to_date=to_date)
+            
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(
+                None,
+                lambda: self.newsapi_client.get_everything(
+                    q=combined_query,
+                    from_param=from_date,
+                    to=to_date,
+                    language=language,
+                    sort_by='relevancy',
+                    page_size=min(max_results * len(queries), 100)
+                )
+            )
+            
+            # Assign each article to the first query it mentions; articles that
+            # matched on body text only fill whichever query still has room
+            grouped: List[List[Dict[str, Any]]] = [[] for _ in queries]
+            unmatched = []
+            lowered = [query.lower() for query in queries]
+            for raw in response.get('articles', []):
+                article = self._format_newsapi_article(raw)
+                text = f"{article['title']} {article['summary']}".lower()
+                index = next((i for i, query in enumerate(lowered) if query in text), None)
+                if index is None:
+                    unmatched.append(article)
+                elif len(grouped[index]) < max_results:
+                    grouped[index].append(article)
+            
+            for article in unmatched:
+                index = next((i for i, group in enumerate(grouped) if len(group) < max_results), None)
+                if index is None:
+                    break
+                grouped[index].append(article)
+            
+            logger.info("news_fetched_batch", counts=[len(group) for group in grouped])
+            return grouped
+            
+        except Exception as e:
+            logger.error("news_batch_fetch_failed", error=str(e))
+            return await self._fetch_news_fallback_batch(queries, max_results)
+    
+    @staticmethod
+    def _format_newsapi_article(article: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw NewsAPI article into the service's article format."""
+        return {
+            'title': article.get('title') or '',
+            'summary': article.get('description') or '',
+            'content': article.get('content') or '',
+            'url': article.get('url') or '',
+            'published_at': article.get('publishedAt') or '',
+            'source': (article.get('source') or {}).get('name', 'Unknown'),
+            'relevance_score': 0.8  # NewsAPI doesn't provide this
+        }
+    
+    async def _fetch_news_fallback_batch(
+        self,
+        queries: List[str],
+        max_results: int
+    ) -> List[List[Dict]]:
+        """Fallback for batch queries: fetch each term from Google News concurrently."""
+        results = await asyncio.gather(
+            *(self._fetch_news_fallback(query, max_results) for query in queries)
+        )
+        return [result or [] for result in results]
+    
     async def _fetch_news_fallback(self, query: str, max_results: int) -> List[Dict]:
         """Fallback: Scrape Google News RSS (free, no API key needed)."""
         try:
@@ -152,7 +263,7 @@ class ExternalDataService:
             
             # Run yfinance in executor (it's synchronous)
             loop = asyncio.get_event_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, company_ticker)
+            ticker = await loop.run_in_executor(None, _yf_ticker, company_ticker)
             
             # Get company info
             info = await loop.run_in_executor(None, lambda: ticker.info)
@@ -309,5 +420,6 @@ class ExternalDataService:
         return await asyncio.gather(*tasks, return_exceptions=True)
     
     async def close(self):
-        """Close HTTP client."""
-        await self.http_client.aclose()
+        """Close HTTP client (shared clients are closed by their owner)."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
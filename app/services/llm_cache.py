@@ -0,0 +1,103 @@
+"""Generative response cache - reuse LLM outputs for repeated templated prompts."""
+
+import copy
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+from app.services.db_service import DatabaseService
+from app.utils.cache import cache_key
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LLMCache:
+    """
+    Two-level cache for structured LLM generations.
+
+    Entries are keyed on the template id, system prompt and the exact slot
+    values used to fill the template rather than on the rendered prompt
+    text. Figures are not rounded for the key: generations quote them, so
+    a shared entry would cite another analysis's numbers. Lookups hit an
+    in-process TTL cache first, then the MongoDB research cache (which
+    survives restarts).
+    """
+
+    def __init__(
+        self,
+        db: Optional[DatabaseService] = None,
+        maxsize: int = 1024,
+        ttl: int = 86400
+    ) -> None:
+        """
+        Initialize LLM cache.
+
+        Args:
+            db: Optional database service for the persistent level
+            maxsize: Maximum in-memory entries
+            ttl: Entry time-to-live in seconds
+        """
+        self.db = db
+        self.ttl = ttl
+        self._memory: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def make_key(self, template_id: str, slots: Dict[str, Any], system_prompt: str) -> str:
+        """
+        Build the cache key for a templated generation.
+
+        Args:
+            template_id: Name of the prompt template
+            slots: Values the template is filled with
+            system_prompt: System prompt for the call
+
+        Returns:
+            Cache key string
+        """
+        # v2: v1 keys were built from rounded figures and may hold another analysis's text
+        return f"llm:v2:{template_id}:{cache_key(system_prompt, **slots)}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached generation.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Copy of the cached value, or None on miss
+        """
+        if key in self._memory:
+            return copy.deepcopy(self._memory[key])
+
+        if self.db is None:
+            return None
+
+        try:
+            cached = await self.db.get_cached_data(key)
+        except Exception as e:
+            logger.warning("llm_cache_read_failed", key=key, error=str(e))
+            return None
+
+        if cached is not None:
+            self._memory[key] = cached
+            return copy.deepcopy(cached)
+        return None
+
+    async def update(self, key: str, value: Any) -> None:
+        """
+        Store a generation in both cache levels.
+
+        Args:
+            key: Key from make_key
+            value: Generated output
+        """
+        self._memory[key] = copy.deepcopy(value)
+
+        if self.db is None:
+            return
+
+        try:
+            await self.db.cache_research_data(key, value, ttl=self.ttl)
+        except Exception as e:
+            logger.warning("llm_cache_write_failed", key=key, error=str(e))
@@ -1,18 +1,61 @@
 """LLM service for interacting with Groq API and OpenRouter fallback."""
 
-from typing import Any, Dict, List, Optional
-import json
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import copy
+import re
 import asyncio
 from datetime import datetime
 
+import httpx
+import orjson
 from groq import AsyncGroq, RateLimitError, APIError
 from openai import AsyncOpenAI
 
 from app.services.rate_limiter import RateLimiter
+from app.utils.cache import cache_key, llm_cache
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# OpenAI-compatible JSON mode (supported by Groq and OpenRouter)
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+
+class _StreamedFieldScanner:
+    """
+    Watch a streamed JSON response for completed string fields.
+    
+    Calls back with every watched field whose value is complete so far, as
+    soon as its closing quote arrives (before the rest of the object).
+    """
+    
+    def __init__(self, fields: Sequence[str], on_fields: Callable[[Dict[str, str]], None]):
+        self._patterns = {
+            field: re.compile(rf'"{re.escape(field)}"\s*:\s*"((?:[^"\\]|\\.)*)"')
+            for field in fields
+        }
+        self._on_fields = on_fields
+        self._chunks: List[str] = []
+        self._found: Dict[str, str] = {}
+    
+    def feed(self, delta: str) -> None:
+        """Add a streamed text delta and report newly completed fields."""
+        self._chunks.append(delta)
+        if '"' not in delta or len(self._found) == len(self._patterns):
+            return
+        
+        text = "".join(self._chunks)
+        new = {}
+        for field, pattern in self._patterns.items():
+            if field not in self._found:
+                match = pattern.search(text)
+                if match:
+                    new[field] = orjson.loads(f'"{match.group(1)}"')
+        
+        if new:
+            self._found.update(new)
+            self._on_fields(dict(self._found))
+
 
 class LLMService:
     """
@@ -31,7 +74,10 @@ class LLMService:
         openrouter_site_name: str = "Enterprise Strategy Platform",
         max_retries: int = 5,
         retry_delay: float = 3.0,
-        rate_limit_delay: float = 2.0
+        rate_limit_delay: float = 2.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        fast_model_max_input_tokens: int = 2000,
+        max_concurrency: int = 10
     ) -> None:
         """
         Initialize LLM service with multi-provider and multi-tier model support.
@@ -47,6 +93,9 @@ class LLMService:
             max_retries: Maximum retry attempts
             retry_delay: Initial retry delay (exponential backoff)
             rate_limit_delay: Delay between requests to prevent rate limiting
+            http_client: Optional shared HTTP client (connection pool) for both providers
+            fast_model_max_input_tokens: Input size below which route_model picks the fast model
+            max_concurrency: Maximum LLM requests in flight at once (including retries)
         """
         self.groq_api_key = groq_api_key
         self.openrouter_api_key = openrouter_api_key
@@ -58,11 +107,13 @@ class LLMService:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.rate_limit_delay = rate_limit_delay
+        self.fast_model_max_input_tokens = fast_model_max_input_tokens
         
         # Initialize Groq client with retries disabled (we handle retries ourselves)
         self.groq_client = AsyncGroq(
             api_key=groq_api_key,
-            max_retries=0  # Disable Groq's built-in retry to allow our fallback logic
+            max_retries=0,  # Disable Groq's built-in retry to allow our fallback logic
+            http_client=http_client
         )
         
         # Initialize OpenRouter client if API key provided
@@ -70,12 +121,16 @@ class LLMService:
         if openrouter_api_key:
             self.openrouter_client = AsyncOpenAI(
                 base_url="https://openrouter.ai/api/v1",
-                api_key=openrouter_api_key
+                api_key=openrouter_api_key,
+                http_client=http_client
             )
         
         # Track last request time for rate limiting
         self.last_request_time = None
         
+        # Bound in-flight requests so agent fan-out can't trigger 429 retry storms
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        
         # Track provider health
         self.groq_available = True
         self.openrouter_available = bool(openrouter_api_key)
@@ -131,6 +186,23 @@ class LLMService:
         
         return 0.0
     
+    def route_model(self, input_chars: int) -> str:
+        """
+        Pick a model tier from the size of a call's variable input.
+        
+        Small inputs go to the fast model; larger ones keep the primary model.
+        Tokens are approximated as 4 characters each.
+        
+        Args:
+            input_chars: Length of the variable (non-template) prompt input
+            
+        Returns:
+            Model name to pass as the ``model`` override
+        """
+        if input_chars // 4 < self.fast_model_max_input_tokens:
+            return self.groq_fast_model
+        return self.groq_model
+    
     async def _rate_limit(self) -> None:
         """Apply rate limiting between requests."""
         if self.last_request_time and self.rate_limit_delay > 0:
@@ -144,15 +216,36 @@ class LLMService:
         messages: List[Dict[str, str]],
         temperature: float,
         max_tokens: int,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        json_mode: bool = False,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> str:
-        """Call Groq API."""
+        """Call Groq API (streamed when on_text is given)."""
         target_model = model or self.groq_model
+        
+        if on_text is not None:
+            # JSON mode is not available with streaming; the prompt still asks for JSON
+            stream = await self.groq_client.chat.completions.create(
+                model=target_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            chunks = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    chunks.append(delta)
+                    on_text(delta)
+            return "".join(chunks)
+        
         response = await self.groq_client.chat.completions.create(
             model=target_model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            **({"response_format": JSON_RESPONSE_FORMAT} if json_mode else {})
         )
         return response.choices[0].message.content
     
@@ -160,7 +253,8 @@ class LLMService:
         self,
         messages: List[Dict[str, str]],
         temperature: float,
-        max_tokens: int
+        max_tokens: int,
+        json_mode: bool = False
     ) -> str:
         """Call OpenRouter API."""
         if not self.openrouter_client:
@@ -177,6 +271,7 @@ class LLMService:
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
+            **({"response_format": JSON_RESPONSE_FORMAT} if json_mode else {}),
             extra_headers=extra_headers if extra_headers else None
         )
         return response.choices[0].message.content
@@ -187,7 +282,9 @@ class LLMService:
         system_message: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2048,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        json_mode: bool = False,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Generate text using LLM with automatic fallback and retry logic.
@@ -198,10 +295,29 @@ class LLMService:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             model: Optional model override (uses default groq_model if None)
+            json_mode: Ask the provider to constrain output to a JSON object
+            on_text: Optional callback receiving streamed text deltas (Groq only;
+                the OpenRouter fallback returns the whole response at once)
             
         Returns:
             Generated text
         """
+        async with self._concurrency:
+            return await self._generate_with_retries(
+                prompt, system_message, temperature, max_tokens, model, json_mode, on_text
+            )
+    
+    async def _generate_with_retries(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        model: Optional[str],
+        json_mode: bool,
+        on_text: Optional[Callable[[str], None]]
+    ) -> str:
+        """Rate-limited generation with retries and provider fallback (see generate)."""
         # Apply rate limiting (enforces minimum delay and calls/minute limit)
         # Pass prompt length for token estimation
         await self.rate_limiter.acquire(estimated_prompt_length=len(prompt))
@@ -232,7 +348,10 @@ class LLMService:
             
             # Try Groq first
             try:
-                result = await self._call_groq(messages, temperature, max_tokens, model=model)
+                result = await self._call_groq(
+                    messages, temperature, max_tokens, model=model, json_mode=json_mode,
+                    on_text=on_text
+                )
                 logger.debug(
                     "llm_generation_complete",
                     provider="groq",
@@ -266,7 +385,9 @@ class LLMService:
                     # Try OpenRouter if available
                     if self.openrouter_available:
                         try:
-                            result = await self._call_openrouter(messages, temperature, max_tokens)
+                            result = await self._call_openrouter(
+                                messages, temperature, max_tokens, json_mode=json_mode
+                            )
                             logger.info(
                                 "llm_generation_complete_fallback",
                                 provider="openrouter"
@@ -318,49 +439,83 @@ class LLMService:
         prompt: str,
         system_prompt: str,
         response_schema: Dict[str, Any],
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        watch_fields: Sequence[str] = (),
+        on_fields: Optional[Callable[[Dict[str, str]], None]] = None,
+        validator: Optional[Callable[[Any], Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate structured JSON output from LLM.
         
+        Identical requests (same prompt, system prompt, schema and model)
+        within the LLM cache TTL are served from memory. Object schemas use
+        the provider's JSON mode, so malformed output is rejected by the
+        provider and retried instead of failing in the parser.
+        
+        With watch_fields and on_fields, the response is streamed instead and
+        on_fields is called as soon as watched string fields are
+        complete, letting callers start dependent work before the full
+        response arrives. It may not fire at all (cache hit, fallback provider).
+        
         Args:
             prompt: User prompt
             system_prompt: System prompt describing the task
             response_schema: Expected JSON schema
             model: Optional model override
+            watch_fields: String fields to report early (first occurrence by key)
+            on_fields: Callback receiving the watched fields completed so far
+            validator: Optional precompiled validator; raises on invalid
+                output, which is then not cached
             
         Returns:
             Structured output matching schema
         """
+        key = cache_key(prompt, system_prompt, response_schema, model)
+        cached = llm_cache.get(key)
+        if cached is not None:
+            logger.debug("structured_output_cache_hit")
+            return copy.deepcopy(cached)
+        
         try:
             # Add JSON formatting instruction
             enhanced_system = (
                 f"{system_prompt}\n\n"
                 f"You must respond with valid JSON matching this schema:\n"
-                f"{json.dumps(response_schema, indent=2)}\n\n"
+                f"{orjson.dumps(response_schema, option=orjson.OPT_INDENT_2).decode()}\n\n"
                 f"Respond ONLY with the JSON object, no additional text."
             )
             
+            scanner = None
+            if watch_fields and on_fields is not None:
+                scanner = _StreamedFieldScanner(watch_fields, on_fields)
+            
             response_text = await self.generate(
                 prompt=prompt,
                 system_message=enhanced_system,
                 temperature=0.3,  # Lower temperature for structured output
-                model=model
+                model=model,
+                json_mode=isinstance(response_schema, dict),  # JSON mode only supports objects
+                on_text=scanner.feed if scanner else None
             )
             
             # Parse JSON
             try:
-                result = json.loads(response_text)
-                return result
-            except json.JSONDecodeError:
+                result = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
                 # Try to extract JSON from response
                 start = response_text.find('{')
                 end = response_text.rfind('}') + 1
                 if start != -1 and end > start:
                     json_str = response_text[start:end]
-                    result = json.loads(json_str)
-                    return result
-                raise
+                    result = orjson.loads(json_str)
+                else:
+                    raise
+            
+            if validator is not None:
+                result = validator(result)
+            
+            llm_cache[key] = copy.deepcopy(result)
+            return result
             
         except Exception as e:
             logger.error("structured_generation_failed", error=str(e))
@@ -14,6 +14,7 @@ from reportlab.platypus import (
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
+import asyncio
 from io import BytesIO
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -816,6 +817,28 @@ class PDFGenerator:
         """
         Generate consulting-style PDF from slides.
         
+        Layout and chart rendering are CPU-bound, so they run in a worker
+        thread to keep the event loop responsive.
+        
+        Args:
+            slides: List of slide dictionaries
+            output_path: Path to save PDF
+            company_name: Company name for footer
+            
+        Returns:
+            Path to generated PDF
+        """
+        return await asyncio.to_thread(self.render_pdf, slides, output_path, company_name)
+    
+    def render_pdf(
+        self,
+        slides: List[Dict[str, Any]],
+        output_path: str,
+        company_name: str
+    ) -> str:
+        """
+        Render consulting-style PDF from slides (blocking).
+        
         Args:
             slides: List of slide dictionaries
             output_path: Path to save PDF
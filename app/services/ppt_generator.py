@@ -9,6 +9,7 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+import asyncio
 from typing import List, Dict, Any, Optional
 import plotly.graph_objects as go
 from io import BytesIO
@@ -65,7 +66,20 @@ class PPTGenerator:
         subtitle: Optional[str] = None,
         company_name: Optional[str] = None
     ) -> str:
-        """Generate PowerPoint presentation with professional design."""
+        """Generate PowerPoint presentation with professional design (rendered in a worker thread)."""
+        return await asyncio.to_thread(
+            self.render_ppt, slides, output_path, title, subtitle, company_name
+        )
+    
+    def render_ppt(
+        self,
+        slides: List[Dict[str, Any]],
+        output_path: str,
+        title: Optional[str] = None,
+        subtitle: Optional[str] = None,
+        company_name: Optional[str] = None
+    ) -> str:
+        """Render PowerPoint presentation into this generator's deck (blocking)."""
         try:
             # Add cover slide if title provided
             if title:
@@ -1,6 +1,7 @@
 """RAG (Retrieval-Augmented Generation) service using Pinecone and Sentence Transformers."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Lazy imports to avoid dependency errors when RAG is disabled
@@ -80,8 +81,8 @@ class RAGService:
             # Get index
             self.index = self.pc.Index(self.index_name)
             
-            # Verify connection
-            stats = self.index.describe_index_stats()
+            # Verify connection (blocking HTTP call; keep the loop free)
+            stats = await asyncio.to_thread(self.index.describe_index_stats)
             logger.info(
                 "pinecone_connected",
                 total_vectors=stats.get('total_vector_count', 0)
@@ -106,6 +107,31 @@ class RAGService:
         embedding = self.embedding_model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
     
+    def embed(self, text: str) -> List[float]:
+        """
+        Embed a query string (CPU-bound; run off the event loop when hot).
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Embedding vector
+        """
+        return self._generate_embedding(text)
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts in one batched model forward pass.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            One embedding vector per text
+        """
+        embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
+        return embeddings.tolist()
+    
     def chunk_document(
         self,
         text: str,
@@ -253,23 +279,7 @@ class RAGService:
             query_embedding = self._generate_embedding(query)
             
             # Search Pinecone
-            results = self.index.query(
-                vector=query_embedding,
-                top_k=top_k,
-                namespace=namespace,
-                filter=filters,
-                include_metadata=True
-            )
-            
-            # Format results
-            formatted_results = []
-            for match in results.get('matches', []):
-                formatted_results.append({
-                    'id': match['id'],
-                    'score': match['score'],
-                    'metadata': match.get('metadata', {}),
-                    'text': match.get('metadata', {}).get('text', '')
-                })
+            formatted_results = self._query_index(query_embedding, namespace, top_k, filters)
             
             logger.debug(
                 "semantic_search_complete",
@@ -283,6 +293,110 @@ class RAGService:
             logger.error("semantic_search_failed", error=str(e))
             raise
     
+    async def multi_namespace_search(
+        self,
+        queries: List[Tuple[str, str, int]],
+        embeddings: Optional[List[List[float]]] = None
+    ) -> List[Any]:
+        """
+        Run several searches with one batched embedding pass.
+        
+        All query strings are embedded together, then the per-namespace index
+        queries run concurrently off the event loop.
+        
+        Args:
+            queries: List of (query, namespace, top_k) triples
+            embeddings: Optional precomputed query vectors (skips embedding)
+            
+        Returns:
+            One result list per query, in order (exceptions returned as-is)
+        """
+        if not self._initialized:
+            raise RuntimeError("RAG service not connected. Call connect() first.")
+        
+        if embeddings is None:
+            embeddings = await asyncio.to_thread(
+                self.embed_batch, [query for query, _, _ in queries]
+            )
+        
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._query_index, embedding, namespace, top_k)
+                for embedding, (_, namespace, top_k) in zip(embeddings, queries)
+            ),
+            return_exceptions=True
+        )
+        
+        logger.debug("multi_namespace_search_complete", query_count=len(queries))
+        return results
+    
+    def _query_index(
+        self,
+        vector: List[float],
+        namespace: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query Pinecone with a precomputed vector and format the matches."""
+        results = self.index.query(
+            vector=vector,
+            top_k=top_k,
+            namespace=namespace,
+            filter=filters,
+            include_metadata=True
+        )
+        
+        formatted_results = []
+        for match in results.get('matches', []):
+            formatted_results.append({
+                'id': match['id'],
+                'namespace': namespace,
+                'score': match['score'],
+                'metadata': match.get('metadata', {}),
+                'text': match.get('metadata', {}).get('text', '')
+            })
+        
+        return formatted_results
+    
+    async def fetch_documents(self, refs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Load documents by ID, e.g. to re-hydrate references stored in a cache.
+        
+        Args:
+            refs: Dicts with 'id', 'namespace' and optionally the original 'score'
+            
+        Returns:
+            Documents in the order of refs (IDs no longer in the index are skipped)
+        """
+        if not self._initialized:
+            raise RuntimeError("RAG service not connected. Call connect() first.")
+        
+        ids_by_namespace: Dict[str, List[str]] = {}
+        for ref in refs:
+            ids_by_namespace.setdefault(ref.get('namespace', ''), []).append(ref['id'])
+        
+        responses = await asyncio.gather(*(
+            asyncio.to_thread(self.index.fetch, ids=ids, namespace=namespace)
+            for namespace, ids in ids_by_namespace.items()
+        ))
+        
+        found = {}
+        for namespace, response in zip(ids_by_namespace, responses):
+            for vector_id, vector in response.vectors.items():
+                metadata = vector.metadata or {}
+                found[(namespace, vector_id)] = {
+                    'id': vector_id,
+                    'namespace': namespace,
+                    'metadata': metadata,
+                    'text': metadata.get('text', '')
+                }
+        
+        return [
+            {**found[key], 'score': ref.get('score', 0.0)}
+            for ref in refs
+            if (key := (ref.get('namespace', ''), ref['id'])) in found
+        ]
+    
     async def hybrid_search(
         self,
         query: str,
@@ -36,6 +36,7 @@ class RateLimiter:
         self.min_delay_seconds = min_delay_seconds
         self.calls = deque()  # (timestamp, estimated_tokens)
         self.last_call_time: Optional[datetime] = None
+        self._lock = asyncio.Lock()  # Serializes concurrent callers
         
         logger.info(
             "rate_limiter_initialized",
@@ -66,11 +67,17 @@ class RateLimiter:
         """
         Acquire permission to make an API call.
         
-        Waits if necessary to respect both RPM and TPM limits.
+        Waits if necessary to respect both RPM and TPM limits. Concurrent
+        callers are queued so each one sees the previous call's timestamp.
         
         Args:
             estimated_prompt_length: Estimated length of prompt in characters
         """
+        async with self._lock:
+            await self._acquire(estimated_prompt_length)
+    
+    async def _acquire(self, estimated_prompt_length: int) -> None:
+        """Wait for RPM/TPM capacity and record the call (caller holds the lock)."""
         now = datetime.now()
         estimated_tokens = self._estimate_tokens(estimated_prompt_length)
         
@@ -4,12 +4,17 @@ import asyncio
 from typing import Dict, Optional, List
 from datetime import datetime
 
+from app.utils.cache import async_cached_method, regulatory_cache
+
 
 class RegulatoryDataService:
     """
     Fetch regulatory data from various sources.
     Currently simulated - replace with real APIs in production.
     
+    Lookups are cached for 24 hours since policy data changes on
+    month-long timescales.
+    
     Real sources to integrate:
     - World Bank Governance Indicators
     - UNCTAD FDI Database
@@ -18,10 +23,16 @@ class RegulatoryDataService:
     - Government regulatory portals
     """
     
-    def __init__(self):
-        """Initialize regulatory data service."""
-        pass
+    def __init__(self, max_concurrent_requests: int = 16):
+        """
+        Initialize regulatory data service.
+        
+        Args:
+            max_concurrent_requests: Cap on in-flight source requests
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
     
+    @async_cached_method(regulatory_cache)
     async def get_fdi_policy(self, country: str, sector: str) -> Dict:
         """
         Fetch FDI (Foreign Direct Investment) policy.
@@ -33,7 +44,8 @@ class RegulatoryDataService:
         Returns:
             FDI policy details
         """
-        await asyncio.sleep(0.2)  # Simulate API call
+        async with self._semaphore:
+            await asyncio.sleep(0.2)  # Simulate API call
         
         # Simulated FDI policies by country
         fdi_policies = {
@@ -95,6 +107,7 @@ class RegulatoryDataService:
             "last_updated": datetime.now().strftime("%Y-%m-%d")
         }
     
+    @async_cached_method(regulatory_cache)
     async def get_tax_rates(self, country: str) -> Dict:
         """
         Fetch corporate tax information.
@@ -105,7 +118,8 @@ class RegulatoryDataService:
         Returns:
             Tax rates and treaty information
         """
-        await asyncio.sleep(0.2)
+        async with self._semaphore:
+            await asyncio.sleep(0.2)
         
         tax_data = {
             "Saudi Arabia": {
@@ -145,6 +159,7 @@ class RegulatoryDataService:
             "source": "KPMG Global Tax Database (Simulated)"
         }
     
+    @async_cached_method(regulatory_cache)
     async def get_political_risk_score(self, country: str) -> Dict:
         """
         Get political risk and stability metrics.
@@ -155,7 +170,8 @@ class RegulatoryDataService:
         Returns:
             Political risk scores
         """
-        await asyncio.sleep(0.2)
+        async with self._semaphore:
+            await asyncio.sleep(0.2)
         
         risk_scores = {
             "Saudi Arabia": {
@@ -199,6 +215,7 @@ class RegulatoryDataService:
             "source": "World Bank Governance Indicators (Simulated)"
         }
     
+    @async_cached_method(regulatory_cache)
     async def get_trade_data(
         self,
         export_country: str,
@@ -216,7 +233,8 @@ class RegulatoryDataService:
         Returns:
             Trade data including tariffs
         """
-        await asyncio.sleep(0.2)
+        async with self._semaphore:
+            await asyncio.sleep(0.2)
         
         # Check for trade agreements
         trade_agreements = {
@@ -249,6 +267,7 @@ class RegulatoryDataService:
                 "source": "WTO Tariff Database (Simulated)"
             }
     
+    @async_cached_method(regulatory_cache)
     async def get_labor_laws(self, country: str) -> Dict:
         """
         Fetch labor regulation summary.
@@ -259,7 +278,8 @@ class RegulatoryDataService:
         Returns:
             Labor law details
         """
-        await asyncio.sleep(0.2)
+        async with self._semaphore:
+            await asyncio.sleep(0.2)
         
         labor_data = {
             "Saudi Arabia": {
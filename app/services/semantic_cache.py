@@ -0,0 +1,101 @@
+"""Semantic cache - reuse results for paraphrased questions via embedding similarity."""
+
+import copy
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from cachetools import TTLCache
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """
+    In-process semantic cache keyed by embedding similarity.
+
+    Entries are namespaced by a scope (e.g. company + industry) so only
+    questions about the same subject are compared. Within a scope, a query
+    vector hits when its cosine similarity to a stored vector reaches the
+    threshold. Scopes hold few entries, so an exact vectorized scan is used
+    instead of an ANN index.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: int = 86400,
+        max_scopes: int = 1024,
+        max_entries_per_scope: int = 64
+    ) -> None:
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            ttl: Entry time-to-live in seconds
+            max_scopes: Maximum number of scopes kept
+            max_entries_per_scope: Maximum entries per scope (oldest evicted)
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries_per_scope = max_entries_per_scope
+        # scope -> list of (unit vector, payload, expires_at)
+        self._scopes: TTLCache = TTLCache(maxsize=max_scopes, ttl=ttl)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        """Convert to a unit-length float32 array."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _live_entries(self, scope: Tuple) -> List[Tuple[np.ndarray, Any, float]]:
+        """Return unexpired entries for a scope, dropping expired ones."""
+        now = time.time()
+        entries = [entry for entry in self._scopes.get(scope, []) if entry[2] > now]
+        if entries:
+            self._scopes[scope] = entries
+        else:
+            self._scopes.pop(scope, None)
+        return entries
+
+    def check(self, vector: Sequence[float], scope: Tuple) -> Optional[Dict[str, Any]]:
+        """
+        Look up a payload for a semantically similar query.
+
+        Args:
+            vector: Query embedding
+            scope: Namespace tuple (e.g. (company, industry))
+
+        Returns:
+            Copy of the cached payload on hit, None on miss
+        """
+        entries = self._live_entries(scope)
+        if not entries:
+            return None
+
+        query = self._normalize(vector)
+        similarities = np.stack([entry[0] for entry in entries]) @ query
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= self.threshold:
+            logger.info("semantic_cache_hit", similarity=round(float(similarities[best]), 4))
+            return copy.deepcopy(entries[best][1])
+
+        return None
+
+    def store(self, vector: Sequence[float], payload: Dict[str, Any], scope: Tuple) -> None:
+        """
+        Store a payload under a query embedding.
+
+        Args:
+            vector: Query embedding
+            payload: Result to cache
+            scope: Namespace tuple (e.g. (company, industry))
+        """
+        entries = self._live_entries(scope)
+        entries.append((self._normalize(vector), copy.deepcopy(payload), time.time() + self.ttl))
+        self._scopes[scope] = entries[-self.max_entries_per_scope:]
@@ -141,7 +141,7 @@ class SlideBuilder:
         tam: float,
         sam: float,
         som: float,
-        chart_json: str
+        chart_json: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create market sizing slide with action-oriented insights."""
         # Calculate key ratios
@@ -174,7 +174,7 @@ class SlideBuilder:
     @staticmethod
     def create_scenario_slide(
         scenarios: Dict[str, List[float]],
-        chart_json: str
+        chart_json: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create scenario analysis slide with probabilistic framing."""
         base = scenarios.get('base', [])
@@ -215,7 +215,7 @@ class SlideBuilder:
     @staticmethod
     def create_risk_matrix_slide(
         risk_matrix: Dict[str, Any],
-        chart_json: Optional[str] = None
+        chart_json: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Create risk matrix slide with mitigation focus."""
         risks = risk_matrix.get('risks', [])
@@ -241,7 +241,7 @@ class SlideBuilder:
             "type": "chart",
             "title": f"Risk Assessment: {risk_matrix.get('risk_level', 'MODERATE').upper()} Overall Risk Level",
             "content": content,
-            "chart_data": json.loads(chart_json) if chart_json and isinstance(chart_json, str) else None,
+            "chart_data": json.loads(chart_json) if chart_json and isinstance(chart_json, str) else chart_json or None,
             "speaker_notes": "Comprehensive risk analysis using probability-impact matrix. All high-risk items have documented mitigation strategies. Risk monitoring dashboard recommended for ongoing tracking."
         }
     
@@ -288,7 +288,7 @@ class SlideBuilder:
         market_analysis: Dict[str, Any],
         financial_model: Dict[str, Any],
         regulatory: Dict[str, Any],
-        charts: Dict[str, str],
+        charts: Dict[str, Dict[str, Any]],
         implementation: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
@@ -339,7 +339,7 @@ class SlideBuilder:
         sam = market_analysis.get('SAM', {}).get('value_usd_millions', 0)
         som = market_analysis.get('SOM', {}).get('year_5_usd_millions', 0)
         
-        slides.append(SlideBuilder.create_market_sizing_slide(tam, sam, som, charts.get('market_sizing', '{}')))
+        slides.append(SlideBuilder.create_market_sizing_slide(tam, sam, som, charts.get('market_sizing', {})))
         
         # Slide 5: Competitive Position (Complication)
         comp_pos = financial_model.get('competitive_position', {})
@@ -415,7 +415,7 @@ class SlideBuilder:
         # Slide 8: Scenarios
         scenarios = financial_model.get('scenarios', {})
         if scenarios:
-            slides.append(SlideBuilder.create_scenario_slide(scenarios, charts.get('revenue_scenarios', '{}')))
+            slides.append(SlideBuilder.create_scenario_slide(scenarios, charts.get('revenue_scenarios', {})))
         
         # Slide 9: Regulatory Assessment
         slides.append({
@@ -540,7 +540,7 @@ class SlideBuilder:
         tam: float,
         sam: float,
         som: float,
-        chart_json: str
+        chart_json: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create market sizing slide with funnel chart."""
         content = [
@@ -565,7 +565,7 @@ class SlideBuilder:
     @staticmethod
     def create_scenario_slide(
         scenarios: Dict[str, List[float]],
-        chart_json: str
+        chart_json: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create scenario analysis slide."""
         base = scenarios.get('base', [])
@@ -597,7 +597,7 @@ class SlideBuilder:
     @staticmethod
     def create_risk_matrix_slide(
         risk_matrix: Dict[str, Any],
-        chart_json: Optional[str] = None
+        chart_json: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Create risk matrix slide."""
         risks = risk_matrix.get('risks', [])
@@ -621,7 +621,7 @@ class SlideBuilder:
             "type": "chart",
             "title": "Risk Assessment Matrix",
             "content": content,
-            "chart_data": json.loads(chart_json) if chart_json and isinstance(chart_json, str) else None,
+            "chart_data": json.loads(chart_json) if chart_json and isinstance(chart_json, str) else chart_json or None,
             "speaker_notes": "Comprehensive risk analysis using probability-impact matrix. Mitigation strategies identified for all high-risk items."
         }
     
@@ -662,7 +662,7 @@ class SlideBuilder:
         market_analysis: Dict[str, Any],
         financial_model: Dict[str, Any],
         regulatory: Dict[str, Any],
-        charts: Dict[str, str],
+        charts: Dict[str, Dict[str, Any]],
         implementation: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
@@ -674,7 +674,7 @@ class SlideBuilder:
             market_analysis: Market analysis from analyst
             financial_model: Financial model from analyst
             regulatory: Regulatory findings
-            charts: Chart JSON strings
+            charts: Plotly figure dicts by chart name
             implementation: Implementation roadmap
             
         Returns:
@@ -716,7 +716,7 @@ class SlideBuilder:
         
         slides.append(SlideBuilder.create_market_sizing_slide(
             tam, sam, som,
-            charts.get('market_sizing', '{}')
+            charts.get('market_sizing', {})
         ))
         
         # Slide 5: Competitive Position
@@ -778,7 +778,7 @@ class SlideBuilder:
         if scenarios:
             slides.append(SlideBuilder.create_scenario_slide(
                 scenarios,
-                charts.get('revenue_scenarios', '{}')
+                charts.get('revenue_scenarios', {})
             ))
         
         # Slide 9: Regulatory Assessment
@@ -1,20 +1,73 @@
 """Caching utilities for Stratagem AI - Enhanced with TTL support."""
 
+import asyncio
+import copy
+import functools
 import hashlib
 import json
+from typing import Any, Awaitable, Callable, Dict
+
 from cachetools import TTLCache
 
 
 # Global caches with TTL
 llm_cache = TTLCache(maxsize=1000, ttl=3600)  # 1 hour
 rag_cache = TTLCache(maxsize=500, ttl=7200)   # 2 hours
-research_cache = TTLCache(maxsize=100, ttl=86400)  # 24 hours
+research_cache = TTLCache(maxsize=1024, ttl=86400)  # 24 hours (per company/industry lookups)
+regulatory_cache = TTLCache(maxsize=512, ttl=86400)  # 24 hours (policy data changes slowly)
+
+
+# Distinguishes a cache miss from a cached None
+_MISSING = object()
 
 
 def cache_key(*args, **kwargs) -> str:
-    """Generate cache key from arguments."""
+    """Generate cache key from arguments (128-bit BLAKE2b digest)."""
     key_data = json.dumps({"args": str(args), "kwargs": kwargs}, sort_keys=True, default=str)
-    return hashlib.md5(key_data.encode()).hexdigest()
+    return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+
+
+def async_cached_method(cache: TTLCache) -> Callable:
+    """
+    Cache the result of an async instance method in a TTL cache.
+    
+    The key is built from the method name and its arguments (``self`` is
+    excluded, so all instances share entries). Concurrent misses on the same
+    key are serialized by a per-key lock so the underlying call runs once.
+    Hits return a deep copy so callers can mutate results freely.
+    
+    Args:
+        cache: TTLCache instance to store results in
+        
+    Returns:
+        Method decorator
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        locks: Dict[str, asyncio.Lock] = {}
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = cache_key(func.__qualname__, *args, **kwargs)
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return copy.deepcopy(result)
+            
+            lock = locks.setdefault(key, asyncio.Lock())
+            try:
+                async with lock:
+                    result = cache.get(key, _MISSING)
+                    if result is _MISSING:
+                        result = await func(self, *args, **kwargs)
+                        cache[key] = result
+            finally:
+                # A later caller may already have installed a fresh lock
+                if locks.get(key) is lock:
+                    del locks[key]
+            return copy.deepcopy(result)
+        
+        return wrapper
+    
+    return decorator
 
 
 def get_all_cache_stats() -> dict:
@@ -22,5 +75,6 @@ def get_all_cache_stats() -> dict:
     return {
         "llm_cache": {"size": len(llm_cache), "maxsize": llm_cache.maxsize},
         "rag_cache": {"size": len(rag_cache), "maxsize": rag_cache.maxsize},
-        "research_cache": {"size": len(research_cache), "maxsize": research_cache.maxsize}
+        "research_cache": {"size": len(research_cache), "maxsize": research_cache.maxsize},
+        "regulatory_cache": {"size": len(regulatory_cache), "maxsize": regulatory_cache.maxsize}
     }
@@ -1,8 +1,11 @@
 """Document processing utilities for RAG system."""
 
-from typing import Any, Dict, List
+import string
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+import orjson
+
 from app.models.schemas import Citation
 
 
@@ -180,6 +183,159 @@ def truncate_text(text: str, max_length: int = 500) -> str:
     return text[:max_length-3] + "..."
 
 
+def to_prompt_json(obj: Any, limit: Optional[int] = None) -> str:
+    """
+    Serialize an object compactly for inclusion in an LLM prompt.
+    
+    Uses orjson (no indentation - the LLM doesn't need pretty-printing).
+    Non-string keys and unknown types are stringified rather than raising.
+    
+    Args:
+        obj: Object to serialize
+        limit: Optional maximum length in characters
+        
+    Returns:
+        JSON string, capped at limit characters if given
+    """
+    text = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return text[:limit] if limit is not None else text
+
+
+def prune_for_prompt(
+    data: Dict[str, Any],
+    budget_chars: int,
+    priority: Sequence[str] = ()
+) -> Dict[str, Any]:
+    """
+    Keep whole top-level fields of a dict, most important first, within a size budget.
+    
+    Unlike slicing serialized JSON, the pruned dict always serializes to
+    valid JSON. Fields listed in priority are considered first (in order),
+    then the remaining fields in their original order; any field that
+    doesn't fit in the remaining budget is dropped (nested dicts are pruned
+    recursively into the remaining budget instead).
+    
+    Args:
+        data: Dictionary to prune
+        budget_chars: Maximum serialized length (as produced by to_prompt_json)
+        priority: Keys to keep first, most important first
+        
+    Returns:
+        Pruned dictionary
+    """
+    ordered = [k for k in priority if k in data]
+    ordered += [k for k in data if k not in ordered]
+    
+    pruned: Dict[str, Any] = {}
+    used = 2  # Enclosing braces
+    for key in ordered:
+        value = data[key]
+        # '{"key":value}' minus the braces, plus a separating comma
+        overhead = (1 if pruned else 0) - 2
+        item_chars = len(to_prompt_json({key: value})) + overhead
+        
+        if used + item_chars > budget_chars and isinstance(value, dict):
+            # Nested dicts are pruned into whatever budget is left
+            key_chars = len(to_prompt_json({key: {}})) + overhead - 2
+            value = prune_for_prompt(value, budget_chars - used - key_chars)
+            item_chars = len(to_prompt_json({key: value})) + overhead
+            if not value:
+                continue
+        
+        if used + item_chars <= budget_chars:
+            pruned[key] = value
+            used += item_chars
+    
+    return pruned
+
+
+def to_prompt_snippet(obj: Any, max_chars: int = 500) -> str:
+    """
+    Serialize an object compactly within a size budget, truncating structurally.
+    
+    Unlike slicing the serialized text, the result is always valid JSON:
+    lists keep whole leading items, dicts keep whole fields (see
+    prune_for_prompt) and only an item that is cut off is shortened in turn.
+    
+    Args:
+        obj: Object to serialize
+        max_chars: Maximum serialized length
+        
+    Returns:
+        JSON string of at most max_chars characters
+    """
+    text = to_prompt_json(obj)
+    if len(text) <= max_chars:
+        return text
+    return to_prompt_json(_fit_for_prompt(obj, max_chars))
+
+
+def _fit_for_prompt(obj: Any, budget_chars: int) -> Any:
+    """Shrink an object so its compact JSON fits in budget_chars."""
+    if isinstance(obj, dict):
+        return prune_for_prompt(obj, budget_chars)
+    
+    if isinstance(obj, (list, tuple)):
+        kept: List[Any] = []
+        used = 2  # Enclosing brackets
+        for item in obj:
+            separator = 1 if kept else 0
+            item_chars = len(to_prompt_json(item)) + separator
+            if used + item_chars > budget_chars:
+                # Shrink the first item that doesn't fit, then stop
+                remaining = budget_chars - used - separator
+                if isinstance(item, (dict, list, tuple, str)) and remaining > 2:
+                    partial = _fit_for_prompt(item, remaining)
+                    if partial:
+                        kept.append(partial)
+                break
+            kept.append(item)
+            used += item_chars
+        return kept
+    
+    if isinstance(obj, str):
+        cut = max(budget_chars - 2, 0)  # Enclosing quotes
+        while cut and len(to_prompt_json(obj[:cut])) > budget_chars:
+            cut -= len(to_prompt_json(obj[:cut])) - budget_chars  # Escapes take extra chars
+        return obj[:max(cut, 0)]
+    
+    return obj
+
+
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a ``str.format`` prompt template into a render function.
+    
+    The template is split into literal and field parts once, so rendering is
+    a single join instead of re-parsing the brace syntax on every call.
+    Templates using positional fields, conversions or format specs fall
+    back to ``template.format``.
+    
+    Args:
+        template: Prompt template with ``{name}`` fields and ``{{``/``}}`` escapes
+        
+    Returns:
+        Function taking the fields as keyword arguments and returning the prompt
+    """
+    parts: List[Tuple[bool, str]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append((True, literal))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return template.format
+        parts.append((False, field))
+    
+    def render(**fields: Any) -> str:
+        return "".join(
+            part if is_literal else str(fields[part])
+            for is_literal, part in parts
+        )
+    
+    return render
+
+
 def validate_research_data(data: Dict) -> tuple[bool, List[str]]:
     """
     Validates research data completeness and quality.
@@ -59,37 +59,69 @@ class StratagemOrchestrator:
         # Use AgentState type for proper state management
         workflow = StateGraph(AgentState)
         
-        # Add nodes for each agent
+        # Add nodes for each agent (analyst and regulatory share one node)
         workflow.add_node("research", self.research.execute)
-        workflow.add_node("analyst", self.analyst.execute)
-        workflow.add_node("regulatory", self.regulatory.execute)
+        workflow.add_node("analysis", self._run_analysis_branches)
         workflow.add_node("synthesizer", self.synthesizer.execute)
         
         # Define workflow edges
         # Start with research
         workflow.set_entry_point("research")
         
-        # After research, go to analyst
-        workflow.add_edge("research", "analyst")
+        # After research, run analyst and regulatory together
+        workflow.add_edge("research", "analysis")
         
-        # After analyst, go to regulatory
-        workflow.add_edge("analyst", "regulatory")
-        
-        # After regulatory, go to synthesizer
-        workflow.add_edge("regulatory", "synthesizer")
+        # Then synthesize
+        workflow.add_edge("analysis", "synthesizer")
         
         # End after synthesis
         workflow.add_edge("synthesizer", END)
         
         return workflow.compile()
     
+    async def _run_analysis_branches(self, state: AgentState) -> AgentState:
+        """
+        Run the analyst and regulatory agents concurrently.
+        
+        Both only read the request and research data, so each runs on its
+        own copy of the mutable state parts and the results are merged.
+        
+        Args:
+            state: State after research
+            
+        Returns:
+            State with market, financial and regulatory results
+        """
+        errors = state.get("errors", [])
+        analyst_state, regulatory_state = await asyncio.gather(
+            self.analyst.execute(self._branch_state(state)),
+            self.regulatory.execute(self._branch_state(state))
+        )
+        
+        state["market_analysis"] = analyst_state.get("market_analysis", {})
+        state["financial_model"] = analyst_state.get("financial_model", {})
+        state["regulatory_findings"] = regulatory_state.get("regulatory_findings", {})
+        state["metadata"] = {**analyst_state["metadata"], **regulatory_state["metadata"]}
+        state["errors"] = (
+            errors
+            + analyst_state.get("errors", [])[len(errors):]
+            + regulatory_state.get("errors", [])[len(errors):]
+        )
+        return state
+    
+    @staticmethod
+    def _branch_state(state: AgentState) -> AgentState:
+        """Copy of the state whose metadata and errors a branch can mutate freely."""
+        return {
+            **state,
+            "metadata": dict(state["metadata"]),
+            "errors": list(state.get("errors", []))
+        }
+    
     async def execute(self, initial_state: AgentState) -> AgentState:
         """
         Execute complete workflow.
         
-        Note: Analyst and Regulatory run sequentially in this version.
-        For true parallel execution, we'd need to restructure the state handling.
-        
         Args:
             initial_state: Initial state with request
             
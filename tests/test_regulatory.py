@@ -0,0 +1,32 @@
+"""Tests for the regulatory agent's target-country extraction."""
+
+import pytest
+
+from app.agents.regulatory import RegulatoryAgent
+
+
+@pytest.fixture
+def agent() -> RegulatoryAgent:
+    # Country extraction uses no services
+    return RegulatoryAgent.__new__(RegulatoryAgent)
+
+
+@pytest.mark.parametrize(
+    ("question", "expected"),
+    [
+        ("Should Zomato (India) enter Saudi Arabia?", "Saudi Arabia"),
+        ("Should a food delivery company from India expand to UAE?", "UAE"),
+        ("Can an India-based fintech launch in Singapore?", "Singapore"),
+        ("Should we move from the United Kingdom into the USA?", "USA"),
+        ("Should Swiggy expand to Dubai?", "UAE"),
+        ("Should we grow in India?", "India"),
+        ("Should we enter the Saudi market?", "Saudi Arabia"),
+        ("Should we enter a new market?", "Saudi Arabia"),
+    ],
+)
+def test_extract_target_country(agent: RegulatoryAgent, question: str, expected: str) -> None:
+    assert agent._extract_target_country(question) == expected
+
+
+def test_keywords_match_whole_words_only(agent: RegulatoryAgent) -> None:
+    assert agent._extract_target_country("Should Duke Energy expand to Singapore?") == "Singapore"